@@ -0,0 +1 @@
+"""Benchmark the Gitcoin API client."""
@@ -0,0 +1,43 @@
+"""Provide datasets and mock servers for the benchmarks.
+
+Dataset sizes are taken from the comma separated GITCOIN_BENCH_SIZES
+environment variable, e.g. GITCOIN_BENCH_SIZES=1000,100000,500000.
+"""
+
+import os
+
+import pytest
+from benchmarks.data import make_bounties
+from gitcoin import Gitcoin
+from tests.server import StubServer
+
+pytest.importorskip('pytest_benchmark')
+
+SIZES = [int(size) for size in os.environ.get('GITCOIN_BENCH_SIZES', '1000,10000').split(',')]
+
+_datasets = {}
+
+
+def dataset(size):
+    """Create each synthetic dataset only once per session."""
+    if size not in _datasets:
+        _datasets[size] = make_bounties(size)
+    return _datasets[size]
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: '{size}'.format(size=size))
+def bounties(request):
+    return dataset(request.param)
+
+
+@pytest.fixture
+def server(bounties):
+    with StubServer(bounties, cache_bodies=True) as mock_server:
+        yield mock_server
+
+
+@pytest.fixture
+def api(server):
+    with Gitcoin(pool_maxsize=16) as gitcoin_api:
+        gitcoin_api.set_url('bounties', server.url)
+        yield gitcoin_api
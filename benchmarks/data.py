@@ -0,0 +1,80 @@
+"""Generate synthetic bounties shaped like the API's responses."""
+
+import random
+
+import gitcoin.validation
+
+LOREM = (
+    'Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore '
+    'magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo.'
+)
+
+
+def make_bounty(pk, rng):
+    """Create one synthetic bounty with the API's field names and value types."""
+    value_in_token = rng.randint(1, 10**6) * 10**12
+    owner = rng.choice(['owocki', 'gitcoinbot', 'vs77bb', 'thelostone-mc', 'mbeacom'])
+    created = '2018-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}Z'.format(
+        month=rng.randint(1, 12),
+        day=rng.randint(1, 28),
+        hour=rng.randint(0, 23),
+        minute=rng.randint(0, 59),
+        second=rng.randint(0, 59)
+    )
+    options = gitcoin.validation.OPTIONS
+    return {
+        'url': 'https://gitcoin.co/api/v0.1/bounties/{pk}'.format(pk=pk),
+        'pk': pk,
+        'created_on': created,
+        'modified_on': created,
+        'title': 'Synthetic bounty number {pk}'.format(pk=pk),
+        'web3_created': created,
+        'value_in_token': str(value_in_token),
+        'token_name': rng.choice(['ETH', 'DAI', 'GIT']),
+        'token_address': '0x0000000000000000000000000000000000000000',
+        'bounty_type': rng.choice(options['bounty_type']),
+        'project_length': rng.choice(options['project_length']),
+        'experience_level': rng.choice(options['experience_level']),
+        'github_url': 'https://github.com/gitcoinco/web/issues/{pk}'.format(pk=pk),
+        'github_comments': rng.randint(0, 40),
+        'bounty_owner_address': '0x{addr:040x}'.format(addr=rng.getrandbits(160)),
+        'bounty_owner_email': 'Anonymous',
+        'bounty_owner_github_username': owner,
+        'bounty_owner_name': owner,
+        'fulfillments': [{'fulfiller_github_username': 'fulfiller{n}'.format(n=n)} for n in range(rng.randint(0, 2))],
+        'interested': [{'profile': {'handle': 'hunter{n}'.format(n=n)}} for n in range(rng.randint(0, 3))],
+        'is_open': rng.random() < 0.3,
+        'expires_date': created,
+        'current_bounty': True,
+        'value_in_eth': str(value_in_token),
+        'token_value_in_usdt': '{v:.2f}'.format(v=rng.random() * 1000),
+        'value_in_usdt_now': '{v:.2f}'.format(v=rng.random() * 1000),
+        'value_in_usdt': '{v:.2f}'.format(v=rng.random() * 1000),
+        'status': rng.choice(options['idx_status']),
+        'value_true': '{v:.6f}'.format(v=value_in_token / 10**18),
+        'issue_description': LOREM * rng.randint(1, 4),
+        'network': rng.choice(['mainnet', 'rinkeby']),
+        'standard_bounties_id': pk,
+        'web3_type': 'bounties_network',
+        'idx_status': rng.choice(options['idx_status']),
+        'token_value_time_peg': created,
+        'last_comment_date': created,
+        'raw_data': {
+            'id': pk,
+            'issuer': '0x{addr:040x}'.format(addr=rng.getrandbits(160)),
+            'data': {
+                'payload': {
+                    'title': 'Synthetic bounty number {pk}'.format(pk=pk),
+                    'description': LOREM,
+                    'categories': ['Python', 'JavaScript'],
+                }
+            },
+        },
+        'metadata': {'issueKeywords': 'python, api', 'estimatedHours': rng.randint(1, 100)},
+    }
+
+
+def make_bounties(total, seed=0):
+    """Create 'total' synthetic bounties with ascending primary keys."""
+    rng = random.Random(seed)
+    return [make_bounty(pk, rng) for pk in range(1, total + 1)]
@@ -0,0 +1,50 @@
+"""Compare memory use and decode time of plain dicts and `gitcoin.models.Bounty`.
+
+Run with `python -m benchmarks.models [number of bounties]`.
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from benchmarks.data import make_bounties
+from gitcoin.models import Bounty
+
+
+def decode_dicts(body):
+    """Decode the response body like the default client does."""
+    return json.loads(body)
+
+
+def decode_models(body):
+    """Decode the response body into typed bounties."""
+    return [Bounty.from_dict(bounty) for bounty in json.loads(body)]
+
+
+def measure(decode, body):
+    """Measure decode time and memory retained by the decoded result."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = decode(body)
+    seconds = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return seconds, retained, peak
+
+
+def main(total=10000):
+    """Print a comparison table for 'total' bounties."""
+    body = json.dumps(make_bounties(total))
+    print('{total} bounties, {size:.1f} MiB JSON'.format(total=total, size=len(body) / 2**20))
+    print('{:<10} {:>12} {:>14} {:>12}'.format('decoder', 'time [s]', 'retained [MiB]', 'peak [MiB]'))
+    for name, decode in (('dict', decode_dicts), ('Bounty', decode_models)):
+        seconds, retained, peak = measure(decode, body)
+        print('{:<10} {:>12.3f} {:>14.1f} {:>12.1f}'.format(name, seconds, retained / 2**20, peak / 2**20))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
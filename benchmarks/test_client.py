@@ -0,0 +1,145 @@
+"""Benchmark the client against a local mock Gitcoin API server.
+
+Run with `make benchmark`, see the Makefile for storing and comparing results.
+"""
+
+import json
+import os
+import tracemalloc
+from urllib.parse import urlencode
+
+import pytest
+from gitcoin import Gitcoin
+from gitcoin.decoding import find_loads
+from gitcoin.models import Bounty
+from gitcoin.scheduler import Scheduler
+from gitcoin.snapshot import Snapshot, SnapshotWriter
+from gitcoin.transport import FakeTransport, HTTP2Transport
+from tests.server import StubServer
+
+
+def record_peak_memory(benchmark, fn):
+    """Run 'fn' once more under tracemalloc, storing its peak memory use with the results."""
+    tracemalloc.start()
+    try:
+        fn()
+        benchmark.extra_info['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_get_page(benchmark, api, bounties):
+    result = benchmark(lambda: api.bounties.get_page(number=2, per_page=100))
+    assert len(result) == min(100, len(bounties) - 100)
+
+
+def test_get(benchmark, api, bounties):
+    result = benchmark(lambda: api.bounties.get(len(bounties) // 2))
+    assert result['pk'] == len(bounties) // 2
+
+
+def test_all(benchmark, api, bounties):
+    result = benchmark.pedantic(api.bounties.all, rounds=3)
+    assert len(result) == len(bounties)
+    record_peak_memory(benchmark, api.bounties.all)
+
+
+def test_all_parallel(benchmark, api, bounties):
+    fetch = lambda: api.bounties.all(parallel=8, per_page=500)  # noqa: E731
+    result = benchmark.pedantic(fetch, rounds=3)
+    assert len(result) == len(bounties)
+    record_peak_memory(benchmark, fetch)
+
+
+def test_iter(benchmark, api, bounties):
+    consume = lambda: sum(1 for _ in api.bounties.iter(per_page=500, prefetch=True))  # noqa: E731
+    assert benchmark.pedantic(consume, rounds=3) == len(bounties)
+    record_peak_memory(benchmark, consume)
+
+
+def test_stream(benchmark, api, bounties):
+    consume = lambda: sum(1 for _ in api.bounties.stream())  # noqa: E731
+    assert benchmark.pedantic(consume, rounds=3) == len(bounties)
+    record_peak_memory(benchmark, consume)
+
+
+def test_stream_only(benchmark, api, bounties):
+    fields = ('title', 'idx_status', 'value_in_usdt_now')
+    consume = lambda: [bounty for bounty in api.bounties.only(*fields).as_model().stream()]  # noqa: E731
+    assert len(benchmark.pedantic(consume, rounds=3)) == len(bounties)
+    record_peak_memory(benchmark, consume)
+
+
+@pytest.mark.parametrize('transport', ['requests', 'httpx', 'fake'])
+def test_get_page_transport(benchmark, server, bounties, transport):
+    with Gitcoin() as api:
+        api.set_url('bounties', server.url)
+        if transport == 'httpx':
+            pytest.importorskip('httpx')
+            api.set_class('session', lambda: HTTP2Transport(http2=False))  # The mock server speaks HTTP/1.1 only.
+        elif transport == 'fake':
+            fake = FakeTransport().add(server.url, json=bounties)
+            api.set_class('session', lambda: fake)
+        result = benchmark(lambda: api.bounties.get_page(number=2, per_page=100))
+        assert len(result) == min(100, len(bounties) - 100)
+
+
+@pytest.mark.parametrize('frozen', [False, True], ids=['prep_params', 'frozen_query'])
+def test_build_page_queries(benchmark, frozen):
+    bounties = Gitcoin().bounties.filter(network='mainnet', idx_status='open', experience_level='Beginner')
+    bounties = bounties.order_by('-web3_created')
+    if frozen:
+        build = lambda: [bounties.freeze().page(number, 25).encoded for number in range(1, 101)]  # noqa: E731
+    else:
+        build = lambda: [urlencode(bounties._prep_get_params()) for number in range(1, 101)]  # noqa: E731
+    assert len(benchmark(build)) == 100
+
+
+@pytest.mark.parametrize('format', ['jsonl', 'jsonl.gz'])
+def test_snapshot_load(benchmark, bounties, format, tmpdir):
+    path = str(tmpdir.join('bounties.' + format))
+    with SnapshotWriter(path, format=format) as writer:
+        writer.write_many(bounties)
+    with Snapshot(path) as snapshot:
+        benchmark.extra_info['file_bytes'] = os.path.getsize(path)
+        assert len(benchmark(snapshot.all)) == len(bounties)
+
+
+def test_watch_poll(benchmark, api, bounties):
+    feed = api.bounties.watch()
+    assert len(feed.poll()) == len(bounties)
+    assert benchmark.pedantic(feed.poll, rounds=3) == []  # The mock sends no ETag, so every poll streams the list.
+    record_peak_memory(benchmark, feed.poll)
+
+
+@pytest.mark.parametrize('decoder', ['stdlib', 'fastest'])
+def test_decode(benchmark, bounties, decoder):
+    body = json.dumps(bounties).encode('utf-8')
+    loads = json.loads if decoder == 'stdlib' else find_loads()
+    benchmark.extra_info['decoder'] = '{module}.{name}'.format(module=loads.__module__, name=loads.__name__)
+    assert len(benchmark(loads, body)) == len(bounties)
+    record_peak_memory(benchmark, lambda: loads(body))
+
+
+def test_decode_models(benchmark, bounties):
+    body = json.dumps(bounties).encode('utf-8')
+    decode = lambda: [Bounty.from_dict(bounty) for bounty in json.loads(body)]  # noqa: E731
+    assert len(benchmark(decode)) == len(bounties)
+    record_peak_memory(benchmark, decode)
+
+
+@pytest.mark.parametrize('latency', [0.005])
+def test_get_page_with_latency(benchmark, bounties, latency):
+    with StubServer(bounties, latency=latency, cache_bodies=True) as server, Gitcoin() as api:
+        api.set_url('bounties', server.url)
+        benchmark.extra_info['latency'] = latency
+        benchmark(lambda: api.bounties.fetch_pages(range(1, 9), per_page=100, workers=8))
+
+
+def test_throttled_pull(benchmark, bounties):
+    with StubServer(bounties, rate_limit=50, cache_bodies=True) as server, Gitcoin() as api:
+        api.set_url('bounties', server.url)
+        api.set_scheduler(Scheduler(rate=50, max_concurrency=8, backoff=0.05))
+        fetch = lambda: api.bounties.fetch_pages(range(1, 21), per_page=50, workers=8)  # noqa: E731
+        benchmark.pedantic(fetch, rounds=1)
+        benchmark.extra_info['throttled'] = server.throttled
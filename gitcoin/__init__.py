@@ -1,13 +1,58 @@
-"""Define the Gitcoin API client."""
+"""Define the Gitcoin API client.
 
-from gitcoin.client import Config
-from gitcoin.client import BountyConfig
-from gitcoin.client import Endpoint
-from gitcoin.client import Gitcoin
+The client classes are imported from their modules on first access, so
+`import gitcoin` stays cheap until a request is about to be made, e.g. for
+the command line interface in `gitcoin.cli`. Python versions before 3.7
+cannot load module attributes lazily and import them right away.
+"""
+
+import sys
 
 __all__ = [
+    'AsyncEndpoint',
+    'AsyncGitcoin',
     'Config',
     'BountyConfig',
     'Endpoint',
     'Gitcoin',
 ]
+
+# Modules defining the names exported above.
+_EXPORTS = {
+    'AsyncEndpoint': 'gitcoin.aio',
+    'AsyncGitcoin': 'gitcoin.aio',
+    'Config': 'gitcoin.client',
+    'BountyConfig': 'gitcoin.client',
+    'Endpoint': 'gitcoin.client',
+    'Gitcoin': 'gitcoin.client',
+}
+
+if sys.version_info >= (3, 7):
+    import importlib
+
+    def __getattr__(name):
+        """Import exported names and submodules on first access, see PEP 562."""
+        if name in _EXPORTS:
+            value = getattr(importlib.import_module(_EXPORTS[name]), name)
+            globals()[name] = value  # Skip this function from now on.
+            return value
+        if not name.startswith('_'):
+            try:
+                return importlib.import_module('.'.join((__name__, name)))
+            except ModuleNotFoundError as e:
+                if e.name != '.'.join((__name__, name)):
+                    raise
+        msg = 'module {module!r} has no attribute {name!r}'
+        raise AttributeError(msg.format(module=__name__, name=name))
+
+    def __dir__():
+        """List the exported names along with the loaded ones."""
+        return sorted(set(globals()) | set(__all__))
+
+else:
+    from gitcoin.aio import AsyncEndpoint  # noqa: F401
+    from gitcoin.aio import AsyncGitcoin  # noqa: F401
+    from gitcoin.client import Config  # noqa: F401
+    from gitcoin.client import BountyConfig  # noqa: F401
+    from gitcoin.client import Endpoint  # noqa: F401
+    from gitcoin.client import Gitcoin  # noqa: F401
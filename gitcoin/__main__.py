@@ -0,0 +1,7 @@
+"""Run the command line interface with `python -m gitcoin`, see `gitcoin.cli`."""
+
+import sys
+
+from gitcoin.cli import main
+
+sys.exit(main())
@@ -0,0 +1,181 @@
+"""Define the asyncio Gitcoin API client.
+
+This module needs the optional `aiohttp` dependency, install it with
+`pip install gitcoin[async]`. It is only imported once the first request
+is sent, so importing this module is cheap.
+"""
+
+import asyncio
+
+import gitcoin.cache
+from gitcoin.client import BaseEndpoint, BountyConfig
+
+
+def _import_aiohttp():
+    """Import aiohttp on demand with a helpful error message."""
+    try:
+        import aiohttp
+    except ImportError as e:
+        msg = 'The asyncio client needs "aiohttp", install it with "pip install gitcoin[async]".'
+        raise ImportError(msg) from e
+    return aiohttp
+
+
+class AsyncSession:
+    """Wrap one pooled aiohttp session with a bound on concurrent requests."""
+
+    def __init__(self, pool_maxsize=10, max_concurrency=10):
+        """Configure pool size and concurrency, the aiohttp session is created lazily."""
+        self.pool_maxsize = pool_maxsize
+        self.max_concurrency = max_concurrency
+        self._session = None
+        self._semaphore = None
+
+    async def _get_session(self):
+        """Create the aiohttp session inside the running event loop on first use."""
+        if self._session is None:
+            aiohttp = _import_aiohttp()
+            connector = aiohttp.TCPConnector(limit=self.pool_maxsize)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def get_json(self, url, params=None):
+        """Fire one HTTP GET request and decode the JSON response body."""
+        session = await self._get_session()
+        async with self._semaphore:
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()  # Let API consumer know about HTTP errors.
+                return await response.json()
+
+    async def close(self):
+        """Close the aiohttp session and all its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._semaphore = None
+
+
+class AsyncPageIterator:
+    """Iterate asynchronously over all resources, fetching one page at a time."""
+
+    def __init__(self, endpoint, params, per_page):
+        """Inject the endpoint and its frozen query."""
+        self.endpoint = endpoint
+        self.params = params
+        self.per_page = per_page
+        self.number = 0
+        self.page = []
+        self.is_last = False
+
+    def __aiter__(self):
+        """Use the iterator itself for `async for`."""
+        return self
+
+    async def __anext__(self):
+        """Return the next resource, requesting the next page when needed."""
+        if not self.page:
+            if self.is_last:
+                raise StopAsyncIteration
+            self.number += 1
+            page = await self.endpoint._fetch_page(self.params, self.number, self.per_page)
+            self.is_last = len(page) < self.per_page
+            self.page = list(reversed(page))
+            if not self.page:
+                raise StopAsyncIteration
+        return self.page.pop()
+
+
+class AsyncEndpoint(BaseEndpoint):
+    """Wrap one Gitcoin API end point for use with asyncio."""
+
+    async def get_page(self, number=1, per_page=25):
+        """Get one page of the resources list."""
+        return await self._fetch_page(self.freeze(), number, per_page)
+
+    def iter(self, per_page=25):
+        """Iterate asynchronously over all resources, fetching one page at a time."""
+        return AsyncPageIterator(self, self.freeze(), per_page)
+
+    async def _fetch_page(self, params, number, per_page):
+        """Get one page for a frozen query, leaving the endpoint untouched."""
+        return await self._request_get(params=params.page(number, per_page))
+
+    async def all(self):
+        """List all resources."""
+        return await self._request_get(params=self._unpaged_query())
+
+    async def get(self, primary_key):
+        """Retrieve one resource by primary key."""
+        return await self._request_get(''.join((self.url, str(primary_key))))
+
+    async def _request_get(self, url=None, params=None):
+        """Fire the actual HTTP GET request as configured."""
+        url = url if url else self.url
+        params = params if params is not None else self.freeze()
+        if self.single_flight is not None:
+            key = gitcoin.cache.Cache.make_key(url, params)
+            result = await self.single_flight.do(key, lambda: self.session.get_json(url, params=params))
+            return self._to_model(result)
+        return self._to_model(await self.session.get_json(url, params=params))
+
+
+class AsyncGitcoin:
+    """Provide main asyncio API entry point."""
+
+    def __init__(self, pool_maxsize=10, max_concurrency=10):
+        """Set defaults.
+
+        'pool_maxsize' bounds the number of open connections and
+        'max_concurrency' the number of requests in flight at once.
+        """
+        self.classes = {}
+        self.set_class('endpoint', AsyncEndpoint)
+        self.set_class('bounties_list_config', BountyConfig)
+        self.set_class('session', AsyncSession)
+        self.urls = {}
+        self.set_url('bounties', 'https://gitcoin.co/api/v0.1/bounties/')
+        self.session_kwargs = {'pool_maxsize': pool_maxsize, 'max_concurrency': max_concurrency}
+        self._session = None
+        self.single_flight = None
+
+    async def __aenter__(self):
+        """Use the API root object as async context manager, closing the session on exit."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close the shared session."""
+        await self.close()
+
+    def set_class(self, cls_id, cls):
+        """Inject class dependency, overriding the default class."""
+        self.classes[cls_id] = cls
+
+    def set_url(self, cls_id, url):
+        """Configure API URL, overriding the default URL."""
+        self.urls[cls_id] = url
+
+    def set_single_flight(self, single_flight):
+        """Share one request among identical concurrent ones, see `gitcoin.singleflight.AsyncSingleFlight`."""
+        self.single_flight = single_flight
+
+    @property
+    def session(self):
+        """Provide the session shared by all endpoints, creating it on first use."""
+        if self._session is None:
+            self._session = self.classes['session'](**self.session_kwargs)
+        return self._session
+
+    async def close(self):
+        """Close the shared session and all its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def bounties(self):
+        """Wrap the 'bounties' API endpoint."""
+        url = self.urls['bounties']
+        endpoint_class = self.classes['endpoint']
+        config_class = self.classes['bounties_list_config']
+        return endpoint_class(url, config_class(), session=self.session, single_flight=self.single_flight)
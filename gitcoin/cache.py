@@ -0,0 +1,182 @@
+"""Cache Gitcoin API responses for the Gitcoin API client."""
+
+import collections
+import sqlite3
+import threading
+import time
+import urllib.parse
+
+import gitcoin.query
+
+
+class CacheEntry:
+    """Hold one cached response body along with its validators."""
+
+    def __init__(self, content, etag=None, last_modified=None, stored_at=None):
+        """Store the raw body, freshness is measured from 'stored_at'."""
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at if stored_at is not None else time.time()
+
+    def is_fresh(self, ttl):
+        """Tell if the entry may be served without asking the server."""
+        return time.time() - self.stored_at < ttl
+
+    def can_revalidate(self):
+        """Tell if the server can confirm the entry with a conditional request."""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self):
+        """Get the headers for a conditional request revalidating the entry."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class Cache:
+    """Define Base Class for response caches.
+
+    Entries stay fresh for 'ttl' seconds. Stale entries with an ETag or
+    Last-Modified validator are kept for conditional revalidation until
+    they are evicted.
+    """
+
+    def __init__(self, ttl=60):
+        """Init hit/miss counters."""
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    @staticmethod
+    def make_key(url, params):
+        """Build the cache key from URL and query parameters."""
+        if isinstance(params, gitcoin.query.Query):
+            query = params.encoded
+        else:
+            query = urllib.parse.urlencode(sorted((params or {}).items()))
+        return '?'.join((url, query)) if query else url
+
+    def stats(self):
+        """Report hit/miss counters."""
+        return {'hits': self.hits, 'misses': self.misses, 'revalidated': self.revalidated}
+
+    def get(self, key):
+        """Get the entry for 'key' or None."""
+        raise NotImplementedError
+
+    def set(self, key, entry):
+        """Store the entry for 'key'."""
+        raise NotImplementedError
+
+    def delete(self, key):
+        """Drop the entry for 'key', if any."""
+        raise NotImplementedError
+
+    def clear(self):
+        """Drop all entries."""
+        raise NotImplementedError
+
+
+class MemoryCache(Cache):
+    """Cache up to 'maxsize' responses in memory, evicting the least recently used."""
+
+    def __init__(self, ttl=60, maxsize=1024):
+        """Init the empty LRU container."""
+        super().__init__(ttl=ttl)
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Count cached entries."""
+        return len(self._entries)
+
+    def get(self, key):
+        """Get the entry for 'key' or None, marking it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        """Store the entry for 'key', evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """Drop the entry for 'key', if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(Cache):
+    """Cache up to 'maxsize' responses in an SQLite file surviving restarts."""
+
+    def __init__(self, path, ttl=60, maxsize=10000):
+        """Open or create the cache database at 'path'."""
+        super().__init__(ttl=ttl)
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, content BLOB, etag TEXT, last_modified TEXT, stored_at REAL, used_at REAL)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)')
+
+    def __len__(self):
+        """Count cached entries."""
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def get(self, key):
+        """Get the entry for 'key' or None, marking it as recently used."""
+        with self._lock, self._db:
+            row = self._db.execute(
+                'SELECT content, etag, last_modified, stored_at FROM responses WHERE key = ?', (key, )
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute('UPDATE responses SET used_at = ? WHERE key = ?', (time.time(), key))
+        return CacheEntry(bytes(row[0]), etag=row[1], last_modified=row[2], stored_at=row[3])
+
+    def set(self, key, entry):
+        """Store the entry for 'key', evicting the least recently used entries."""
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                (key, entry.content, entry.etag, entry.last_modified, entry.stored_at, time.time())
+            )
+            self._db.execute(
+                'DELETE FROM responses WHERE key IN '
+                '(SELECT key FROM responses ORDER BY used_at DESC LIMIT -1 OFFSET ?)', (self.maxsize, )
+            )
+
+    def delete(self, key):
+        """Drop the entry for 'key', if any."""
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM responses WHERE key = ?', (key, ))
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM responses')
+
+    def close(self):
+        """Close the database."""
+        self._db.close()
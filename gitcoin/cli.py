@@ -0,0 +1,147 @@
+"""Export Gitcoin API resources from the command line.
+
+    gitcoin bounties --filter network=mainnet --filter idx_status=open --format csv > open.csv
+
+Resources are written to stdout page by page as they arrive, as newline
+delimited JSON or CSV. Filters accept the API's filter params, repeated
+for several values, and the lookups of `Endpoint.where()`, e.g.
+`--filter value_in_usdt__gt=500`. The client and `requests` are only
+imported once the arguments are parsed, to keep short-lived jobs quick.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+
+import gitcoin.validation
+
+FORMATS = ('ndjson', 'csv')
+
+
+def _filter(arg):
+    """Parse one 'name=value' filter."""
+    name, sep, value = arg.partition('=')
+    if not sep or not name:
+        raise argparse.ArgumentTypeError('Filters look like "name=value", got "{arg}".'.format(arg=arg))
+    return name, value
+
+
+def _fields(value):
+    """Parse comma separated field names."""
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def make_parser():
+    """Define the command line arguments."""
+    parser = argparse.ArgumentParser(prog='gitcoin', description='Export Gitcoin API resources.')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+    bounties = commands.add_parser('bounties', help='Stream bounties to stdout.')
+    bounties.add_argument(
+        '--filter', '-f', action='append', default=[], type=_filter, metavar='NAME=VALUE', dest='filters',
+        help='Filter param or lookup, repeat for several; comma separate the values of "in" and "range" lookups.'
+    )
+    bounties.add_argument('--order-by', '-o', metavar='FIELD', help='Sort by field, descending with a leading "-".')
+    bounties.add_argument('--format', choices=FORMATS, default='ndjson', help='Output format, ndjson by default.')
+    bounties.add_argument(
+        '--fields', type=_fields, metavar='A,B', help='Fields to output, all but the nested ones for CSV by default.'
+    )
+    bounties.add_argument('--limit', type=int, metavar='N', help='Stop after N bounties.')
+    bounties.add_argument(
+        '--per-page', type=int, default=100, metavar='N', help='Bounties per request, 100 by default.'
+    )
+    bounties.add_argument('--url', help='URL of the bounties API endpoint.')
+    return parser
+
+
+def _convert(name, value):
+    """Convert a filter value from the command line."""
+    field, _, lookup = name.partition('__')
+    if lookup in ('in', 'range'):
+        return [_convert(field, item) for item in value.split(',')]
+    if gitcoin.validation.TYPES.get(field) == 'bool' and lookup in ('', 'exact'):
+        if value.lower() not in ('true', 'false'):
+            msg = 'Expected true or false for "{name}", got "{value}".'
+            raise ValueError(msg.format(name=name, value=value))
+        return value.lower() == 'true'
+    return value
+
+
+def plan(args):
+    """Build the query plan for the parsed 'bounties' arguments."""
+    import gitcoin.client
+    import gitcoin.planner
+    api = gitcoin.client.Gitcoin()
+    if args.url:
+        api.set_url('bounties', args.url)
+    endpoint = api.bounties
+    if args.fields:
+        endpoint = endpoint.only(*args.fields)
+    if args.order_by:
+        endpoint = endpoint.order_by(args.order_by)
+    lookups = {}
+    for name, value in args.filters:
+        value = _convert(name, value)
+        if endpoint.config.has(name) and name not in ('order_by', 'limit', 'offset'):
+            endpoint = endpoint.filter(**{name: value})
+        else:
+            lookups[name] = value
+    return gitcoin.planner.Plan(endpoint).where(**lookups).limit(args.limit)
+
+
+def write_ndjson(resources, out):
+    """Write one compact JSON object per line."""
+    for resource in resources:
+        out.write(json.dumps(resource, separators=(',', ':')))
+        out.write('\n')
+
+
+def write_csv(resources, out, fields):
+    """Write a header and one row per resource, nested values as JSON."""
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(fields)
+    for resource in resources:
+        row = []
+        for name in fields:
+            value = resource.get(name)
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value, separators=(',', ':'))
+            row.append('' if value is None else value)
+        writer.writerow(row)
+
+
+def export(resources, args, out):
+    """Write the resources in the format asked for."""
+    if args.format == 'csv':
+        import gitcoin.columns
+        fields = args.fields or gitcoin.columns.DEFAULT_FIELDS
+        if args.fields and 'pk' not in fields:
+            fields = ['pk'] + fields
+        write_csv(resources, out, fields)
+    else:
+        write_ndjson(resources, out)
+    out.flush()
+
+
+def main(argv=None, out=None):
+    """Run the command line interface, returning the exit status."""
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    out = out if out is not None else sys.stdout
+    try:
+        query = plan(args)
+    except (KeyError, ValueError) as e:
+        parser.error(e.args[0] if e.args else str(e))
+    import requests.exceptions  # Loaded along with the client by now.
+    try:
+        export(query.iter(per_page=args.per_page, prefetch=True), args, out)
+    except requests.exceptions.RequestException as e:
+        sys.stderr.write('gitcoin: error: {error}\n'.format(error=e))
+        return 1
+    except BrokenPipeError:
+        if out is sys.stdout:  # The reader went away, e.g. `head`, keep Python from complaining on exit.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
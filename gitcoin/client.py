@@ -1,7 +1,30 @@
 """Define the Gitcoin API client."""
 
+import collections
+import concurrent.futures
+import contextlib
+import copy
+import functools
+import itertools
+import time
+
+import gitcoin.cache
+import gitcoin.columns
+import gitcoin.decoding
+import gitcoin.instrumentation
+import gitcoin.models
+import gitcoin.planner
+import gitcoin.query
+import gitcoin.snapshot
+import gitcoin.sync
 import gitcoin.validation
 import requests
+import requests.adapters
+import requests.exceptions
+import urllib3.util.request
+
+# Content codings urllib3 decodes: gzip and deflate, plus br and zstd if brotli and zstandard are installed.
+ACCEPT_ENCODING = urllib3.util.request.ACCEPT_ENCODING
 
 
 class Config:
@@ -10,6 +33,7 @@ class Config:
     def __init__(self):
         """Init empty params container."""
         self.params = {}
+        self.fields_param = None  # Query parameter selecting the fields to return, if the API has one.
 
     def has(self, name):
         """Tell if a setting for 'name' was defined."""
@@ -52,14 +76,85 @@ class BountyConfig(Config):
         }
 
 
-class Endpoint:
-    """Wrap one Gitcoin API end point."""
+class BulkResult(dict):
+    """Map primary keys to resources, collecting failures per key in 'errors'."""
+
+    def __init__(self):
+        """Start with no resources and no errors."""
+        super().__init__()
+        self.errors = {}
+
+
+class KeysetIterator:
+    """Iterate over all resources in primary key order, one keyset page at a time.
+
+    'cursor' points after the resource returned last, so a crawl can be
+    resumed there later via `Endpoint.iter_keyset(cursor=...)`.
+    """
+
+    def __init__(self, endpoint, cursor=None, per_page=25):
+        """Start after 'cursor', or at the first resource."""
+        self.endpoint = endpoint
+        self.query = endpoint.freeze().keyset()
+        self.per_page = per_page
+        self.after = self.query.decode_cursor(cursor) if cursor else None
+        self.page = collections.deque()
+        self.is_last = False
+
+    def __iter__(self):
+        """Use the iterator itself in for loops."""
+        return self
+
+    def __next__(self):
+        """Return the next resource, requesting the next page when needed."""
+        if not self.page:
+            if self.is_last:
+                raise StopIteration
+            page = self.endpoint._fetch_keyset_page(self.query, self.after, self.per_page)
+            self.is_last = page.is_last
+            self.page.extend(page)
+            if not self.page:
+                raise StopIteration
+        resource = self.page.popleft()
+        self.after = resource['pk']
+        return resource
+
+    @property
+    def cursor(self):
+        """Get the cursor pointing after the resource returned last, None before the first one."""
+        return self.query.encode_cursor(self.after) if self.after is not None else None
+
+
+class BaseEndpoint:
+    """Define query building shared by all Gitcoin API end point wrappers.
+
+    Query building methods return a new endpoint and leave the original
+    untouched, so a base query can be shared between threads and refined
+    independently in each of them.
+    """
 
-    def __init__(self, url, config):
-        """Inject URL and Config, default to no query parameters."""
+    def __init__(
+        self, url, config, session=None, cache=None, loads=None, scheduler=None, single_flight=None, hooks=None
+    ):
+        """Inject URL, Config and HTTP machinery, default to no query parameters.
+
+        The HTTP machinery is the session, response cache, JSON parser,
+        request scheduler, single-flight deduplication and instrumentation
+        hooks, all optional.
+        """
         self.url = url
         self.config = config
+        self.session = session
+        self.cache = cache
+        self.scheduler = scheduler
+        self.single_flight = single_flight
+        self.hooks = hooks if hooks is not None else []
+        self.loads = loads if loads else gitcoin.decoding.loads
+        self.model = None
+        self.only_fields = None
+        self.deferred_fields = frozenset()
         self.params = {}
+        self._query = None
 
     def _add_param(self, name, value):
         """Add query parameter with safeguards."""
@@ -79,72 +174,535 @@ class Endpoint:
         """Delete query parameter."""
         if name in self.params:
             del self.params[name]
+            self._query = None
         return self
 
     def _reset_all_params(self):
         """Delete all query parameters."""
         self.params = {}
+        self._query = None
 
     def _add_param_unchecked(self, name, value):
         """Add query parameter without safeguards.
 
         This is available in case this API client is out-of-sync with the API.
         """
-        if name not in self.params:
-            self.params[name] = []
-        self.params[name].append(str(value))
+        self.params[name] = self.params.get(name, ()) + (str(value), )
+        self._query = None
         return self
 
+    def _clone(self):
+        """Copy the endpoint for refinement.
+
+        HTTP machinery and parameter values, which are tuples, are shared with
+        the original. Only the small dict mapping names to values is copied.
+        """
+        endpoint = copy.copy(self)
+        endpoint.params = dict(self.params)
+        return endpoint
+
     def filter(self, **kwargs):
-        """Filter the result set."""
+        """Filter the result set, returning a new endpoint."""
+        endpoint = self._clone()
         for name, value in kwargs.items():
-            self._add_param(name, value)
-        return self
+            endpoint._add_param(name, value)
+        return endpoint
 
     def order_by(self, sort):
-        """Sort the result set."""
-        self._add_param('order_by', sort)
-        return self
+        """Sort the result set, returning a new endpoint."""
+        return self._clone()._add_param('order_by', sort)
+
+    def only(self, *fields):
+        """Return only the given fields of each resource, plus 'pk'.
+
+        If the API can select fields, only these are requested. Otherwise all
+        others are dropped from each resource as soon as it is decoded, before
+        it is converted into the model or collected into the result. Returns a
+        new endpoint.
+        """
+        endpoint = self._clone()
+        endpoint.only_fields = frozenset(gitcoin.validation.field(name) for name in fields) | {'pk'}
+        endpoint._query = None
+        return endpoint
+
+    def defer(self, *fields):
+        """Leave the given fields out of each resource, e.g. 'raw_data', returning a new endpoint."""
+        fields = frozenset(gitcoin.validation.field(name) for name in fields)
+        if 'pk' in fields:
+            raise ValueError('Cannot defer the primary key "pk".')
+        endpoint = self._clone()
+        endpoint.deferred_fields = self.deferred_fields | fields
+        endpoint._query = None
+        return endpoint
+
+    def as_model(self, model=gitcoin.models.Bounty):
+        """Return resources as instances of a compact typed model instead of plain dicts, via a new endpoint."""
+        endpoint = self._clone()
+        endpoint.model = model
+        return endpoint
+
+    def _to_model(self, result):
+        """Strip unwanted fields from decoded resources and convert them into the typed model, if any."""
+        if self.only_fields is not None or self.deferred_fields:
+            result = self._project(result)
+        if self.model is None:
+            return result
+        if isinstance(result, list):
+            from_dict = self.model.from_dict
+            return [from_dict(resource) for resource in result]
+        return self.model.from_dict(result)
+
+    def _project(self, result):
+        """Keep only the wanted fields of decoded resources."""
+        if isinstance(result, list):
+            return [self._project(resource) for resource in result]
+        only, deferred = self.only_fields, self.deferred_fields
+        return {
+            name: value
+            for name, value in result.items() if (only is None or name in only) and name not in deferred
+        }
+
+    def _keeps(self, name):
+        """Tell if the field 'name' is kept in resources."""
+        return (self.only_fields is None or name in self.only_fields) and name not in self.deferred_fields
+
+    def _prep_get_params(self):
+        """Send multi-value fields separated by comma."""
+        params = {name: ','.join(value) for name, value in self.params.items()}
+        if self.config.fields_param and self.only_fields is not None:
+            params[self.config.fields_param] = ','.join(sorted(self.only_fields - self.deferred_fields))
+        return params
+
+    def freeze(self):
+        """Get the query as configured so far as immutable, hashable `gitcoin.query.Query`.
+
+        The query and its encoded query string are built once and reused
+        until the endpoint is changed again.
+        """
+        if self._query is None:
+            self._query = gitcoin.query.Query(self.url, self._prep_get_params())
+        return self._query
+
+    def _unpaged_query(self):
+        """Get the frozen query without limit/offset, to request the complete list."""
+        query = self.freeze()
+        if 'limit' in query or 'offset' in query:
+            return query.replace(limit=None, offset=None)
+        return query
+
+
+class Endpoint(BaseEndpoint):
+    """Wrap one Gitcoin API end point.
+
+    Without a session, every request opens a new connection via the
+    module-level `requests.get()`.
+    """
 
     def get_page(self, number=1, per_page=25):
         """Get one page of the resources list."""
-        self._add_param('limit', per_page)
-        self._add_param('offset', (number - 1) * per_page)
-        return self._request_get()
+        return self._fetch_page(self.freeze(), number, per_page)
+
+    def iter(self, per_page=25, prefetch=False):
+        """Iterate over all resources, fetching one page at a time.
+
+        Pages are requested lazily with the same limit/offset mechanics as
+        `get_page()`, so only one page (two with 'prefetch') is held in memory.
+        With 'prefetch', the next page is requested in a background thread
+        while the current one is being consumed.
+        """
+        params = self.freeze()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            number = 1
+            pending = executor.submit(self._fetch_page, params, number, per_page) if executor else None
+            while True:
+                page = pending.result() if executor else self._fetch_page(params, number, per_page)
+                is_last = len(page) < per_page
+                if executor and not is_last:
+                    pending = executor.submit(self._fetch_page, params, number + 1, per_page)
+                yield from page
+                if is_last:
+                    return
+                number += 1
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    def _fetch_page(self, params, number, per_page):
+        """Get one page for a frozen query, leaving the endpoint untouched."""
+        return self._request_get(params=params.page(number, per_page))
+
+    def page_after(self, cursor=None, per_page=25):
+        """Get the page of resources following 'cursor' in primary key order, see `iter_keyset()`.
+
+        Pass the returned page's 'cursor' to get the next one.
+        """
+        query = self.freeze().keyset()
+        after = query.decode_cursor(cursor) if cursor else None
+        return self._fetch_keyset_page(query, after, per_page)
+
+    def iter_keyset(self, cursor=None, per_page=25):
+        """Iterate over all resources in primary key order, resumable after 'cursor'.
+
+        Pages are selected by the filters plus `pk__gt` the last primary key
+        seen rather than by offset, so deep pages are as cheap as the first
+        one and bounties added during a long crawl cause neither duplicates
+        nor gaps. The endpoint's sorting is replaced by primary key order.
+        See `KeysetIterator` for the cursor to resume from.
+        """
+        return KeysetIterator(self, cursor=cursor, per_page=per_page)
+
+    def _fetch_keyset_page(self, query, after, per_page):
+        """Get the page of a keyset query after primary key 'after', if any."""
+        params = query
+        if after is not None and after >= int(query.get('pk__gt', after)):
+            params = query.replace(pk__gt=after)
+        resources = self._request_get(params=params.replace(limit=per_page))
+        last = resources[-1]['pk'] if resources else after
+        cursor = query.encode_cursor(last) if last is not None else None
+        return gitcoin.query.KeysetPage(resources, cursor, len(resources) < per_page)
+
+    def fetch_pages(self, numbers=None, per_page=25, workers=4):
+        """Fetch pages concurrently and return their resources in page order.
+
+        'numbers' is an iterable of ascending page numbers and defaults to all
+        pages. At most 'workers' pages are in flight at once on a thread pool
+        sharing this endpoint's session, so its pool size should be at least
+        'workers'. The first short page marks the end of the list, pages still
+        queued after it are cancelled.
+        """
+        params = self.freeze()
+        numbers = iter(numbers) if numbers is not None else itertools.count(1)
+        pending = collections.deque()
+        resources = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def submit_next():
+                for number in itertools.islice(numbers, 1):
+                    pending.append(executor.submit(self._fetch_page, params, number, per_page))
+
+            for _ in range(workers):
+                submit_next()
+            while pending:
+                page = pending.popleft().result()
+                resources.extend(page)
+                if len(page) < per_page:
+                    for future in pending:
+                        future.cancel()
+                    break
+                submit_next()
+        return resources
+
+    def stream(self, chunk_size=65536):
+        """Iterate over all resources while the response is still being received.
 
-    def all(self):
-        """List all resources."""
-        self._del_param('limit')
-        self._del_param('offset')
-        return self._request_get()
+        The list is parsed incrementally, so the raw body and the decoded list
+        are never held in memory at the same time. Responses are not cached.
+        """
+        for resource in self._stream_resources(chunk_size):
+            yield self._to_model(resource)
+
+    def _stream_resources(self, chunk_size):
+        """Iterate over all resources as decoded, without projection or model."""
+        with self._open_stream(self._unpaged_query(), chunk_size) as (response, chunks):
+            response.raise_for_status()  # Let API consumer know about HTTP errors.
+            loads = self.loads if self.loads is not gitcoin.decoding.loads else None  # Only a custom decoder.
+            yield from gitcoin.decoding.iter_array(chunks, loads=loads)
+
+    @contextlib.contextmanager
+    def _open_stream(self, params, chunk_size, headers=None):
+        """Send a streamed GET request, yielding the response and an iterator over its body chunks.
+
+        The response is closed on exit. Hooks get the event once the body was
+        read, see `gitcoin.instrumentation.RequestEvent`.
+        """
+        if not self.hooks:
+            response = self._send(self.url, params, headers=headers, stream=True)
+            try:
+                yield response, response.iter_content(chunk_size=chunk_size)
+            finally:
+                response.close()
+            return
+        event = gitcoin.instrumentation.RequestEvent(self.url, params)
+        received = [0]
+
+        def count(chunks):
+            for chunk in chunks:
+                received[0] += len(chunk)
+                yield chunk
+
+        try:
+            started = time.perf_counter()
+            response = self._send(self.url, params, headers=headers, stream=True)
+            try:
+                yield response, count(response.iter_content(chunk_size=chunk_size))
+            finally:
+                response.close()
+                event.record_response(response, time.perf_counter() - started, size=received[0])
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            event.finish()
+            for hook in self.hooks:
+                hook(event)
+
+    def to_columns(self, fields=None, chunk_size=65536):
+        """Stream all resources into typed columns, see `gitcoin.columns.Columns`.
+
+        'fields' defaults to those asked for with `only()`, or else all but
+        the nested ones, less those deferred.
+        """
+        if fields is None:
+            fields = gitcoin.validation.FIELDS if self.only_fields is not None else gitcoin.columns.DEFAULT_FIELDS
+            fields = [name for name in fields if self._keeps(name)]
+        return gitcoin.columns.Columns(fields).extend(self._stream_resources(chunk_size))
+
+    def to_numpy_columns(self, fields=None):
+        """Get all resources as dict of numpy arrays by field name, see `to_columns()`."""
+        return self.to_columns(fields).to_numpy_columns()
+
+    def to_arrow(self, fields=None):
+        """Get all resources as `pyarrow.Table`, see `to_columns()`."""
+        return self.to_columns(fields).to_arrow()
+
+    def to_dataframe(self, fields=None):
+        """Get all resources as `pandas.DataFrame`, see `to_columns()`."""
+        return self.to_columns(fields).to_dataframe()
+
+    def dump(self, path, format='jsonl.gz', chunk_size=1000, append=False):
+        """Write all resources into a compressed snapshot file, see `gitcoin.snapshot`.
+
+        Resources are streamed from the response into the file as decoded,
+        'chunk_size' per compressed frame, keeping only the wanted fields.
+        Returns the number of resources in the file.
+        """
+        resources = self._stream_resources(chunk_size=65536)
+        if self.only_fields is not None or self.deferred_fields:
+            resources = map(self._project, resources)
+        with gitcoin.snapshot.SnapshotWriter(path, format=format, chunk_size=chunk_size, append=append) as writer:
+            writer.write_many(resources)
+        return writer.count
+
+    def all(self, parallel=None, per_page=100):
+        """List all resources.
+
+        With 'parallel' set to a number of workers, the list is fetched in
+        pages of 'per_page' resources, see `fetch_pages()`.
+        """
+        if parallel:
+            return self.fetch_pages(per_page=per_page, workers=parallel)
+        return self._request_get(params=self._unpaged_query())
+
+    def where(self, **lookups):
+        """Filter by arbitrary predicates, e.g. `value_in_usdt__gt=500`, see `gitcoin.planner.Plan`.
+
+        Predicates the API can evaluate are pushed down as filter params, the
+        others are tested locally while the pages are fetched. Returns a plan
+        to iterate over, `limit()` or `explain()`.
+        """
+        return gitcoin.planner.Plan(self).where(**lookups)
+
+    def sync(self, store, per_page=100):
+        """Sync resources matching the filters incrementally, see `gitcoin.sync.IncrementalSync`."""
+        return gitcoin.sync.IncrementalSync(self, store, per_page=per_page)
+
+    def watch(self, interval=60.0, initial=True):
+        """Follow changes of the resources matching the filters, see `gitcoin.sync.ChangeFeed`."""
+        return gitcoin.sync.ChangeFeed(self, interval=interval, initial=initial)
 
     def get(self, primary_key):
         """Retrieve one resource by primary key."""
         return self._request_get(''.join((self.url, str(primary_key))))
 
-    def _request_get(self, url=None):
+    def get_many(self, primary_keys, concurrency=4, key_field=None, batch_size=50):
+        """Retrieve many resources by primary key concurrently.
+
+        Duplicate keys are requested only once. A failing key does not abort
+        the others, its exception is collected in the result's 'errors'.
+
+        With 'key_field', the keys are looked up via that multi-value filter
+        instead, 'batch_size' keys per request, e.g. with
+        `key_field='standard_bounties_id'`. Other filters of this endpoint
+        apply to those requests, too.
+        """
+        keys = list(collections.OrderedDict.fromkeys(primary_keys))
+        if key_field:
+            is_multiple, _ = self.config.get(key_field)
+            if not is_multiple:
+                msg = 'Cannot batch keys via single value param "{name}".'
+                raise ValueError(msg.format(name=key_field))
+            if not self._keeps(key_field):
+                msg = 'Cannot batch keys via field "{name}" left out of resources.'
+                raise ValueError(msg.format(name=key_field))
+            params = self.freeze()
+            batches = [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+            fetch = functools.partial(self._get_batch, params, key_field)
+        else:
+            batches = [[key] for key in keys]
+            fetch = self._get_batch_by_url
+        result = BulkResult()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for found, errors in executor.map(fetch, batches):
+                result.update(found)
+                result.errors.update(errors)
+        return result
+
+    def _get_batch_by_url(self, keys):
+        """Retrieve resources one by one, returning found resources and errors by key."""
+        found, errors = {}, {}
+        for key in keys:
+            try:
+                found[key] = self.get(key)
+            except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+                errors[key] = e
+        return found, errors
+
+    def _get_batch(self, params, key_field, keys):
+        """Retrieve resources in one list request, returning found resources and errors by key."""
+        found, errors = {}, {}
+        _, normalize = self.config.get(key_field)
+        try:
+            values = [str(normalize(key) if callable(normalize) else key) for key in keys]
+            resources = self._request_get(params=params.replace(**{key_field: ','.join(values)}))
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return found, {key: e for key in keys}
+        # The API matches list filters by substring, so map results back by exact value.
+        by_value = {}
+        for resource in resources:
+            by_value.setdefault(str(resource.get(key_field)), resource)
+        for key, value in zip(keys, values):
+            if value in by_value:
+                found[key] = by_value[value]
+            else:
+                msg = 'No resource with {name}={value}.'
+                errors[key] = KeyError(msg.format(name=key_field, value=value))
+        return found, errors
+
+    def _request_get(self, url=None, params=None):
         """Fire the actual HTTP GET request as configured."""
         url = url if url else self.url
-        params = self._prep_get_params()
-        response = requests.get(url, params=params)
+        params = params if params is not None else self.freeze()
+        if self.single_flight is not None:
+            key = gitcoin.cache.Cache.make_key(url, params)
+            return self._to_model(self.single_flight.do(key, lambda: self._get_json(url, params)))
+        return self._to_model(self._get_json(url, params))
+
+    def _get_json(self, url, params):
+        """Get the decoded response body, reporting the request to the hooks, if any."""
+        if not self.hooks:
+            return self._fetch_json(url, params)
+        event = gitcoin.instrumentation.RequestEvent(url, params)
+        try:
+            return self._fetch_json(url, params, event)
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            event.finish()
+            for hook in self.hooks:
+                hook(event)
+
+    def _fetch_json(self, url, params, event=None):
+        """Get the decoded response body, from the cache if possible."""
+        if self.cache is not None:
+            return self._cached_get(url, params, event)
+        response = self._timed_send(url, params, event=event)
         response.raise_for_status()  # Let API consumer know about HTTP errors.
-        return response.json()
+        return self._decode(response.content, event)
 
-    def _prep_get_params(self):
-        """Send multi-value fields separated by comma."""
-        return {name: ','.join(value) for name, value in self.params.items()}
+    def _cached_get(self, url, params, event=None):
+        """Serve fresh responses from the cache, revalidating stale ones if possible."""
+        key = self.cache.make_key(url, params)
+        entry = self.cache.get(key)
+        if entry is not None and entry.is_fresh(self.cache.ttl):
+            self.cache.hits += 1
+            if event is not None:
+                event.cache = 'hit'
+            return self._decode(entry.content, event)
+        headers = entry.conditional_headers() if entry is not None else None
+        response = self._timed_send(url, params, headers=headers, event=event)
+        if entry is not None and response.status_code == 304:
+            self.cache.revalidated += 1
+            if event is not None:
+                event.cache = 'revalidated'
+            entry.stored_at = time.time()
+            self.cache.set(key, entry)
+            return self._decode(entry.content, event)
+        response.raise_for_status()  # Let API consumer know about HTTP errors.
+        self.cache.misses += 1
+        if event is not None:
+            event.cache = 'miss'
+        result = self._decode(response.content, event)
+        entry = gitcoin.cache.CacheEntry(
+            response.content, etag=response.headers.get('ETag'), last_modified=response.headers.get('Last-Modified')
+        )
+        self.cache.set(key, entry)
+        return result
+
+    def _decode(self, content, event=None):
+        """Parse the JSON body, timing it for the event, if any."""
+        if event is None:
+            return self.loads(content)
+        started = time.perf_counter()
+        result = self.loads(content)
+        event.phases['decode'] = time.perf_counter() - started
+        return result
+
+    def _timed_send(self, url, params, headers=None, event=None):
+        """Send the HTTP GET request, recording the response in the event, if any."""
+        if event is None:
+            return self._send(url, params, headers=headers)
+        started = time.perf_counter()
+        response = self._send(url, params, headers=headers)
+        event.record_response(response, time.perf_counter() - started)
+        return response
+
+    def _send(self, url, params, headers=None, stream=False):
+        """Send the HTTP GET request via the session or transport, if any, see `gitcoin.transport.Transport`."""
+        http = self.session if self.session else requests
+        if isinstance(params, gitcoin.query.Query):
+            params = params.encoded  # Skip encoding the parameters again.
+        if self.scheduler is not None:
+            return self.scheduler.call(lambda: http.get(url, params=params, headers=headers, stream=stream))
+        return http.get(url, params=params, headers=headers, stream=stream)
 
 
 class Gitcoin:
     """Provide main API entry point."""
 
-    def __init__(self):
-        """Set defaults."""
+    def __init__(self, pool_connections=10, pool_maxsize=10, max_retries=0):
+        """Set defaults.
+
+        The pool arguments configure the default HTTP adapters of the shared
+        session, see `requests.adapters.HTTPAdapter` for their meaning.
+        """
         self.classes = {}
         self.set_class('endpoint', Endpoint)
         self.set_class('bounties_list_config', BountyConfig)
+        self.set_class('session', requests.Session)
+        self.set_class('http_adapter', requests.adapters.HTTPAdapter)
         self.urls = {}
         self.set_url('bounties', 'https://gitcoin.co/api/v0.1/bounties/')
+        self.adapters = {}
+        self._session = None
+        self.cache = None
+        self.loads = None
+        self.scheduler = None
+        self.single_flight = None
+        self.hooks = []
+        for prefix in ('https://', 'http://'):
+            self.set_adapter(
+                prefix, pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=max_retries
+            )
+
+    def __enter__(self):
+        """Use the API root object as context manager, closing the session on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the shared session."""
+        self.close()
 
     def set_class(self, cls_id, cls):
         """Inject class dependency, overriding the default class."""
@@ -154,10 +712,78 @@ class Gitcoin:
         """Configure API URL, overriding the default URL."""
         self.urls[cls_id] = url
 
+    def set_cache(self, cache):
+        """Cache responses of all endpoints created from now on, e.g. in a `gitcoin.cache.MemoryCache`."""
+        self.cache = cache
+
+    def set_scheduler(self, scheduler):
+        """Rate-limit and retry requests of all endpoints created from now on, see `gitcoin.scheduler.Scheduler`."""
+        self.scheduler = scheduler
+
+    def set_single_flight(self, single_flight):
+        """Share one request among identical concurrent ones, see `gitcoin.singleflight.SingleFlight`."""
+        self.single_flight = single_flight
+
+    def add_hook(self, hook):
+        """Call 'hook' with a `gitcoin.instrumentation.RequestEvent` after each request of all endpoints."""
+        self.hooks.append(hook)
+
+    def set_decoder(self, loads):
+        """Parse JSON responses of all endpoints created from now on with 'loads', e.g. `orjson.loads`."""
+        self.loads = loads
+
+    def set_adapter(self, prefix, **kwargs):
+        """Configure the HTTP adapter for all URLs starting with 'prefix'.
+
+        Use this for per-host connection pool settings, e.g.
+        `api.set_adapter('https://gitcoin.co/', pool_maxsize=50)`.
+        """
+        self.adapters[prefix] = kwargs
+        if self._session is not None:
+            self._mount_adapter(self._session, prefix)
+
+    def _mount_adapter(self, session, prefix):
+        """Mount a freshly configured HTTP adapter onto the session, if supported."""
+        if hasattr(session, 'mount'):
+            adapter_class = self.classes['http_adapter']
+            session.mount(prefix, adapter_class(**self.adapters[prefix]))
+
+    @property
+    def session(self):
+        """Provide the HTTP session shared by all endpoints, creating it on first use.
+
+        Connections in the session's pools are kept alive and reused across
+        requests until `close()` is called. Responses are requested compressed
+        with every coding that can be decoded, see `ACCEPT_ENCODING`.
+        """
+        if self._session is None:
+            session = self.classes['session']()
+            if hasattr(session, 'headers'):
+                session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+            for prefix in self.adapters:
+                self._mount_adapter(session, prefix)
+            self._session = session
+        return self._session
+
+    def close(self):
+        """Close the shared session and all its pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     @property
     def bounties(self):
         """Wrap the 'bounties' API endpoint."""
         url = self.urls['bounties']
         endpoint_class = self.classes['endpoint']
         config_class = self.classes['bounties_list_config']
-        return endpoint_class(url, config_class())
+        return endpoint_class(
+            url,
+            config_class(),
+            session=self.session,
+            cache=self.cache,
+            loads=self.loads,
+            scheduler=self.scheduler,
+            single_flight=self.single_flight,
+            hooks=self.hooks
+        )
@@ -0,0 +1,332 @@
+"""Decode Gitcoin API resources into typed columns for numpy, pandas and Arrow.
+
+Each resource is appended field by field to compact column buffers while
+the list is being decoded, so no list of dicts is built. Column types are
+taken from `gitcoin.validation.TYPES`:
+
+- 'int', 'float' and 'bool' fields fill `array.array` buffers, with a
+  validity byte per value for missing ones,
+- 'datetime' fields fill microseconds since the epoch (UTC),
+- 'category' fields, the enums like 'idx_status', are dictionary encoded:
+  an `array.array` of codes indexes a list of labels, -1 marks missing ones,
+- 'str' and 'object' fields are kept in plain lists.
+
+numpy, pandas and pyarrow are only imported by the matching conversion.
+"""
+
+import array
+import datetime
+import json
+
+import gitcoin.models
+import gitcoin.validation
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def _to_datetime(value):
+    """Convert an ISO 8601 date time to microseconds since the epoch, naive ones taken as UTC."""
+    return (gitcoin.models.to_utc_datetime(value) - _EPOCH) // _MICROSECOND
+
+
+def _numpy():
+    """Import numpy only when needed."""
+    import numpy
+    return numpy
+
+
+class _ArrayColumn:
+    """Collect the values of one numeric field in an `array.array`."""
+
+    typecode = 'q'
+    dtype = 'int64'
+    null = 0
+    convert = staticmethod(int)
+
+    def __init__(self, name):
+        """Start empty."""
+        self.name = name
+        self.values = array.array(self.typecode)
+        self.valid = bytearray()
+        self.nulls = 0
+
+    def __len__(self):
+        """Tell the number of values."""
+        return len(self.values)
+
+    def append(self, value):
+        """Add one value, missing or unparsable ones as null."""
+        try:
+            value = self.convert(value) if value is not None else None
+        except (TypeError, ValueError):
+            value = None
+        if value is None:
+            self.values.append(self.null)
+            self.valid.append(0)
+            self.nulls += 1
+        else:
+            self.values.append(value)
+            self.valid.append(1)
+
+    def _numpy(self):
+        """Get values and null mask as numpy arrays sharing the buffers."""
+        numpy = _numpy()
+        if not self.values:
+            return numpy.empty(0, dtype=self.dtype), numpy.empty(0, dtype=bool)
+        values = numpy.frombuffer(self.values, dtype=self.dtype)
+        mask = numpy.frombuffer(self.valid, dtype=numpy.uint8) == 0
+        return values, mask
+
+    def to_numpy(self):
+        """Get a numpy array, a masked one if values are missing."""
+        numpy = _numpy()
+        values, mask = self._numpy()
+        return numpy.ma.masked_array(values, mask=mask) if self.nulls else values
+
+    def to_pandas(self, pandas):
+        """Get a pandas array, a nullable integer one if values are missing."""
+        values, mask = self._numpy()
+        return pandas.arrays.IntegerArray(values.copy(), mask.copy()) if self.nulls else values.copy()
+
+    def to_arrow(self, pyarrow):
+        """Get an Arrow array."""
+        values, mask = self._numpy()
+        return pyarrow.array(values, mask=mask if self.nulls else None, type=pyarrow.int64())
+
+
+class _FloatColumn(_ArrayColumn):
+    """Collect the values of one decimal field as floats, missing ones as NaN."""
+
+    typecode = 'd'
+    dtype = 'float64'
+    null = float('nan')
+    convert = staticmethod(float)
+
+    def to_numpy(self):
+        """Get a numpy array, NaN where values are missing."""
+        return self._numpy()[0]
+
+    def to_pandas(self, pandas):
+        """Get a numpy array, NaN where values are missing."""
+        return self._numpy()[0].copy()
+
+    def to_arrow(self, pyarrow):
+        """Get an Arrow array, null where values are missing."""
+        values, mask = self._numpy()
+        return pyarrow.array(values, mask=mask if self.nulls else None, type=pyarrow.float64())
+
+
+class _BoolColumn(_ArrayColumn):
+    """Collect the values of one boolean field."""
+
+    typecode = 'b'
+    dtype = 'bool'
+
+    convert = staticmethod(gitcoin.models.to_bool)
+
+    def _numpy(self):
+        """Get values and null mask as numpy arrays, the values sharing the buffer."""
+        values, mask = super()._numpy()
+        return values.view(bool) if len(values) else values, mask
+
+    def to_pandas(self, pandas):
+        """Get a pandas array, a nullable boolean one if values are missing."""
+        values, mask = self._numpy()
+        return pandas.arrays.BooleanArray(values.copy(), mask.copy()) if self.nulls else values.copy()
+
+    def to_arrow(self, pyarrow):
+        """Get an Arrow array."""
+        values, mask = self._numpy()
+        return pyarrow.array(values, mask=mask if self.nulls else None, type=pyarrow.bool_())
+
+
+class _DatetimeColumn(_ArrayColumn):
+    """Collect the values of one date time field as microseconds since the epoch."""
+
+    convert = staticmethod(_to_datetime)
+
+    def to_numpy(self):
+        """Get a numpy array of UTC date times, NaT where values are missing."""
+        numpy = _numpy()
+        values, mask = self._numpy()
+        values = values.view('datetime64[us]')
+        if self.nulls:
+            values = values.copy()
+            values[mask] = numpy.datetime64('NaT')
+        return values
+
+    def to_pandas(self, pandas):
+        """Get a pandas array of UTC date times, NaT where values are missing."""
+        return pandas.DatetimeIndex(self.to_numpy()).tz_localize('UTC')
+
+    def to_arrow(self, pyarrow):
+        """Get an Arrow array of UTC timestamps."""
+        values, mask = self._numpy()
+        return pyarrow.array(values, mask=mask if self.nulls else None, type=pyarrow.timestamp('us', tz='UTC'))
+
+
+class _CategoryColumn:
+    """Dictionary encode the values of one enum field.
+
+    Labels of known enums, see `gitcoin.validation.OPTIONS`, come first in
+    their documented order, unexpected values are added as they appear.
+    """
+
+    def __init__(self, name):
+        """Start empty."""
+        self.name = name
+        self.labels = list(gitcoin.validation.OPTIONS.get(name, []))
+        self.codes = array.array('i')
+        self._code_of = {label: code for code, label in enumerate(self.labels)}
+
+    def __len__(self):
+        """Tell the number of values."""
+        return len(self.codes)
+
+    def append(self, value):
+        """Add one value, missing ones as code -1."""
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._code_of.get(value)
+        if code is None:
+            code = self._code_of[value] = len(self.labels)
+            self.labels.append(value)
+        self.codes.append(code)
+
+    def to_numpy(self):
+        """Get the codes as numpy array sharing the buffer, see 'labels' for their meaning."""
+        numpy = _numpy()
+        if not self.codes:
+            return numpy.empty(0, dtype=numpy.intc)
+        return numpy.frombuffer(self.codes, dtype=numpy.intc)
+
+    def to_pandas(self, pandas):
+        """Get a pandas categorical."""
+        return pandas.Categorical.from_codes(self.to_numpy(), categories=self.labels)
+
+    def to_arrow(self, pyarrow):
+        """Get an Arrow dictionary array."""
+        codes = self.to_numpy()
+        indices = pyarrow.array(codes, mask=codes < 0, type=pyarrow.int32())
+        return pyarrow.DictionaryArray.from_arrays(indices, pyarrow.array(self.labels, type=pyarrow.string()))
+
+
+class _ListColumn:
+    """Collect the values of one string or nested field in a list."""
+
+    def __init__(self, name):
+        """Start empty."""
+        self.name = name
+        self.values = []
+
+    def __len__(self):
+        """Tell the number of values."""
+        return len(self.values)
+
+    def append(self, value):
+        """Add one value."""
+        self.values.append(value)
+
+    def to_numpy(self):
+        """Get a numpy array of Python objects."""
+        numpy = _numpy()
+        values = numpy.empty(len(self.values), dtype=object)
+        for i, value in enumerate(self.values):
+            values[i] = value  # Assigning one by one keeps nested lists from becoming dimensions.
+        return values
+
+    def to_pandas(self, pandas):
+        """Get a numpy array of Python objects."""
+        return self.to_numpy()
+
+    def to_arrow(self, pyarrow):
+        """Get an Arrow string array."""
+        return pyarrow.array(self.values, type=pyarrow.string())
+
+
+class _ObjectColumn(_ListColumn):
+    """Collect the values of one nested field in a list."""
+
+    def to_arrow(self, pyarrow):
+        """Get an Arrow string array of compact JSON, nested values vary too much for Arrow types."""
+        values = [json.dumps(value, separators=(',', ':')) if value is not None else None for value in self.values]
+        return pyarrow.array(values, type=pyarrow.string())
+
+
+_COLUMN_CLASSES = {
+    'int': _ArrayColumn,
+    'float': _FloatColumn,
+    'bool': _BoolColumn,
+    'datetime': _DatetimeColumn,
+    'category': _CategoryColumn,
+    'str': _ListColumn,
+    'object': _ObjectColumn,
+}
+
+# Fields collected unless others are asked for: all but the nested ones.
+DEFAULT_FIELDS = tuple(name for name in gitcoin.validation.FIELDS if gitcoin.validation.TYPES[name] != 'object')
+
+
+class Columns:
+    """Build typed columns from resources, one resource at a time."""
+
+    def __init__(self, fields=None):
+        """Prepare one column per field, see `gitcoin.validation.FIELDS`, all but the nested ones by default."""
+        self.fields = tuple(gitcoin.validation.field(name) for name in fields) if fields else DEFAULT_FIELDS
+        self.columns = {
+            name: _COLUMN_CLASSES[gitcoin.validation.TYPES[name]](name)
+            for name in self.fields
+        }
+        self._appenders = [(name, self.columns[name].append) for name in self.fields]
+        self.length = 0
+
+    def __len__(self):
+        """Tell the number of resources collected."""
+        return self.length
+
+    def append(self, resource):
+        """Add the fields of one decoded resource."""
+        get = resource.get
+        for name, append in self._appenders:
+            append(get(name))
+        self.length += 1
+
+    def extend(self, resources):
+        """Add the fields of all given resources."""
+        for resource in resources:
+            self.append(resource)
+        return self
+
+    def labels(self, name):
+        """Get the labels the codes of a category column refer to."""
+        return self.columns[name].labels
+
+    def to_numpy_columns(self):
+        """Get a dict of numpy arrays by field name, needs `numpy`.
+
+        Numeric columns share memory with the column buffers. Integer, boolean
+        and date time columns with missing values are masked arrays, category
+        columns hold codes, see `labels()`.
+        """
+        return {name: self.columns[name].to_numpy() for name in self.fields}
+
+    def to_arrow(self):
+        """Get a `pyarrow.Table`, needs `pyarrow`.
+
+        Category columns are dictionary arrays, nested fields compact JSON strings.
+        """
+        import pyarrow
+        arrays = [self.columns[name].to_arrow(pyarrow) for name in self.fields]
+        return pyarrow.Table.from_arrays(arrays, names=list(self.fields))
+
+    def to_dataframe(self):
+        """Get a `pandas.DataFrame`, needs `pandas`.
+
+        Category columns are categoricals, integer and boolean columns with
+        missing values use pandas' nullable types.
+        """
+        import pandas
+        data = {name: self.columns[name].to_pandas(pandas) for name in self.fields}
+        return pandas.DataFrame(data, columns=list(self.fields))
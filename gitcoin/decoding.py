@@ -0,0 +1,97 @@
+"""Decode JSON responses for the Gitcoin API client.
+
+The fastest installed JSON parser is used: `orjson`, then `ujson`, then
+the standard library. Install one with `pip install gitcoin[fast]`.
+"""
+
+import codecs
+import json
+import re
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Characters starting a JSON number, and those which may follow where the scanner stopped within one.
+_NUMBER_START = frozenset('-0123456789')
+_NUMBER_REST = frozenset('0123456789.eE+-')
+_decoder = json.JSONDecoder()
+_loads = None
+
+
+def _stdlib_loads(data):
+    """Parse with the standard library, accepting bytes."""
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def find_loads():
+    """Find the fastest installed JSON parser."""
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        pass
+    try:
+        import ujson
+        return ujson.loads
+    except ImportError:
+        pass
+    return _stdlib_loads
+
+
+def loads(data):
+    """Parse one JSON document from bytes or str with the fastest installed parser."""
+    global _loads
+    if _loads is None:
+        _loads = find_loads()
+    return _loads(data)
+
+
+def iter_array(chunks, loads=None, raw=False):
+    """Parse a top-level JSON array incrementally, yielding each element once complete.
+
+    'chunks' is an iterable of UTF-8 encoded bytes, e.g. `response.iter_content()`.
+    Only the current chunk and the element being parsed are held in memory.
+    Elements are parsed by the standard library's C scanner, which finds
+    their end in the same pass. With 'loads', the JSON text of each element
+    is parsed by it instead, as bytes. With 'raw', each element is yielded
+    along with its JSON text.
+    """
+    decode = codecs.getincrementaldecoder('utf-8')().decode
+    buffer = ''
+    position = 0
+    expected = '['
+    for chunk in chunks:
+        buffer += decode(chunk)
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position == len(buffer):
+                break
+            char = buffer[position]
+            if expected == '[':
+                if char != '[':
+                    raise ValueError('Expected a JSON array.')
+                position += 1
+                expected = 'value or ]'
+            elif char == ']' and expected != 'value':
+                return
+            elif expected == ', or ]':
+                if char != ',':
+                    raise ValueError('Expected "," or "]" in JSON array.')
+                position += 1
+                expected = 'value'
+            else:
+                try:
+                    value, end = _decoder.raw_decode(buffer, position)
+                except ValueError:
+                    break  # Incomplete, wait for the next chunk.
+                if char in _NUMBER_START and (end == len(buffer) or buffer[end] in _NUMBER_REST):
+                    break  # The number may continue in the next chunk, e.g. after "1." or "1e".
+                text = buffer[position:end]
+                if loads is not None:
+                    value = loads(text.encode('utf-8'))
+                yield (value, text) if raw else value
+                position = end
+                expected = ', or ]'
+        buffer = buffer[position:]
+        position = 0
+    raise ValueError('Incomplete JSON array.')
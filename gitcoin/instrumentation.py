@@ -0,0 +1,185 @@
+"""Instrument requests of the Gitcoin API client.
+
+Register a hook with `Gitcoin.add_hook()`. It is called with one
+`RequestEvent` after every request, successful or not. Without hooks,
+no measurements are taken at all.
+"""
+
+import bisect
+import collections
+import math
+import threading
+import time
+
+
+class RequestEvent:
+    """Describe one request to the API.
+
+    'phases' holds durations in seconds:
+
+    - 'server': from sending the request until the response headers arrived,
+      i.e. DNS lookup, connect, TLS handshake and server processing, as
+      measured by `requests` for the last attempt,
+    - 'download': the rest of the request until the body was received,
+      including waits between retries,
+    - 'decode': parsing the JSON body,
+    - 'total': all of the above, including cache lookups.
+
+    Streamed responses, e.g. of `Endpoint.stream()`, are parsed while they
+    are downloaded, so their 'download' phase includes decoding.
+    """
+
+    def __init__(self, url, params):
+        """Start measuring."""
+        self.url = url
+        self.params = params
+        self.status = None
+        self.bytes = 0
+        self.cache = None  # 'hit', 'miss' or 'revalidated' when a cache is used.
+        self.retries = 0
+        self.error = None
+        self.phases = {}
+        self.started_at = time.perf_counter()
+
+    def record_response(self, response, seconds, size=None):
+        """Record status, size and timings of a response received in 'seconds'.
+
+        Pass the 'size' of streamed bodies, which are not kept by the response.
+        """
+        self.status = response.status_code
+        self.bytes = len(response.content) if size is None else size
+        self.retries = getattr(response, 'retries', 0)
+        server = response.elapsed.total_seconds() if response.elapsed else 0.0
+        self.phases['server'] = min(server, seconds)
+        self.phases['download'] = seconds - self.phases['server']
+
+    def finish(self):
+        """Stop measuring."""
+        self.phases['total'] = time.perf_counter() - self.started_at
+
+
+class Histogram:
+    """Count observations in exponentially growing buckets."""
+
+    def __init__(self, start=0.0001, factor=2.0, buckets=24):
+        """Define bucket upper bounds from 'start' growing by 'factor'."""
+        self.bounds = [start * factor**i for i in range(buckets)]
+        self.counts = [0] * (buckets + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """Count one observation."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Estimate the 'q' quantile as the upper bound of its bucket."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else math.inf
+        return math.inf
+
+    def summary(self):
+        """Summarize count, mean and quantiles."""
+        return {
+            'count': self.count,
+            'mean': self.sum / self.count if self.count else None,
+            'p50': self.quantile(0.5),
+            'p90': self.quantile(0.9),
+            'p99': self.quantile(0.99),
+        }
+
+
+class HistogramAggregator:
+    """Aggregate request events in process, usable as hook."""
+
+    def __init__(self):
+        """Start without observations."""
+        self.phases = collections.defaultdict(Histogram)
+        self.statuses = collections.Counter()
+        self.cache = collections.Counter()
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        """Record one request event."""
+        with self._lock:
+            self.requests += 1
+            self.errors += event.error is not None
+            self.retries += event.retries
+            self.bytes += event.bytes
+            if event.status is not None:
+                self.statuses[event.status] += 1
+            if event.cache is not None:
+                self.cache[event.cache] += 1
+            for phase, seconds in event.phases.items():
+                self.phases[phase].observe(seconds)
+
+    def summary(self):
+        """Summarize all recorded events."""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'errors': self.errors,
+                'retries': self.retries,
+                'bytes': self.bytes,
+                'statuses': dict(self.statuses),
+                'cache': dict(self.cache),
+                'phases': {phase: histogram.summary() for phase, histogram in self.phases.items()},
+            }
+
+
+class PrometheusHook:
+    """Export request events as Prometheus metrics, needs `prometheus_client`."""
+
+    def __init__(self, registry=None, prefix='gitcoin_client'):
+        """Register the metrics, importing prometheus_client only now."""
+        import prometheus_client
+        kwargs = {'registry': registry} if registry is not None else {}
+        self.duration = prometheus_client.Histogram(
+            prefix + '_phase_seconds', 'Duration of request phases.', ['phase'], **kwargs
+        )
+        self.requests = prometheus_client.Counter(
+            prefix + '_requests', 'Requests by status and cache use.', ['status', 'cache'], **kwargs
+        )
+        self.retries = prometheus_client.Counter(prefix + '_retries', 'Retried requests.', **kwargs)
+        self.bytes = prometheus_client.Counter(prefix + '_response_bytes', 'Received body bytes.', **kwargs)
+
+    def __call__(self, event):
+        """Record one request event."""
+        for phase, seconds in event.phases.items():
+            self.duration.labels(phase=phase).observe(seconds)
+        self.requests.labels(status=str(event.status), cache=str(event.cache)).inc()
+        self.retries.inc(event.retries)
+        self.bytes.inc(event.bytes)
+
+
+class OpenTelemetryHook:
+    """Export request events as OpenTelemetry metrics, needs `opentelemetry-api`."""
+
+    def __init__(self, meter=None):
+        """Create the instruments, importing opentelemetry only now."""
+        from opentelemetry import metrics
+        meter = meter if meter is not None else metrics.get_meter('gitcoin.client')
+        self.duration = meter.create_histogram('gitcoin.client.phase.duration', unit='s')
+        self.requests = meter.create_counter('gitcoin.client.requests')
+        self.retries = meter.create_counter('gitcoin.client.retries')
+        self.bytes = meter.create_counter('gitcoin.client.response.bytes', unit='By')
+
+    def __call__(self, event):
+        """Record one request event."""
+        for phase, seconds in event.phases.items():
+            self.duration.record(seconds, {'phase': phase})
+        self.requests.add(1, {'status': str(event.status), 'cache': str(event.cache)})
+        self.retries.add(event.retries)
+        self.bytes.add(event.bytes)
@@ -0,0 +1,205 @@
+"""Define compact typed models for Gitcoin API resources."""
+
+import datetime
+import decimal
+import json
+import re
+import sys
+
+import gitcoin.validation
+
+# Field types are registered once in `gitcoin.validation.TYPES`.
+DATETIME_FIELDS = frozenset(name for name, type in gitcoin.validation.TYPES.items() if type == 'datetime')
+DECIMAL_FIELDS = frozenset(name for name, type in gitcoin.validation.TYPES.items() if type == 'float')
+BLOB_FIELDS = frozenset(['raw_data', 'metadata'])
+# Fields with few distinct values, interned to share one string per value.
+INTERNED_FIELDS = frozenset(name for name, type in gitcoin.validation.TYPES.items() if type == 'category')
+
+_DATETIME_RE = re.compile(
+    r'^(\d{4})-(\d\d)-(\d\d)[T ](\d\d):(\d\d):(\d\d)(?:\.(\d{1,6})\d*)?(Z|[+-]\d\d:?\d\d)?$'
+)
+
+
+def parse_datetime(value):
+    """Parse an ISO 8601 date time as sent by the API, keeping other values as they are."""
+    match = _DATETIME_RE.match(value) if isinstance(value, str) else None
+    if match is None:
+        return value
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    tzinfo = None
+    if offset == 'Z':
+        tzinfo = datetime.timezone.utc
+    elif offset:
+        sign = -1 if offset[0] == '-' else 1
+        digits = offset[1:].replace(':', '')
+        delta = datetime.timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+        tzinfo = datetime.timezone(sign * delta)
+    microsecond = int((fraction or '0').ljust(6, '0'))
+    return datetime.datetime(
+        int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond, tzinfo=tzinfo
+    )
+
+
+def to_utc_datetime(value):
+    """Convert an ISO 8601 date time or a datetime, naive ones taken as UTC, raising ValueError for others."""
+    value = parse_datetime(value)
+    if not isinstance(value, datetime.datetime):
+        raise ValueError('Not a date time.')
+    return value.replace(tzinfo=datetime.timezone.utc) if value.tzinfo is None else value
+
+
+def to_bool(value):
+    """Accept booleans only, raising TypeError for other values."""
+    if not isinstance(value, bool):
+        raise TypeError('Not a boolean.')
+    return value
+
+
+def parse_decimal(value):
+    """Parse a token value exactly, keeping missing values as None."""
+    return None if value is None else decimal.Decimal(str(value))
+
+
+def pack_blob(value):
+    """Keep a nested structure as compact JSON bytes until it is accessed."""
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def unpack_blob(value):
+    """Decode a nested structure kept as compact JSON bytes, keeping missing values as None."""
+    return None if value is None else json.loads(value.decode('utf-8'))
+
+
+class _Field:
+    """Expose one slot of a model, converting its raw value on first access."""
+
+    __slots__ = ('slot', 'bit', 'convert')
+
+    def __init__(self, slot, bit, convert):
+        """Wrap the slot descriptor, 'bit' flags the converted state in the model's '_parsed'."""
+        self.slot = slot
+        self.bit = bit
+        self.convert = convert
+
+    def __get__(self, instance, owner):
+        """Get the converted value, None for missing fields."""
+        if instance is None:
+            return self
+        try:
+            value = self.slot.__get__(instance, owner)
+        except AttributeError:
+            return None
+        if self.convert is not None and not instance._parsed & self.bit:
+            value = self.convert(value)
+            self.slot.__set__(instance, value)
+            instance._parsed |= self.bit
+        return value
+
+
+class Bounty:
+    """Hold one bounty in slots instead of a dict.
+
+    Known fields are attributes, unknown ones are kept in a small dict.
+    Date times, token values and the nested 'raw_data'/'metadata' blobs are
+    converted on first access only. Item access works like for the plain
+    `dict` returned by default.
+    """
+
+    fields = gitcoin.validation.FIELDS
+    __slots__ = ('_parsed', '_extra') + tuple('_raw_' + name for name in fields)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a bounty from one decoded API resource."""
+        bounty = cls.__new__(cls)
+        bounty._parsed = 0
+        bounty._extra = None
+        slots = cls._slots
+        for name, value in data.items():
+            slot = slots.get(name)
+            if slot is None:
+                if bounty._extra is None:
+                    bounty._extra = {}
+                bounty._extra[name] = value
+                continue
+            if name in BLOB_FIELDS and value is not None:
+                value = pack_blob(value)
+            elif name in INTERNED_FIELDS and isinstance(value, str):
+                value = sys.intern(value)
+            slot.__set__(bounty, value)
+        return bounty
+
+    def __getattr__(self, name):
+        """Look up fields unknown to the model."""
+        extra = object.__getattribute__(self, '_extra')
+        if extra is not None and name in extra:
+            return extra[name]
+        msg = '"{cls}" has no field "{name}".'
+        raise AttributeError(msg.format(cls=type(self).__name__, name=name))
+
+    def __getitem__(self, name):
+        """Get a field like from the plain `dict`, raising KeyError for missing fields."""
+        if name in self._slots:
+            if not self._has(name):
+                raise KeyError(name)
+            return getattr(self, name)
+        if self._extra is not None and name in self._extra:
+            return self._extra[name]
+        raise KeyError(name)
+
+    def get(self, name, default=None):
+        """Get a field like from the plain `dict`."""
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def _has(self, name):
+        """Tell if the known field 'name' was set."""
+        try:
+            self._slots[name].__get__(self, type(self))
+        except AttributeError:
+            return False
+        return True
+
+    def to_dict(self):
+        """Convert back into a plain `dict` with converted values."""
+        data = {name: getattr(self, name) for name in self.fields if self._has(name)}
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __eq__(self, other):
+        """Compare field by field."""
+        if not isinstance(other, Bounty):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Show the primary key and title."""
+        return '<Bounty pk={pk!r} title={title!r}>'.format(pk=self.pk, title=self.title)
+
+
+def _converter(name):
+    """Choose the conversion applied on first access of field 'name'."""
+    if name in DATETIME_FIELDS:
+        return parse_datetime
+    if name in DECIMAL_FIELDS:
+        return parse_decimal
+    if name in BLOB_FIELDS:
+        return unpack_blob
+    return None
+
+
+def _add_fields(model):
+    """Expose the model's slots as fields converting on first access."""
+    model._slots = {}
+    for bit, name in enumerate(model.fields):
+        slot = getattr(model, '_raw_' + name)
+        model._slots[name] = slot
+        setattr(model, name, _Field(slot, 1 << bit, _converter(name)))
+
+
+_add_fields(Bounty)
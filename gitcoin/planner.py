@@ -0,0 +1,211 @@
+"""Plan queries with arbitrary predicates against the Gitcoin API.
+
+Predicates are given as Django-style lookups, e.g. `value_in_usdt__gt=500`.
+Those the API can evaluate are pushed down as query parameters to narrow
+the transfer, the residual ones filter the resources locally while pages
+are being received.
+"""
+
+import collections
+import itertools
+import operator
+
+import gitcoin.models
+import gitcoin.validation
+
+# Lookups and how they test a resource value against the operand, both converted to the field's type.
+LOOKUPS = {
+    'exact': operator.eq,
+    'iexact': lambda value, operand: str(value).lower() == str(operand).lower(),
+    'in': lambda value, operand: value in operand,
+    'gt': operator.gt,
+    'gte': operator.ge,
+    'lt': operator.lt,
+    'lte': operator.le,
+    'range': lambda value, operand: operand[0] <= value <= operand[1],
+    'contains': lambda value, operand: str(operand) in str(value),
+    'icontains': lambda value, operand: str(operand).lower() in str(value).lower(),
+    'startswith': lambda value, operand: str(value).startswith(str(operand)),
+    'endswith': lambda value, operand: str(value).endswith(str(operand)),
+    'isnull': None,  # Tested before conversion, see `Predicate.compile()`.
+}
+# Lookups comparing strings rather than values of the field's type.
+_TEXT_LOOKUPS = frozenset(['iexact', 'contains', 'icontains', 'startswith', 'endswith'])
+
+_CONVERTERS = {
+    'int': int,
+    'float': gitcoin.models.parse_decimal,
+    'bool': gitcoin.models.to_bool,
+    'datetime': gitcoin.models.to_utc_datetime,
+}
+
+
+class Predicate(collections.namedtuple('Predicate', ['field', 'lookup', 'operand'])):
+    """Test one field of decoded resources, e.g. `Predicate('value_in_usdt', 'gt', 500)`."""
+
+    __slots__ = ()
+
+    @classmethod
+    def parse(cls, name, operand):
+        """Parse one lookup like `title__icontains`, validating field and lookup names."""
+        field, _, lookup = name.partition('__')
+        if not lookup and field not in gitcoin.validation.FIELDS:
+            return cls(field, None, operand)  # A filter param which is no field, like "started".
+        gitcoin.validation.field(field)
+        lookup = lookup or 'exact'
+        if lookup not in LOOKUPS:
+            msg = 'Unknown lookup "{lookup}" for field "{name}".'
+            raise ValueError(msg.format(lookup=lookup, name=field))
+        if lookup in ('in', 'range'):
+            operand = tuple(operand)
+            if lookup == 'range' and len(operand) != 2:
+                raise ValueError('Lookup "range" needs a (low, high) pair.')
+        return cls(field, lookup, operand)
+
+    def __str__(self):
+        """Show the predicate as lookup."""
+        name = '__'.join((self.field, self.lookup)) if self.lookup and self.lookup != 'exact' else self.field
+        return '{name}={operand!r}'.format(name=name, operand=self.operand)
+
+    def compile(self):
+        """Get a function testing one decoded resource."""
+        field, lookup, operand = self.field, self.lookup, self.operand
+        if lookup is None:
+            msg = 'Cannot filter by param "{name}" locally.'
+            raise KeyError(msg.format(name=field))
+        if lookup == 'isnull':
+            return lambda resource: (resource.get(field) is None) == bool(operand)
+        convert = _CONVERTERS.get(gitcoin.validation.TYPES[field]) if lookup not in _TEXT_LOOKUPS else None
+        if convert is not None:
+            operand = tuple(convert(value) for value in operand) if lookup in ('in', 'range') else convert(operand)
+        test = LOOKUPS[lookup]
+
+        def matches(resource):
+            value = resource.get(field)
+            if value is None:
+                return False
+            try:
+                return test(convert(value) if convert is not None else value, operand)
+            except (TypeError, ValueError, ArithmeticError):
+                return False  # Unparsable values or ones of unexpected type match nothing.
+
+        return matches
+
+    def pushdown(self):
+        """Get the filter params expressing the predicate, and whether they match exactly.
+
+        Returns None if the API cannot evaluate the predicate. Params which
+        match more resources than the predicate still narrow the transfer,
+        but the predicate has to be tested locally, too.
+        """
+        field, lookup, operand = self.field, self.lookup, self.operand
+        if lookup is None:
+            return {field: [operand]}, True
+        if field == 'pk' and lookup in ('gt', 'gte') and isinstance(operand, int):
+            return {'pk__gt': [operand if lookup == 'gt' else operand - 1]}, True
+        server = gitcoin.validation.FILTER_LOOKUPS.get(field, (None, None))[1]
+        if server == 'exact' and lookup == 'exact' and isinstance(operand, bool):
+            return {field: [operand]}, True
+        if server == 'in' and lookup in ('exact', 'in'):
+            return {field: list(operand) if lookup == 'in' else [operand]}, True
+        if server == 'icontains':
+            if lookup == 'icontains' and ',' not in str(operand):
+                return {field: [operand]}, True
+            if lookup in ('exact', 'iexact', 'contains'):
+                return {field: [operand]}, False
+            if lookup == 'in':
+                return {field: list(operand)}, False
+        return None
+
+
+class Plan:
+    """Run a query with arbitrary predicates, see `gitcoin.client.Endpoint.where()`.
+
+    Predicates the API can evaluate are sent as filter params, unless the
+    endpoint sets these params already. The others are tested against each
+    resource of the paginated results, which are requested lazily, so
+    fetching stops as soon as `limit()` matches are found.
+    """
+
+    def __init__(self, endpoint, predicates=(), limit=None):
+        """Plan the predicates for the endpoint, whose filters, sorting, projection and model apply."""
+        self.source = endpoint
+        self.predicates = tuple(predicates)
+        self.max_count = limit
+        self.pushed = []
+        self.residual = []
+        self.endpoint = endpoint._clone()
+        self.endpoint.model = None
+        taken = set(endpoint.params)
+        for predicate in self.predicates:
+            pushdown = predicate.pushdown()
+            if pushdown is not None and taken.isdisjoint(pushdown[0]):
+                params, exact = pushdown
+                for name, values in params.items():
+                    for value in values:
+                        self.endpoint._add_param(name, value)
+                taken.update(params)
+                self.pushed.append((predicate, exact))
+                if exact:
+                    continue
+            self.residual.append(predicate)
+        self._tests = [predicate.compile() for predicate in self.residual]
+        self._keep_fields(predicate.field for predicate in self.residual)
+
+    def _keep_fields(self, fields):
+        """Make sure the resources fetched hold the fields tested locally."""
+        fields = frozenset(fields)
+        if self.endpoint.only_fields is not None:
+            self.endpoint.only_fields |= fields
+        self.endpoint.deferred_fields -= fields
+        self.endpoint._query = None
+
+    def where(self, **lookups):
+        """Add predicates, returning a new plan."""
+        predicates = [Predicate.parse(name, operand) for name, operand in lookups.items()]
+        return Plan(self.source, self.predicates + tuple(predicates), self.max_count)
+
+    def limit(self, count):
+        """Stop after 'count' matching resources, returning a new plan."""
+        return Plan(self.source, self.predicates, count)
+
+    def __iter__(self):
+        """Iterate over the matching resources, see `iter()`."""
+        return self.iter()
+
+    def iter(self, per_page=25, prefetch=False):
+        """Iterate over the matching resources, fetching one page at a time, see `Endpoint.iter()`."""
+        per_page = self._per_page(per_page)
+        resources = self.endpoint.iter(per_page=per_page, prefetch=prefetch)
+        matches = (resource for resource in resources if all(test(resource) for test in self._tests))
+        try:
+            for resource in itertools.islice(matches, self.max_count):
+                yield self.source._to_model(resource)
+        finally:
+            resources.close()  # Stop fetching once the limit is reached.
+
+    def all(self, per_page=25):
+        """List the matching resources."""
+        return list(self.iter(per_page=per_page))
+
+    def _per_page(self, per_page):
+        """Fetch no more than needed if the API evaluates all predicates."""
+        if self.max_count is not None and not self._tests:
+            return max(1, min(per_page, self.max_count))
+        return per_page
+
+    def explain(self, per_page=25):
+        """Describe the request, the predicates pushed down and those tested locally."""
+        lines = ['GET ' + self.endpoint.freeze().key]
+        if self.pushed:
+            lines.append('Pushed down:')
+            for predicate, exact in self.pushed:
+                lines.append('  ' + str(predicate) + ('' if exact else ' (rechecked locally)'))
+        if self.residual:
+            lines.append('Filtered locally:')
+            lines.extend('  ' + str(predicate) for predicate in self.residual)
+        paging = 'Paging: {per_page} per page'.format(per_page=self._per_page(per_page))
+        if self.max_count is not None:
+            paging += ', stopping after {count} matches'.format(count=self.max_count)
+        lines.append(paging)
+        return '\n'.join(lines)
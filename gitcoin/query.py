@@ -0,0 +1,157 @@
+"""Freeze Gitcoin API queries into immutable, hashable objects."""
+
+import base64
+import bisect
+import collections.abc
+import hashlib
+import json
+import urllib.parse
+
+
+class Query(collections.abc.Mapping):
+    """Map query parameter names to their values as sent, without allowing changes.
+
+    A query is hashable, so it works as a dict or cache key, and may be shared
+    between threads freely. Its URL-encoded query string is built once and
+    reused by the queries derived for single pages, which only encode limit
+    and offset anew.
+    """
+
+    __slots__ = ('url', '_params', '_encoded', '_hash')
+
+    def __init__(self, url, params=None, encoded=None):
+        """Copy the query parameters, which map names to strings.
+
+        'encoded' is the URL-encoded query string, if known already.
+        """
+        self.url = url
+        self._params = dict(params) if params else {}
+        self._encoded = encoded
+        self._hash = None
+
+    def __getitem__(self, name):
+        """Get the value of one query parameter."""
+        return self._params[name]
+
+    def __iter__(self):
+        """Iterate over the names of the query parameters."""
+        return iter(self._params)
+
+    def __len__(self):
+        """Tell the number of query parameters."""
+        return len(self._params)
+
+    def __hash__(self):
+        """Hash URL and query parameters, computed once."""
+        if self._hash is None:
+            self._hash = hash((self.url, frozenset(self._params.items())))
+        return self._hash
+
+    def __eq__(self, other):
+        """Compare URL and query parameters with another query, or just the parameters with a plain mapping."""
+        if isinstance(other, Query):
+            return self.url == other.url and self._params == other._params
+        if isinstance(other, collections.abc.Mapping):
+            return self._params == dict(other)
+        return NotImplemented
+
+    def __reduce__(self):
+        """Pickle without the cached hash, which differs between processes."""
+        return (Query, (self.url, self._params, self._encoded))
+
+    def __repr__(self):
+        """Show URL and query parameters."""
+        return 'Query({url!r}, {params!r})'.format(url=self.url, params=self._params)
+
+    @property
+    def encoded(self):
+        """Get the URL-encoded query string, sorted by name."""
+        if self._encoded is None:
+            self._encoded = urllib.parse.urlencode(sorted(self._params.items()))
+        return self._encoded
+
+    @property
+    def key(self):
+        """Get URL and query string, e.g. to use as cache key."""
+        return '?'.join((self.url, self.encoded)) if self._params else self.url
+
+    def replace(self, **params):
+        """Derive a query with the given parameters set, or removed if None."""
+        derived = dict(self._params)
+        for name, value in params.items():
+            if value is None:
+                derived.pop(name, None)
+            else:
+                derived[name] = str(value)
+        return Query(self.url, derived)
+
+    def page(self, number, per_page):
+        """Derive the query for one page, reusing the encoded parameters of this query.
+
+        Limit and offset are inserted in sorted order, so the query string is
+        the same as if encoded from scratch, e.g. for cache keys.
+        """
+        if 'limit' in self._params or 'offset' in self._params:
+            return self.replace(limit=per_page, offset=(number - 1) * per_page)
+        derived = dict(self._params)
+        derived['limit'] = str(per_page)
+        derived['offset'] = str((number - 1) * per_page)
+        # Values are encoded with '&' escaped, so the parts line up with the sorted names.
+        names = sorted(self._params)
+        parts = self.encoded.split('&') if self._params else []
+        for name in ('limit', 'offset'):
+            position = bisect.bisect(names, name)
+            names.insert(position, name)
+            parts.insert(position, '='.join((name, derived[name])))
+        return Query(self.url, derived, '&'.join(parts))
+
+    def keyset(self):
+        """Derive the query for keyset pagination: in primary key order, without limit and offset.
+
+        Pages are then requested with `pk__gt` set to the last primary key
+        seen, so each page costs the same however deep it is, and resources
+        added meanwhile neither shift the pages nor cause duplicates or gaps.
+        """
+        return self.replace(order_by='pk', limit=None, offset=None)
+
+    def encode_cursor(self, primary_key):
+        """Encode an opaque cursor pointing after the resource with 'primary_key' in this query's results."""
+        data = json.dumps([primary_key, self._fingerprint()], separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+    def decode_cursor(self, cursor):
+        """Get the primary key a cursor of this query points after.
+
+        Raises ValueError for malformed cursors and those of other queries.
+        """
+        try:
+            data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            primary_key, fingerprint = json.loads(data.decode('utf-8'))
+        except (TypeError, ValueError):
+            primary_key, fingerprint = None, None
+        if not isinstance(primary_key, int) or not isinstance(fingerprint, str):
+            msg = 'Invalid cursor "{cursor}".'
+            raise ValueError(msg.format(cursor=cursor))
+        if fingerprint != self._fingerprint():
+            msg = 'Cursor "{cursor}" belongs to another query.'
+            raise ValueError(msg.format(cursor=cursor))
+        return primary_key
+
+    def _fingerprint(self):
+        """Identify URL and query parameters in a few characters that are stable across processes."""
+        return hashlib.sha1(self.key.encode('utf-8')).hexdigest()[:12]
+
+
+class KeysetPage(list):
+    """List one page of resources in primary key order, see `Query.keyset()`.
+
+    'cursor' points after the page's last resource, or is None if the page
+    and all before it are empty. 'is_last' tells if the page was the last
+    one for now; its cursor still picks up resources added later.
+    """
+
+    def __init__(self, resources, cursor, is_last):
+        """Keep the resources along with the cursor of the next page."""
+        super().__init__(resources)
+        self.cursor = cursor
+        self.is_last = is_last
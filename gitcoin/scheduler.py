@@ -0,0 +1,146 @@
+"""Schedule Gitcoin API requests within the API's rate limits."""
+
+import email.utils
+import random
+import threading
+import time
+
+import requests.exceptions
+
+
+class Scheduler:
+    """Rate-limit, retry and throttle the requests of all endpoints sharing it.
+
+    - A token bucket allows 'rate' requests per second on average, with
+      bursts of up to 'burst' requests.
+    - Throttled (429) and failed (5xx, connection error) requests are retried
+      up to 'max_retries' times, waiting as told by a Retry-After header or
+      else with jittered exponential backoff starting at 'backoff' seconds.
+    - The number of requests in flight adapts like AIMD: it grows by one per
+      window of successful requests up to 'max_concurrency' and is halved,
+      down to 'min_concurrency', whenever a request is throttled.
+    """
+
+    retry_statuses = frozenset([429, 500, 502, 503, 504])
+    throttle_statuses = frozenset([429, 503])
+
+    def __init__(
+        self,
+        rate=10.0,
+        burst=None,
+        max_retries=5,
+        backoff=0.5,
+        max_backoff=60.0,
+        min_concurrency=1,
+        max_concurrency=16,
+        clock=time.monotonic,
+        sleep=time.sleep
+    ):
+        """Configure limits, 'clock' and 'sleep' can be replaced for testing."""
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(max_concurrency)
+        self.clock = clock
+        self.sleep = sleep
+        self.retries = 0
+        self.throttled = 0
+        self._tokens = self.burst
+        self._refilled_at = clock()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+
+    def call(self, send):
+        """Call 'send' to fire a request, returning its final response.
+
+        The response of the last attempt is returned even if it failed, so
+        the caller can raise for its status as usual. The number of retries
+        is attached to the response as 'retries'.
+        """
+        attempt = 0
+        while True:
+            self._acquire_slot()
+            try:
+                self._take_token()
+                response = send()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+                response = None
+            finally:
+                self._release_slot()
+            status = response.status_code if response is not None else None
+            if status in self.throttle_statuses:
+                self._decrease_concurrency()
+            elif status is not None and status < 500:
+                self._increase_concurrency()
+            if response is not None and (status not in self.retry_statuses or attempt >= self.max_retries):
+                response.retries = attempt
+                return response
+            delay = self._retry_after(response) if response is not None else None
+            if response is not None:
+                response.close()
+            attempt += 1
+            with self._lock:
+                self.retries += 1
+            self.sleep(delay if delay is not None else self._backoff_delay(attempt))
+
+    def _acquire_slot(self):
+        """Wait until fewer requests than the current concurrency are in flight."""
+        with self._slot_freed:
+            while self._in_flight >= max(self.min_concurrency, int(self.concurrency)):
+                self._slot_freed.wait()
+            self._in_flight += 1
+
+    def _release_slot(self):
+        """Let the next waiting request go."""
+        with self._slot_freed:
+            self._in_flight -= 1
+            self._slot_freed.notify()
+
+    def _take_token(self):
+        """Take one token from the bucket, waiting for the refill if it is empty."""
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            self._tokens -= 1  # Reserve the token even when it has yet to be refilled.
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            self.sleep(wait)
+
+    def _increase_concurrency(self):
+        """Add one request in flight per window of successful requests."""
+        with self._slot_freed:
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+            self._slot_freed.notify_all()
+
+    def _decrease_concurrency(self):
+        """Halve the requests in flight after being throttled."""
+        with self._lock:
+            self.throttled += 1
+            self.concurrency = max(self.min_concurrency, self.concurrency / 2)
+
+    def _backoff_delay(self, attempt):
+        """Get a random delay within the exponentially growing backoff window."""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**(attempt - 1)))
+
+    def _retry_after(self, response):
+        """Get the delay requested by the response's Retry-After header, if any."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return min(self.max_backoff, max(0.0, float(value)))
+        except ValueError:
+            pass
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return min(self.max_backoff, max(0.0, date.timestamp() - time.time()))
@@ -0,0 +1,90 @@
+"""Collapse concurrent identical Gitcoin API requests into one."""
+
+import asyncio
+import threading
+
+
+class _Call:
+    """Track one in-flight call and its outcome."""
+
+    def __init__(self):
+        """Start unfinished."""
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Let threads making the same call at the same time share one execution.
+
+    The first caller for a key executes the call, callers arriving while it is
+    in flight wait for and receive the very same result (or exception). Shared
+    results must be treated as read-only.
+    """
+
+    def __init__(self):
+        """Start without calls in flight."""
+        self.shared = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """Call 'fn' unless a call for 'key' is in flight already, then wait for its result."""
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """Let coroutines making the same call at the same time share one execution.
+
+    This is the asyncio counterpart of `SingleFlight`, to be used from one
+    event loop.
+    """
+
+    def __init__(self):
+        """Start without calls in flight."""
+        self.shared = 0
+        self._calls = {}
+
+    async def do(self, key, factory):
+        """Await 'factory()' unless a call for 'key' is in flight already, then await its result."""
+        future = self._calls.get(key)
+        if future is not None:
+            self.shared += 1
+            return await asyncio.shield(future)
+        future = asyncio.get_event_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark as retrieved in case nobody else waits.
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
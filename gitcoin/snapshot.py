@@ -0,0 +1,269 @@
+"""Export bounties to compressed snapshot files and load them back.
+
+A snapshot is a sequence of independently compressed frames of JSON Lines,
+followed by an index frame and a fixed size trailer:
+
+    frame 0 | frame 1 | ... | index frame | index offset | format | magic
+
+The index lists each frame's offset, length and primary keys, so single
+bounties are found without decompressing the whole file. New snapshots are
+written to a temporary file that replaces the target once complete.
+Appending writes new frames, index and trailer after the previous trailer,
+without copying the existing frames. The previous trailer stays valid until
+the new one is written: a failed append is truncated away, and readers fall
+back to the last complete trailer if the file ends with an interrupted one.
+Either way a failed export leaves the previous snapshot in place.
+
+With 'jsonl.gz' every frame is a gzip member, so `zcat` prints the bounties
+followed by the index line, and ignores the trailer with a warning. It stops
+there, so bounties appended later are not printed.
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+
+import gitcoin.decoding
+
+MAGIC = b'GCSNAP01'
+TRAILER = struct.Struct('<Q16s8s')  # Index offset, format and magic.
+FORMATS = ('jsonl', 'jsonl.gz', 'jsonl.zst')
+
+
+def _gzip_compress(data):
+    """Compress into one gzip member."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _gzip_decompress(data):
+    """Decompress one gzip member."""
+    return zlib.decompress(data, 31)
+
+
+def _codec(format):
+    """Get compress and decompress functions for the snapshot format."""
+    if format == 'jsonl':
+        return bytes, bytes
+    if format == 'jsonl.gz':
+        return _gzip_compress, _gzip_decompress
+    if format == 'jsonl.zst':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError('Format "jsonl.zst" needs zstandard, install it with `pip install gitcoin[compression]`.')
+        return zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress
+    msg = 'Unknown snapshot format "{format}", use one of {formats}.'
+    raise ValueError(msg.format(format=format, formats=', '.join(FORMATS)))
+
+
+def _read_index(data):
+    """Read format, frames and index offset from the memory-mapped snapshot.
+
+    If the file does not end with a complete trailer and index, e.g. after
+    an interrupted append, the last complete one before is used.
+    """
+    end = len(data) - TRAILER.size
+    while end >= 0:
+        index = _read_trailer(data, end)
+        if index is not None:
+            return index
+        # Look for the magic of an earlier trailer, ending before the current candidate's.
+        end = data.rfind(MAGIC, 0, end + TRAILER.size - 1) - (TRAILER.size - len(MAGIC))
+    raise ValueError('Not a bounty snapshot.')
+
+
+def _read_trailer(data, end):
+    """Read format, frames and index offset via the trailer at 'end', or None if it is no complete one."""
+    offset, format, magic = TRAILER.unpack(data[end:end + TRAILER.size])
+    if magic != MAGIC or offset > end:
+        return None
+    try:
+        format = format.rstrip(b'\0').decode('ascii')
+        _, decompress = _codec(format)
+        return format, json.loads(decompress(data[offset:end]).decode('utf-8')), offset
+    except ImportError:
+        raise
+    except Exception:
+        return None  # Not an index, e.g. the magic within compressed data.
+
+
+def _map(file):
+    """Memory-map the whole file for reading."""
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class SnapshotWriter:
+    """Write bounties to a snapshot file, 'chunk_size' bounties per frame.
+
+    Use it as context manager, or call `close()` to complete the snapshot
+    at 'path', `abort()` to drop what was written.
+    """
+
+    def __init__(self, path, format='jsonl.gz', chunk_size=1000, append=False):
+        """Start the snapshot file, continuing an existing one with 'append'."""
+        self.path = path
+        self.format = format
+        self.chunk_size = chunk_size
+        self.count = 0
+        self._compress, _ = _codec(format)
+        self._lines = []
+        self._pks = []
+        self._frames = []
+        self._tmp_path = None
+        self._appended_at = None
+        if append and os.path.exists(path) and os.path.getsize(path):
+            self._open_existing(path)
+        else:
+            directory = os.path.dirname(os.path.abspath(path))
+            fd, self._tmp_path = tempfile.mkstemp(dir=directory, prefix='.snapshot-')
+            self._file = os.fdopen(fd, 'wb')
+
+    def _open_existing(self, path):
+        """Continue the snapshot at 'path' after its trailer, which stays valid until the new one is written."""
+        self._file = open(path, 'r+b')
+        try:
+            with _map(self._file) as data:
+                existing, self._frames, _ = _read_index(data)
+            if existing != self.format:
+                msg = 'Cannot append "{format}" frames to a "{existing}" snapshot.'
+                raise ValueError(msg.format(format=self.format, existing=existing))
+        except BaseException:
+            self._file.close()
+            raise
+        self.count = sum(frame[2] for frame in self._frames)
+        self._appended_at = self._file.seek(0, os.SEEK_END)
+
+    def __enter__(self):
+        """Use the writer as context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Complete the snapshot, or drop it if the block raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, bounty):
+        """Add one bounty, given as decoded `dict`."""
+        self._lines.append(json.dumps(bounty, separators=(',', ':')).encode('utf-8'))
+        self._pks.append(bounty.get('pk'))
+        if len(self._lines) >= self.chunk_size:
+            self._flush()
+
+    def write_many(self, bounties):
+        """Add all given bounties."""
+        for bounty in bounties:
+            self.write(bounty)
+
+    def _flush(self):
+        """Compress the pending bounties into one frame."""
+        if not self._lines:
+            return
+        frame = self._compress(b'\n'.join(self._lines) + b'\n')
+        self._frames.append([self._file.tell(), len(frame), len(self._lines), self._pks])
+        self._file.write(frame)
+        self.count += len(self._lines)
+        self._lines = []
+        self._pks = []
+
+    def close(self):
+        """Write pending bounties, the index and the trailer, then replace the file at 'path' unless appending."""
+        if self._file.closed:
+            return
+        try:
+            self._flush()
+            offset = self._file.tell()
+            self._file.write(self._compress(json.dumps(self._frames, separators=(',', ':')).encode('utf-8') + b'\n'))
+            self._file.write(TRAILER.pack(offset, self.format.encode('ascii'), MAGIC))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            if self._tmp_path is not None:
+                os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+
+    def abort(self):
+        """Drop what was written, the file at 'path' stays as it was."""
+        if self._tmp_path is None:
+            if not self._file.closed:
+                self._file.truncate(self._appended_at)
+                self._file.close()
+        else:
+            self._file.close()
+            if os.path.exists(self._tmp_path):
+                os.unlink(self._tmp_path)
+
+
+class Snapshot:
+    """Read bounties from a snapshot file, memory-mapping it.
+
+    Iterating decompresses one frame at a time, `get()` only the frame
+    holding the requested bounty.
+    """
+
+    def __init__(self, path, loads=None):
+        """Map the snapshot file and read its index."""
+        self.path = path
+        self.loads = loads if loads else gitcoin.decoding.loads
+        self._file = open(path, 'rb')
+        self._map = _map(self._file)
+        self.format, self._frames, _ = _read_index(self._map)
+        self._decompress = _codec(self.format)[1]
+        self._frame_of = {pk: number for number, frame in enumerate(self._frames) for pk in frame[3]}
+
+    def __enter__(self):
+        """Use the snapshot as context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Unmap and close the file."""
+        self.close()
+
+    def __len__(self):
+        """Tell the number of bounties in the snapshot."""
+        return sum(frame[2] for frame in self._frames)
+
+    def __iter__(self):
+        """Iterate over all bounties in the order they were written."""
+        for number in range(len(self._frames)):
+            yield from self._read_frame(number)
+
+    def all(self):
+        """List all bounties."""
+        return list(self)
+
+    def get(self, primary_key):
+        """Retrieve one bounty by primary key, the one written last if written repeatedly."""
+        number = self._frame_of.get(primary_key)
+        if number is not None:
+            for bounty in reversed(self._read_frame(number)):
+                if bounty.get('pk') == primary_key:
+                    return bounty
+        msg = 'No bounty with pk {pk}.'
+        raise KeyError(msg.format(pk=primary_key))
+
+    def _read_frame(self, number):
+        """Decompress and decode the bounties of one frame."""
+        offset, length = self._frames[number][:2]
+        lines = self._decompress(self._map[offset:offset + length])
+        # JSON Lines hold no raw newlines within documents, so joining them with commas makes one array.
+        return self.loads(b'[' + lines.rstrip(b'\n').replace(b'\n', b',') + b']')
+
+    def close(self):
+        """Unmap and close the file."""
+        if not self._file.closed:
+            self._map.close()
+            self._file.close()
+
+
+def load(path):
+    """List all bounties of the snapshot file."""
+    with Snapshot(path) as snapshot:
+        return snapshot.all()
@@ -0,0 +1,221 @@
+"""Store bounties locally and query them offline."""
+
+import contextlib
+import json
+import sqlite3
+import threading
+
+import gitcoin.sync
+import gitcoin.transport
+import gitcoin.validation
+from gitcoin.client import BountyConfig, Endpoint
+
+# Columns derived from nested lists, holding comma-delimited lowercase usernames.
+INTERESTED = 'interested_github_usernames'
+FULFILLERS = 'fulfiller_github_usernames'
+
+# Filter params with the column they match and how they match it, see `gitcoin.validation.FILTER_LOOKUPS`.
+_LIST_COLUMNS = {'interested': INTERESTED, 'fulfillments': FULFILLERS}
+LOOKUPS = {
+    param: (_LIST_COLUMNS.get(field, field), lookup)
+    for param, (field, lookup) in gitcoin.validation.FILTER_LOOKUPS.items()
+}
+
+FIELDS = [name for name in gitcoin.validation.OPTIONS['order_by'] if name != 'pk']
+COLUMNS = FIELDS + [INTERESTED, FULFILLERS]
+
+# SQLite column types by field type, so numbers sent as strings like "10.00" filter and sort as numbers.
+_AFFINITIES = {'int': 'INTEGER', 'float': 'REAL', 'bool': 'INTEGER'}
+
+
+def _quote(name):
+    """Quote an SQL identifier."""
+    return '"{name}"'.format(name=name)
+
+
+def _usernames(items, *path):
+    """Collect lowercase usernames found at 'path' in each of the nested items."""
+    names = []
+    for item in items or []:
+        for key in path:
+            item = item.get(key) if isinstance(item, dict) else None
+        if item:
+            names.append(str(item).lower())
+    return ',{names},'.format(names=','.join(names)) if names else ''
+
+
+def _column_value(value):
+    """Convert one bounty field into an SQLite value."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(',', ':'), sort_keys=True)
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+def _encode(resources):
+    """Encode resources as one JSON array, one chunk per resource."""
+    yield b'['
+    for number, resource in enumerate(resources):
+        yield (b',' if number else b'') + json.dumps(resource, separators=(',', ':')).encode('utf-8')
+    yield b']'
+
+
+class BountyStore:
+    """Keep bounties in SQLite with an index on every filter and sort field."""
+
+    def __init__(self, path=':memory:'):
+        """Open or create the store at 'path', in memory by default."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        columns = ', '.join(
+            ' '.join((_quote(column), _AFFINITIES.get(gitcoin.validation.TYPES.get(column), 'TEXT')))
+            for column in COLUMNS
+        )
+        with self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS bounties (pk INTEGER PRIMARY KEY, {columns}, data TEXT NOT NULL)'.format(
+                    columns=columns
+                )
+            )
+            for column in COLUMNS:
+                self._db.execute(
+                    'CREATE INDEX IF NOT EXISTS {index} ON bounties ({column})'.format(
+                        index=_quote('bounties_' + column), column=_quote(column)
+                    )
+                )
+
+    def __len__(self):
+        """Count stored bounties."""
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM bounties').fetchone()[0]
+
+    @property
+    def bounties(self):
+        """Wrap the stored bounties in an endpoint with the API's query interface."""
+        return LocalEndpoint(self, BountyConfig())
+
+    def load(self, bounties):
+        """Insert or replace bounties, returning their number."""
+        rows = [self._row(bounty) for bounty in bounties]
+        placeholders = ', '.join('?' * (len(COLUMNS) + 2))
+        with self._lock, self._db:
+            self._db.executemany('INSERT OR REPLACE INTO bounties VALUES ({p})'.format(p=placeholders), rows)
+        return len(rows)
+
+    def pull(self, endpoint, per_page=100):
+        """Fill the store with all bounties of the (filtered) endpoint."""
+        count = 0
+        page = []
+        for bounty in endpoint.as_model(None).iter(per_page=per_page):  # Stored as decoded, without model.
+            page.append(bounty)
+            if len(page) == per_page:
+                count += self.load(page)
+                page = []
+        return count + self.load(page)
+
+    def sync(self, endpoint, watermarks, per_page=100):
+        """Add bounties created since the last sync, see `gitcoin.sync.IncrementalSync`.
+
+        Changes to bounties stored before are not picked up, use `pull()` for those.
+        """
+        return gitcoin.sync.IncrementalSync(endpoint.as_model(None), watermarks, per_page=per_page).run(self.load)
+
+    def get(self, primary_key):
+        """Get one bounty by primary key."""
+        with self._lock:
+            row = self._db.execute('SELECT data FROM bounties WHERE pk = ?', (int(primary_key), )).fetchone()
+        if row is None:
+            msg = 'No bounty with primary key "{pk}".'
+            raise KeyError(msg.format(pk=primary_key))
+        return json.loads(row[0])
+
+    def query(self, params):
+        """List bounties matching query parameters as sent to the API."""
+        clauses, args = [], []
+        for name, value in params.items():
+            if name in ('order_by', 'limit', 'offset'):
+                continue
+            if name not in LOOKUPS:
+                msg = 'Cannot filter by param "{name}" locally.'
+                raise KeyError(msg.format(name=name))
+            column, lookup = LOOKUPS[name]
+            clause, clause_args = self._where(_quote(column), lookup, value)
+            clauses.append(clause)
+            args.extend(clause_args)
+        sql = 'SELECT data FROM bounties'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY ' + self._order(params.get('order_by'))
+        if 'limit' in params or 'offset' in params:
+            sql += ' LIMIT ? OFFSET ?'
+            args.extend([int(params.get('limit', -1)), int(params.get('offset', 0))])
+        with self._lock:
+            rows = self._db.execute(sql, args).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    @staticmethod
+    def _where(column, lookup, value):
+        """Build the SQL condition for one filter param."""
+        if lookup == 'in':
+            values = value.split(',')
+            return '{c} IN ({p})'.format(c=column, p=', '.join('?' * len(values))), values
+        if lookup == 'icontains':
+            values = ['%{v}%'.format(v=v.strip()) for v in value.split(',') if v.strip()]
+            return '(' + ' OR '.join('{c} LIKE ?'.format(c=column) for _ in values) + ')', values
+        if lookup == 'gt':
+            return '{c} > ?'.format(c=column), [int(value)]
+        if lookup == 'exact':  # Only booleans are matched exactly.
+            return '{c} = ?'.format(c=column), [int(value.lower() == 'true')]
+        return '{c} LIKE ?'.format(c=column), ['%,{v},%'.format(v=value.lower())]
+
+    @staticmethod
+    def _order(order_by):
+        """Build the SQL sort order, breaking ties by primary key."""
+        if not order_by:
+            return 'pk'
+        gitcoin.validation.order_by(order_by)
+        name = order_by.lstrip('-')
+        direction = 'DESC' if order_by.startswith('-') else 'ASC'
+        if name == 'pk':
+            return 'pk ' + direction
+        return '{c} {d}, pk'.format(c=_quote(name), d=direction)
+
+    @staticmethod
+    def _row(bounty):
+        """Flatten one bounty into a table row."""
+        row = [bounty['pk']]
+        row.extend(_column_value(bounty.get(field)) for field in FIELDS)
+        row.append(_usernames(bounty.get('interested'), 'profile', 'handle'))
+        row.append(_usernames(bounty.get('fulfillments'), 'fulfiller_github_username'))
+        row.append(json.dumps(bounty, separators=(',', ':')))
+        return row
+
+    def close(self):
+        """Close the database."""
+        self._db.close()
+
+
+class LocalEndpoint(Endpoint):
+    """Run the `Endpoint` query interface against a `BountyStore` instead of the API."""
+
+    def __init__(self, store, config):
+        """Inject the store and Config, default to no query parameters."""
+        super().__init__(store.path, config)
+        self.store = store
+
+    def get(self, primary_key):
+        """Retrieve one resource by primary key."""
+        return self._to_model(self.store.get(primary_key))
+
+    def _request_get(self, url=None, params=None):
+        """Query the store instead of firing an HTTP GET request."""
+        params = params if params is not None else self.freeze()
+        return self._to_model(self.store.query(params))
+
+    @contextlib.contextmanager
+    def _open_stream(self, params, chunk_size, headers=None):
+        """Query the store, yielding a response and the matching bounties encoded as the API sends them."""
+        resources = self.store.query(params)
+        yield gitcoin.transport.make_response(self.url, 200, {'Content-Type': 'application/json'}), _encode(resources)
@@ -0,0 +1,199 @@
+"""Synchronize Gitcoin API resources incrementally."""
+
+import collections
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+import gitcoin.decoding
+
+# One change of the watched resources, 'kind' is 'created', 'updated' or 'removed'.
+ChangeEvent = collections.namedtuple('ChangeEvent', ['kind', 'pk', 'resource'])
+
+
+class WatermarkStore:
+    """Persist high-watermarks per filter set in a JSON file.
+
+    Every update rewrites the file atomically, so a crash never leaves a
+    half-written watermark behind.
+    """
+
+    def __init__(self, path):
+        """Load the watermarks stored at 'path', if any."""
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, encoding='utf-8') as f:
+                self._watermarks = json.load(f)
+        except FileNotFoundError:
+            self._watermarks = {}
+
+    def get(self, key, default=0):
+        """Get the watermark for 'key'."""
+        return self._watermarks.get(key, default)
+
+    def set(self, key, value):
+        """Advance the watermark for 'key' and persist all watermarks."""
+        with self._lock:
+            self._watermarks[key] = value
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.watermarks-')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self._watermarks, f, sort_keys=True)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+
+class IncrementalSync:
+    """Fetch only resources with a primary key above the last synced one.
+
+    Pages are requested in primary key order via `pk__gt`, see
+    `gitcoin.query.Query.keyset()`, so the watermark doubles as resumable
+    checkpoint: an interrupted sync continues after the last committed page.
+    The endpoint's filters select the resources and name the watermark, its
+    sorting is replaced by primary key order.
+    """
+
+    ignored_params = ('pk__gt', 'order_by', 'limit', 'offset')
+
+    def __init__(self, endpoint, store, per_page=100):
+        """Inject the filtered endpoint and the watermark store."""
+        self.endpoint = endpoint
+        self.store = store
+        self.per_page = per_page
+
+    @property
+    def key(self):
+        """Name the watermark after the endpoint URL and its filters."""
+        params = self.endpoint.freeze()
+        filters = sorted((name, value) for name, value in params.items() if name not in self.ignored_params)
+        return json.dumps([self.endpoint.url, filters])
+
+    @property
+    def watermark(self):
+        """Tell the highest primary key synced so far."""
+        params = self.endpoint.freeze()
+        return max(self.store.get(self.key), int(params.get('pk__gt', 0)))
+
+    def pages(self):
+        """Yield pages of new resources.
+
+        A page is committed, i.e. the watermark advances past it, as soon as
+        the next page is requested. Stopping the iteration early leaves the
+        current page uncommitted.
+        """
+        key = self.key
+        query = self.endpoint.freeze().keyset()
+        watermark = self.watermark
+        while True:
+            page = self.endpoint._fetch_keyset_page(query, watermark, self.per_page)
+            if page:
+                yield page
+                watermark = max(resource['pk'] for resource in page)
+                self.store.set(key, watermark)
+            if page.is_last:
+                return
+
+    def run(self, handler):
+        """Pass each page of new resources to 'handler', committing it afterwards.
+
+        Returns the number of synced resources.
+        """
+        count = 0
+        for page in self.pages():
+            handler(page)
+            count += len(page)
+        return count
+
+
+class ChangeFeed:
+    """Poll the endpoint's complete list, emitting only what changed since the last poll.
+
+    Instead of the previous list, only a 8 byte hash of each resource is kept
+    by primary key. Polls are conditional requests, so an unchanged list is
+    neither downloaded nor parsed if the server sends ETag or Last-Modified.
+    Otherwise the list is streamed and hashed one resource at a time, and
+    only changed ones are converted and emitted. Resources no longer listed,
+    e.g. because they stopped matching the filters, are reported removed.
+
+    With `only()` or `defer()`, only changes of the kept fields count.
+    """
+
+    def __init__(self, endpoint, interval=60.0, initial=True, sleep=time.sleep):
+        """Inject the filtered endpoint and the seconds to wait between polls.
+
+        With 'initial', the first poll reports all resources as created,
+        otherwise it only builds the index.
+        """
+        self.endpoint = endpoint
+        self.interval = interval
+        self.initial = initial
+        self.sleep = sleep
+        self.index = {}
+        self.polls = 0
+        self.not_modified = 0
+        self._validators = {}
+
+    def __iter__(self):
+        """Poll forever, yielding change events and waiting 'interval' seconds between polls."""
+        while True:
+            yield from self.poll()
+            self.sleep(self.interval)
+
+    def poll(self):
+        """Poll once, returning the list of change events."""
+        endpoint = self.endpoint
+        with endpoint._open_stream(endpoint._unpaged_query(), 65536, headers=self._validators) as (response, chunks):
+            if response.status_code == 304:
+                self.not_modified += 1
+                return []
+            response.raise_for_status()  # Let API consumer know about HTTP errors.
+            events = self._diff(chunks)
+        self._validators = {}
+        if response.headers.get('ETag'):
+            self._validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            self._validators['If-Modified-Since'] = response.headers['Last-Modified']
+        self.polls += 1
+        return events
+
+    def _diff(self, chunks):
+        """Compare the streamed list to the index, replacing the index by the new one."""
+        endpoint = self.endpoint
+        is_projected = endpoint.only_fields is not None or endpoint.deferred_fields
+        report = self.polls or self.initial
+        previous, index, events = self.index, {}, []
+        replaced = {}  # Previous digests of changed resources, None for new ones.
+        try:
+            for resource, text in gitcoin.decoding.iter_array(chunks, raw=True):
+                if is_projected:
+                    resource = endpoint._project(resource)
+                    text = json.dumps(resource, sort_keys=True)
+                digest = hashlib.sha1(text.encode('utf-8')).digest()[:8]
+                pk = resource['pk']
+                # Moving entries over keeps the total size of both indexes constant.
+                known = previous.pop(pk, None)
+                index[pk] = digest
+                if digest != known:
+                    replaced[pk] = known
+                    if report:
+                        kind = 'created' if known is None else 'updated'
+                        events.append(ChangeEvent(kind, pk, endpoint._to_model(resource)))
+        except BaseException:
+            # Move the entries back, so a failed poll leaves the index as it was.
+            for pk, digest in index.items():
+                known = replaced.get(pk, digest)
+                if known is not None:
+                    previous[pk] = known
+            raise
+        events.extend(ChangeEvent('removed', pk, None) for pk in previous)
+        self.index = index
+        return events
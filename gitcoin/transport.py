@@ -0,0 +1,193 @@
+"""Define pluggable transports sending the HTTP requests of the Gitcoin API client.
+
+A transport replaces the default `requests.Session`, inject it with
+`Gitcoin.set_class('session', ...)`. Endpoints only call its `get()` and
+`close()` methods and read status code, headers and content of the
+`requests.Response` returned, so caching, scheduling, instrumentation and
+streaming work the same with every transport.
+
+`HTTP2Transport` needs the optional `httpx` dependency with HTTP/2 support,
+install it with `pip install gitcoin[http2]`. It is only imported once the
+transport is created.
+"""
+
+import datetime
+import http.client
+import io
+import json
+import time
+import urllib.parse
+
+import requests.exceptions
+import requests.models
+import requests.structures
+import requests.utils
+
+
+def _import_httpx():
+    """Import httpx on demand with a helpful error message."""
+    try:
+        import httpx
+    except ImportError as e:
+        msg = 'The HTTP/2 transport needs "httpx", install it with "pip install gitcoin[http2]".'
+        raise ImportError(msg) from e
+    return httpx
+
+
+def make_response(url, status_code, headers=None, content=b'', raw=None, elapsed=None):
+    """Build a `requests.Response` from the parts received by a transport.
+
+    The body is read from 'raw', a file-like object or one with a
+    `stream(chunk_size, decode_content)` method, or else from 'content'.
+    """
+    response = requests.models.Response()
+    response.url = url
+    response.status_code = status_code
+    response.reason = http.client.responses.get(status_code, '')
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.raw = raw if raw is not None else io.BytesIO(content)
+    response.elapsed = elapsed if elapsed is not None else datetime.timedelta(0)
+    return response
+
+
+def _with_query(url, params):
+    """Append encoded query parameters to the URL."""
+    if not params:
+        return url
+    if not isinstance(params, str):
+        params = urllib.parse.urlencode(sorted(params.items()))
+    return ''.join((url, '&' if '?' in url else '?', params))
+
+
+def _encode(payload):
+    """Encode a JSON payload."""
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+class Transport:
+    """Define the interface of transports, a subset of `requests.Session`."""
+
+    def __init__(self):
+        """Start with no default headers."""
+        self.headers = requests.structures.CaseInsensitiveDict()
+
+    def get(self, url, params=None, headers=None, stream=False):
+        """Send one HTTP GET request and return a `requests.Response`.
+
+        'params' is a dict or an URL-encoded query string. With 'stream',
+        the body is read while iterating over `iter_content()`, otherwise
+        right away. Connection errors and time-outs raise the matching
+        `requests.exceptions`.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Release connections, if any."""
+
+
+class _HTTPXBody:
+    """Read the body of a streamed httpx response through `requests.Response.iter_content()`."""
+
+    def __init__(self, response):
+        """Wrap the httpx response."""
+        self.response = response
+
+    def stream(self, chunk_size, decode_content=True):
+        """Iterate over the decoded body."""
+        httpx = _import_httpx()
+        try:
+            yield from self.response.iter_bytes(chunk_size)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ChunkedEncodingError(e) from e
+
+    def close(self):
+        """Release the stream back to the connection."""
+        self.response.close()
+
+
+class HTTP2Transport(Transport):
+    """Send requests via httpx, multiplexing concurrent ones over one HTTP/2 connection.
+
+    `requests` sends one request at a time per connection, so concurrent
+    page or primary key fetches need as many pooled connections. With
+    HTTP/2, requests from all threads share one connection to the API, each
+    in its own stream. Servers not supporting HTTP/2 are talked to via
+    HTTP/1.1 on up to 'max_connections' connections.
+    """
+
+    def __init__(self, http2=True, max_connections=10, timeout=None):
+        """Create the httpx client, 'timeout' in seconds, none by default like with `requests`."""
+        super().__init__()
+        httpx = _import_httpx()
+        try:
+            self.client = httpx.Client(
+                http2=http2, limits=httpx.Limits(max_connections=max_connections), timeout=timeout
+            )
+        except ImportError as e:
+            msg = 'The HTTP/2 transport needs "h2", install it with "pip install gitcoin[http2]".'
+            raise ImportError(msg) from e
+        self.headers = self.client.headers
+
+    def get(self, url, params=None, headers=None, stream=False):
+        """Send one HTTP GET request, see `Transport.get()`."""
+        httpx = _import_httpx()
+        url = _with_query(url, params)
+        started = time.perf_counter()
+        try:
+            request = self.client.build_request('GET', url, headers=headers)
+            response = self.client.send(request, stream=stream)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e) from e
+        elapsed = datetime.timedelta(seconds=time.perf_counter() - started)
+        raw = _HTTPXBody(response) if stream else None
+        content = b'' if stream else response.content
+        return make_response(str(response.url), response.status_code, response.headers, content, raw, elapsed)
+
+    def close(self):
+        """Close the httpx client and its connections."""
+        self.client.close()
+
+
+class FakeTransport(Transport):
+    """Serve canned payloads in process, without any network I/O, e.g. for tests and benchmarks.
+
+    List payloads are paged with 'limit' and 'offset' like the API does,
+    each page is encoded once.
+    Requests for URLs without a payload get a 404 response. All requests
+    sent are collected in 'requests' as pairs of URL and query dict.
+    """
+
+    def __init__(self):
+        """Start without payloads."""
+        super().__init__()
+        self.routes = {}
+        self.requests = []
+
+    def add(self, url, json=None, body=None, status=200, headers=None):
+        """Serve 'json', encoded once, or the raw 'body' bytes for 'url'."""
+        content = body if body is not None else _encode(json)
+        headers = dict(headers or {})
+        headers.setdefault('Content-Type', 'application/json')
+        self.routes[url] = (status, headers, json, content, {})
+        return self
+
+    def get(self, url, params=None, headers=None, stream=False):
+        """Answer one HTTP GET request from the payloads, see `Transport.get()`."""
+        if isinstance(params, str):
+            query = dict(urllib.parse.parse_qsl(params))
+        else:
+            query = dict(params or {})
+        self.requests.append((url, query))
+        if url not in self.routes:
+            return make_response(url, 404, {'Content-Type': 'application/json'}, _encode({'detail': 'Not found.'}))
+        status, headers, payload, content, pages = self.routes[url]
+        if isinstance(payload, list) and ('limit' in query or 'offset' in query):
+            offset = int(query.get('offset', 0))
+            limit = int(query.get('limit', len(payload)))
+            if (offset, limit) not in pages:
+                pages[offset, limit] = _encode(payload[offset:offset + limit])
+            content = pages[offset, limit]
+        return make_response(_with_query(url, params), status, headers, content)
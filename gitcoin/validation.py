@@ -16,14 +16,85 @@ OPTIONS = {
         'accepted', 'interested', 'interested_comment', 'submissions_comment', 'override_status', 'last_comment_date',
         'fulfillment_accepted_on', 'fulfillment_submitted_on', 'fulfillment_started_on', 'canceled_on',
         'snooze_warnings_for_days', 'token_value_time_peg', 'token_value_in_usdt', 'value_in_usdt_now', 'value_in_usdt',
-        'value_in_eth', 'value_true', 'privacy_preferences'
+        'value_in_eth', 'value_true', 'privacy_preferences', 'pk'
     ]
 }
 
+# Fields of bounty resources: the sortable model fields plus those only added by the API's serializer.
+FIELDS = ('pk', 'url', 'created_on', 'modified_on', 'status', 'interested', 'fulfillments') + tuple(
+    name for name in OPTIONS['order_by'] if name != 'pk'
+)
+
+# Types of bounty fields, for typed models, columnar export and local storage,
+# see `gitcoin.models`, `gitcoin.columns` and `gitcoin.store`.
+TYPES = dict.fromkeys(FIELDS, 'str')
+TYPES.update(
+    dict.fromkeys([
+        'pk', 'github_comments', 'standard_bounties_id', 'num_fulfillments', 'snooze_warnings_for_days',
+        'idx_experience_level', 'idx_project_length'
+    ], 'int')
+)
+TYPES.update(
+    dict.fromkeys([
+        'value_in_token', 'balance', 'token_value_in_usdt', 'value_in_usdt_now', 'value_in_usdt', 'value_in_eth',
+        'value_true', '_val_usd_db'
+    ], 'float')
+)
+TYPES.update(dict.fromkeys(['is_open', 'current_bounty', 'accepted'], 'bool'))
+TYPES.update(
+    dict.fromkeys([
+        'created_on', 'modified_on', 'web3_created', 'expires_date', 'last_comment_date', 'fulfillment_accepted_on',
+        'fulfillment_submitted_on', 'fulfillment_started_on', 'canceled_on', 'token_value_time_peg'
+    ], 'datetime')
+)
+TYPES.update(
+    dict.fromkeys([
+        'experience_level', 'project_length', 'bounty_type', 'idx_status', 'status', 'network', 'token_name',
+        'token_address', 'web3_type', 'override_status'
+    ], 'category')
+)
+TYPES.update(
+    dict.fromkeys(['raw_data', 'metadata', 'interested', 'fulfillments', 'privacy_preferences'], 'object')
+)
+
+# How the API matches filter params: the field compared and the lookup, mimicking
+# https://github.com/gitcoinco/web/blob/master/app/dashboard/router.py. Usernames
+# are looked up among the members of the 'interested' and 'fulfillments' lists.
+FILTER_LOOKUPS = {
+    'experience_level': ('experience_level', 'in'),
+    'project_length': ('project_length', 'in'),
+    'bounty_type': ('bounty_type', 'in'),
+    'idx_status': ('idx_status', 'in'),
+    'github_url': ('github_url', 'in'),
+    'bounty_owner_address': ('bounty_owner_address', 'icontains'),
+    'bounty_owner_github_username': ('bounty_owner_github_username', 'icontains'),
+    'network': ('network', 'icontains'),
+    'standard_bounties_id': ('standard_bounties_id', 'icontains'),
+    'raw_data': ('raw_data', 'icontains'),
+    'pk__gt': ('pk', 'gt'),
+    'is_open': ('is_open', 'exact'),
+    'started': ('interested', 'member'),
+    'interested_github_username': ('interested', 'member'),
+    'fulfiller_github_username': ('fulfillments', 'member'),
+}
+
+# Precompiled for constant time lookups, the lists above keep their documented order.
+_CHOICES = {name: frozenset(values) for name, values in OPTIONS.items()}
+_DIRECTIONS = _CHOICES['order_by'] | frozenset('-' + name for name in OPTIONS['order_by'])
+_FIELDS = frozenset(FIELDS)
+
+
+def _is_in(value, choices):
+    """Tell if the value is one of the choices, which unhashable values never are."""
+    try:
+        return value in choices
+    except TypeError:
+        return False
+
 
 def _validate_options(field_name, value):
     """Validate values for the given field name."""
-    if value in OPTIONS[field_name]:
+    if _is_in(value, _CHOICES[field_name]):
         return value
     msg = 'Unknown value "{val}" for field "{name}".'
     raise ValueError(msg.format(val=value, name=field_name))
@@ -51,9 +122,15 @@ def idx_status(value):
 
 def order_by(direction):
     """Validate values for "order_by"."""
-    if direction in OPTIONS['order_by']:
-        return direction
-    if direction[0:1] == '-' and direction[1:] in OPTIONS['order_by']:
+    if _is_in(direction, _DIRECTIONS):
         return direction
     msg = 'Unknown direction "{dir}" to order by.'
     raise ValueError(msg.format(dir=direction))
+
+
+def field(name):
+    """Validate bounty field names."""
+    if _is_in(name, _FIELDS):
+        return name
+    msg = 'Unknown field "{name}".'
+    raise ValueError(msg.format(name=name))
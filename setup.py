@@ -35,14 +35,25 @@ setup(
         'Natural Language :: English',
     ],
     keywords='gitcoin api client bounties bounty rest',
-    packages=find_packages(exclude=['docs', 'tests']),
+    packages=find_packages(exclude=['benchmarks', 'docs', 'tests']),
     python_requires='~=3.5',
     install_requires=['requests'],
     setup_requires=['pytest-runner'],
-    tests_require=['pytest', 'pytest-isort', 'pytest-cov', 'coverage', 'isort', 'responses'],
+    tests_require=['pytest', 'pytest-isort', 'pytest-cov', 'coverage', 'isort', 'responses', 'aiohttp'],
     extras_require={
+        'async': ['aiohttp'],
+        'fast': ['orjson'],
+        'compression': ['brotli', 'zstandard'],
+        'columns': ['numpy', 'pandas', 'pyarrow'],
+        'http2': ['httpx[http2]'],
+        'benchmark': ['pytest-benchmark'],
+        'prometheus': ['prometheus_client'],
+        'opentelemetry': ['opentelemetry-api'],
         'deploy': ['twine', 'wheel'],
     },
+    entry_points={
+        'console_scripts': ['gitcoin=gitcoin.cli:main'],
+    },
     project_urls={
         'Bug Reports': 'https://github.com/gitcoinco/python-api-client/issues',
         'Homepage': 'https://gitcoin.co',
@@ -0,0 +1,150 @@
+"""Serve synthetic bounties from a local HTTP server for tests and benchmarks."""
+
+import http.server
+import json
+import socketserver
+import threading
+import time
+import urllib.parse
+
+
+def make_bounties(total):
+    """Create 'total' synthetic bounties with ascending primary keys."""
+    return [{'pk': pk, 'title': 'Bounty {pk}'.format(pk=pk), 'is_open': pk % 2 == 0} for pk in range(1, total + 1)]
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """Handle each request in its own thread."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class StubServer:
+    """Mimic the 'bounties' endpoint, honoring pk__gt, limit and offset.
+
+    - 'latency' seconds are waited before each response is sent.
+    - 'rate_limit' requests per second are served, further requests are
+      answered with 429 and a Retry-After header, counted in 'throttled'.
+    - With 'cache_bodies', encoded bodies are reused, so the server's own
+      JSON encoding does not skew measurements. Leave it off to change
+      'bounties' while serving.
+
+    All requests received are collected in 'requests' as pairs of path and
+    query dict.
+    """
+
+    path = '/api/v0.1/bounties/'
+
+    def __init__(self, bounties, latency=0.0, rate_limit=None, cache_bodies=False):
+        """Serve the given list of bounties once started."""
+        self.bounties = bounties
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.cache_bodies = cache_bodies
+        self.requests = []
+        self.throttled = 0
+        self._bodies = {}
+        self._lock = threading.Lock()
+        self._window = (0, 0)  # Second and number of requests served in it.
+        self._httpd = None
+        self._thread = None
+
+    def __enter__(self):
+        """Start the server when used as context manager."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop the server."""
+        self.stop()
+
+    @property
+    def url(self):
+        """Tell the URL of the bounties endpoint."""
+        host, port = self._httpd.server_address[:2]
+        return 'http://{host}:{port}{path}'.format(host=host, port=port, path=self.path)
+
+    def start(self):
+        """Listen on a free local port in a background thread."""
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Shut the server down."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+
+    def _is_throttled(self, path, query):
+        """Record the request and count it against the rate limit, telling if it exceeds the limit."""
+        with self._lock:
+            self.requests.append((path, query))
+            if self.rate_limit is None:
+                return False
+            second = int(time.monotonic())
+            window, count = self._window
+            count = count + 1 if window == second else 1
+            self._window = (second, count)
+            if count > self.rate_limit:
+                self.throttled += 1
+                return True
+            return False
+
+    def respond(self, path, query):
+        """Return status code, headers and encoded body for one request."""
+        if self._is_throttled(path, query):
+            return 429, {'Retry-After': '1'}, b'{"detail": "Request was throttled."}'
+        key = (path, tuple(sorted(query.items())))
+        body = self._bodies.get(key)
+        if body is None:
+            status, document = self._document(path, query)
+            body = json.dumps(document).encode('utf-8')
+            if status != 200:
+                return status, {}, body
+            if self.cache_bodies:
+                self._bodies[key] = body
+        return 200, {}, body
+
+    def _document(self, path, query):
+        """Select the bounties requested."""
+        if path == self.path:
+            bounties = self.bounties
+            if 'pk__gt' in query:
+                bounties = [bounty for bounty in bounties if bounty['pk'] > int(query['pk__gt'])]
+            offset = int(query.get('offset', 0))
+            limit = int(query.get('limit', len(bounties)))
+            return 200, bounties[offset:offset + limit]
+        if path.startswith(self.path):
+            primary_key = path[len(self.path):]
+            for bounty in self.bounties:
+                if str(bounty['pk']) == primary_key:
+                    return 200, bounty
+        return 404, {'detail': 'Not found.'}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True  # Avoid delayed ACK stalls between headers and body.
+
+            def do_GET(self):
+                url = urllib.parse.urlparse(self.path)
+                query = dict(urllib.parse.parse_qsl(url.query))
+                if server.latency:
+                    time.sleep(server.latency)
+                status, headers, body = server.respond(url.path, query)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+from gitcoin.aio import AsyncGitcoin
+from tests.server import StubServer, make_bounties
+
+aiohttp = pytest.importorskip('aiohttp')
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@pytest.fixture
+def server():
+    with StubServer(make_bounties(7)) as stub:
+        yield stub
+
+
+class TestAsyncGitcoin():
+
+    def test_get_page(self, server):
+
+        async def scenario():
+            async with AsyncGitcoin() as api:
+                api.set_url('bounties', server.url)
+                return await api.bounties.filter(pk__gt=2).get_page(number=2, per_page=2)
+
+        assert run(scenario()) == server.bounties[4:6]
+        assert server.requests[0][1] == {'pk__gt': '2', 'limit': '2', 'offset': '2'}
+
+    def test_all_and_get(self, server):
+
+        async def scenario():
+            async with AsyncGitcoin() as api:
+                api.set_url('bounties', server.url)
+                return await api.bounties.all(), await api.bounties.get(3)
+
+        all_bounties, bounty = run(scenario())
+        assert all_bounties == server.bounties
+        assert bounty == server.bounties[2]
+
+    def test_iter(self, server):
+
+        async def scenario():
+            async with AsyncGitcoin(max_concurrency=1) as api:
+                api.set_url('bounties', server.url)
+                bounties = []
+                async for bounty in api.bounties.iter(per_page=3):
+                    bounties.append(bounty)
+                return bounties
+
+        assert run(scenario()) == server.bounties
+        assert len(server.requests) == 3
+
+    def test_validation(self):
+        api = AsyncGitcoin()
+        with pytest.raises(ValueError):
+            api.bounties.filter(experience_level='Rockstar')
+        with pytest.raises(KeyError):
+            api.bounties.filter(does_not_exist=True)
+
+    def test_raise_for_status(self, server):
+
+        async def scenario():
+            async with AsyncGitcoin() as api:
+                api.set_url('bounties', server.url)
+                await api.bounties.get(404)
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            run(scenario())
@@ -0,0 +1,62 @@
+import responses
+from gitcoin import Gitcoin
+from gitcoin.cache import CacheEntry, MemoryCache, SQLiteCache
+
+
+class TestCache():
+
+    def test_make_key_normalizes_params(self):
+        key = MemoryCache.make_key('https://gitcoin.co/api/v0.1/bounties/', {'offset': '0', 'limit': '25'})
+        assert key == MemoryCache.make_key('https://gitcoin.co/api/v0.1/bounties/', {'limit': '25', 'offset': '0'})
+        assert MemoryCache.make_key('https://gitcoin.co/', {}) == 'https://gitcoin.co/'
+
+    def test_memory_cache_lru(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set('a', CacheEntry(b'1'))
+        cache.set('b', CacheEntry(b'2'))
+        assert cache.get('a').content == b'1'
+        cache.set('c', CacheEntry(b'3'))
+        assert cache.get('b') is None
+        assert len(cache) == 2
+
+    def test_sqlite_cache_survives_restart(self, tmp_path):
+        path = str(tmp_path / 'cache.sqlite')
+        cache = SQLiteCache(path, maxsize=2)
+        cache.set('a', CacheEntry(b'1', etag='"x"'))
+        cache.set('b', CacheEntry(b'2'))
+        cache.get('a')
+        cache.set('c', CacheEntry(b'3'))
+        cache.close()
+        cache = SQLiteCache(path)
+        assert cache.get('a').etag == '"x"'
+        assert cache.get('b') is None
+        assert len(cache) == 2
+
+    @responses.activate
+    def test_endpoint_cache_hit(self):
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', json=[{'pk': 1}], status=200)
+        api = Gitcoin()
+        api.set_cache(MemoryCache(ttl=60))
+        assert api.bounties.filter(is_open=True).get_page() == [{'pk': 1}]
+        assert api.bounties.filter(is_open=True).get_page() == [{'pk': 1}]
+        assert api.bounties.get_page() == [{'pk': 1}]
+        assert len(responses.calls) == 2
+        assert api.cache.stats() == {'hits': 1, 'misses': 2, 'revalidated': 0}
+
+    @responses.activate
+    def test_endpoint_cache_revalidation(self):
+        responses.add(
+            responses.GET,
+            'https://gitcoin.co/api/v0.1/bounties/',
+            json=[{'pk': 1}],
+            status=200,
+            headers={'ETag': '"v1"'}
+        )
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', status=304)
+        api = Gitcoin()
+        api.set_cache(MemoryCache(ttl=0))
+        assert api.bounties.all() == [{'pk': 1}]
+        assert api.bounties.all() == [{'pk': 1}]
+        assert len(responses.calls) == 2
+        assert responses.calls[1].request.headers['If-None-Match'] == '"v1"'
+        assert api.cache.stats() == {'hits': 0, 'misses': 1, 'revalidated': 1}
@@ -0,0 +1,57 @@
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+from gitcoin.cli import main
+from tests.server import StubServer, make_bounties
+
+
+def run(*argv):
+    out = io.StringIO()
+    assert main(list(argv), out=out) == 0
+    return out.getvalue()
+
+
+def test_ndjson():
+    bounties = make_bounties(12)
+    with StubServer(bounties) as server:
+        output = run('bounties', '--url', server.url, '--per-page', '5', '-f', 'pk__gt=3', '-f', 'is_open=true')
+        assert [json.loads(line) for line in output.splitlines()] == bounties[3:]  # The stub ignores is_open.
+        assert [query['offset'] for _, query in server.requests] == ['0', '5']
+        assert all(query == dict(query, pk__gt='3', is_open='True') for _, query in server.requests)
+
+
+def test_csv_with_lookups_and_limit():
+    bounties = make_bounties(30)
+    with StubServer(bounties) as server:
+        output = run(
+            'bounties', '--url', server.url, '--format', 'csv', '--fields', 'title,is_open', '--per-page', '4',
+            '--filter', 'title__endswith=1', '--limit', '2'
+        )
+        assert output.splitlines() == ['pk,title,is_open', '1,Bounty 1,False', '11,Bounty 11,False']
+        assert len(server.requests) == 3
+
+
+def test_errors(capsys):
+    with pytest.raises(SystemExit):
+        main(['bounties', '--filter', 'no_such_field__gt=1'])
+    assert 'Unknown field "no_such_field"' in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        main(['bounties', '--filter', 'is_open=maybe'])
+    with pytest.raises(SystemExit):
+        main(['bounties', '--filter', 'is_open'])
+    with StubServer([]) as server:
+        assert main(['bounties', '--url', server.url + 'missing/'], out=io.StringIO()) == 1
+    assert '404' in capsys.readouterr().err
+
+
+def test_import_is_lazy():
+    if sys.version_info < (3, 7):
+        pytest.skip('Lazy module attributes need Python 3.7.')
+    code = (
+        'import sys, gitcoin.cli; assert "requests" not in sys.modules; '
+        'gitcoin.Gitcoin; assert "requests" in sys.modules'
+    )
+    subprocess.check_call([sys.executable, '-c', code])
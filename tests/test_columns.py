@@ -0,0 +1,99 @@
+import math
+
+import pytest
+import responses
+from gitcoin import Gitcoin
+from gitcoin.columns import DEFAULT_FIELDS, Columns
+from gitcoin.store import BountyStore
+
+BOUNTIES = [
+    {
+        'pk': 1, 'idx_status': 'open', 'value_in_usdt': '12.5', 'is_open': True,
+        'created_on': '2018-01-02T03:04:05Z', 'title': 'One', 'raw_data': {'a': 1},
+    },
+    {
+        'pk': 2, 'idx_status': 'done', 'value_in_usdt': None, 'is_open': False,
+        'created_on': None, 'title': 'Two', 'raw_data': None,
+    },
+    {
+        'pk': 3, 'idx_status': 'open', 'value_in_usdt': 7, 'is_open': None,
+        'created_on': '2018-01-02T03:04:05.000001+00:00', 'title': 'Three', 'raw_data': [],
+    },
+]
+FIELDS = ['pk', 'idx_status', 'value_in_usdt', 'is_open', 'created_on', 'title', 'raw_data']
+
+
+def test_buffers():
+    columns = Columns(FIELDS).extend(BOUNTIES)
+    assert len(columns) == 3
+    assert list(columns.columns['pk'].values) == [1, 2, 3]
+    assert not columns.columns['pk'].nulls
+    codes = columns.columns['idx_status'].codes
+    assert [columns.labels('idx_status')[code] for code in codes] == ['open', 'done', 'open']
+    value = columns.columns['value_in_usdt']
+    assert value.values[0] == 12.5 and math.isnan(value.values[1]) and value.values[2] == 7.0
+    assert list(columns.columns['is_open'].valid) == [1, 1, 0]
+    created_on = columns.columns['created_on']
+    assert created_on.values[2] - created_on.values[0] == 1
+    assert created_on.values[0] == 1514862245000000
+    assert list(created_on.valid) == [1, 0, 1]
+    assert columns.columns['title'].values == ['One', 'Two', 'Three']
+    assert columns.columns['raw_data'].values == [{'a': 1}, None, []]
+
+
+def test_unexpected_enum_values_and_missing_fields():
+    columns = Columns(['idx_status', 'github_comments']).extend([{'idx_status': 'unknown'}, {}])
+    assert columns.labels('idx_status')[columns.columns['idx_status'].codes[0]] == 'unknown'
+    assert columns.columns['idx_status'].codes[1] == -1
+    assert columns.columns['github_comments'].nulls == 2
+
+
+def test_fields():
+    assert Columns().fields == DEFAULT_FIELDS
+    assert 'raw_data' not in DEFAULT_FIELDS and 'pk' in DEFAULT_FIELDS
+    with pytest.raises(ValueError):
+        Columns(['pk', 'no_such_field'])
+
+
+@responses.activate
+def test_endpoint_to_columns():
+    responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', json=BOUNTIES, status=200)
+    bounties = Gitcoin().bounties
+    assert bounties.to_columns().fields == DEFAULT_FIELDS
+    assert bounties.defer('title').to_columns().fields == tuple(name for name in DEFAULT_FIELDS if name != 'title')
+    columns = bounties.only('title', 'raw_data').to_columns()
+    assert columns.fields == ('pk', 'title', 'raw_data')
+    assert columns.columns['raw_data'].values == [{'a': 1}, None, []]
+
+
+def test_store_to_columns():
+    store = BountyStore()
+    store.load(BOUNTIES)
+    columns = store.bounties.filter(idx_status='open').only('value_in_usdt').to_columns()
+    assert len(columns) == 2
+    assert list(columns.columns['value_in_usdt'].values) == [12.5, 7.0]
+
+
+def test_numpy():
+    numpy = pytest.importorskip('numpy')
+    arrays = Columns(FIELDS).extend(BOUNTIES).to_numpy_columns()
+    assert arrays['pk'].tolist() == [1, 2, 3]
+    assert arrays['is_open'].mask.tolist() == [False, False, True]
+    assert numpy.isnat(arrays['created_on'][1])
+    assert arrays['idx_status'].dtype == numpy.intc
+
+
+def test_dataframe():
+    pytest.importorskip('pandas')
+    df = Columns(FIELDS).extend(BOUNTIES).to_dataframe()
+    assert df.groupby('idx_status', observed=True)['value_in_usdt'].sum().to_dict() == {'open': 19.5, 'done': 0.0}
+    assert str(df['created_on'].dt.tz) == 'UTC'
+
+
+def test_arrow():
+    pytest.importorskip('pyarrow')
+    table = Columns(FIELDS).extend(BOUNTIES).to_arrow()
+    assert table.column_names == FIELDS
+    assert table.column('value_in_usdt').to_pylist() == [12.5, None, 7.0]
+    assert table.column('idx_status').to_pylist() == ['open', 'done', 'open']
+    assert table.column('raw_data').to_pylist() == ['{"a":1}', None, '[]']
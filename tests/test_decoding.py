@@ -0,0 +1,90 @@
+import json
+
+import pytest
+import responses
+from gitcoin import Gitcoin
+from gitcoin.decoding import iter_array, loads
+
+DOCUMENT = [
+    {'pk': 1, 'title': 'Brackets ] and [ in "quotes" \\ and, commas', 'raw_data': {'nested': [1, [2, {}]]}},
+    {'pk': 2, 'title': 'Ünïcödé ✓', 'interested': []},
+    3,
+    'four',
+    None,
+]
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestDecoding():
+
+    def test_loads(self):
+        assert loads(b'{"pk": 1}') == {'pk': 1}
+        assert loads('[1]') == [1]
+
+    @pytest.mark.parametrize('size', [1, 2, 3, 7, 64, 100000])
+    def test_iter_array(self, size):
+        data = json.dumps(DOCUMENT, ensure_ascii=False, indent=1).encode('utf-8')
+        assert list(iter_array(chunked(data, size))) == DOCUMENT
+
+    def test_iter_array_is_incremental(self):
+        chunks = iter([b'[{"pk": 1}, {"pk"', b': 2}', b']'])
+        elements = iter_array(chunks)
+        assert next(elements) == {'pk': 1}
+        assert next(chunks) == b': 2}'
+
+    @pytest.mark.parametrize('chunks, expected', [
+        ([b'[1.', b'5]'], [1.5]),
+        ([b'[1', b'.5, 2]'], [1.5, 2]),
+        ([b'[2e', b'3]'], [2000.0]),
+        ([b'[2E', b'+3]'], [2000.0]),
+        ([b'[2e-', b'1]'], [0.2]),
+        ([b'[1, -', b'5]'], [1, -5]),
+        ([b'[1, ', b'-5.', b'25e', b'1 ]'], [1, -52.5]),
+        ([b'[12', b'3', b']'], [123]),
+    ])
+    def test_iter_array_split_numbers(self, chunks, expected):
+        assert list(iter_array(chunks)) == expected
+
+    def test_iter_array_loads(self):
+        decoded = []
+
+        def counting_loads(data):
+            decoded.append(data)
+            return json.loads(data.decode('utf-8'))
+
+        assert list(iter_array([b'[{"pk": 1},', b' 2]'], loads=counting_loads)) == [{'pk': 1}, 2]
+        assert decoded == [b'{"pk": 1}', b'2']
+
+    def test_iter_array_empty(self):
+        assert list(iter_array([b' [ ', b' ] '])) == []
+
+    def test_iter_array_errors(self):
+        with pytest.raises(ValueError):
+            list(iter_array([b'{"detail": "Not found."}']))
+        with pytest.raises(ValueError):
+            list(iter_array([b'[{"pk": 1}, {"pk"']))
+
+    @responses.activate
+    def test_endpoint_stream(self):
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', json=DOCUMENT[:2], status=200)
+        api = Gitcoin()
+        assert list(api.bounties.filter(is_open=True).stream(chunk_size=5)) == DOCUMENT[:2]
+        assert responses.calls[0].request.url == 'https://gitcoin.co/api/v0.1/bounties/?is_open=True'
+
+    @responses.activate
+    def test_set_decoder(self):
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', json=[{'pk': 1}], status=200)
+        decoded = []
+
+        def counting_loads(data):
+            decoded.append(data)
+            return json.loads(data.decode('utf-8'))
+
+        api = Gitcoin()
+        api.set_decoder(counting_loads)
+        assert api.bounties.all() == [{'pk': 1}]
+        assert list(api.bounties.stream()) == [{'pk': 1}]
+        assert len(decoded) == 2
@@ -1,3 +1,6 @@
+import concurrent.futures
+import gzip
+import json
 import urllib.parse
 
 import pytest
@@ -21,6 +24,20 @@ def are_url_queries_equal(url1, url2, *more_urls):
     return True
 
 
+def add_paged_bounties(total, url='https://gitcoin.co/api/v0.1/bounties/'):
+    """Mock a bounties list of 'total' items which honors limit/offset."""
+    bounties = [{'pk': pk} for pk in range(1, total + 1)]
+
+    def callback(request):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+        offset = int(query.get('offset', ['0'])[0])
+        limit = int(query.get('limit', [str(total)])[0])
+        return (200, {}, json.dumps(bounties[offset:offset + limit]))
+
+    responses.add_callback(responses.GET, url, callback=callback, content_type='application/json')
+    return bounties
+
+
 class TestGitcoinDryRun():
 
     def test_are_url_queries_equal(self):
@@ -240,3 +257,177 @@ class TestGitcoinDryRun():
         normal_bounty_config = BountyConfig()
         with pytest.raises(KeyError):
             normal_bounty_config.get('extra_config')
+
+    @responses.activate
+    def test_endpoints_share_session(self):
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', json=[], status=200)
+        api = Gitcoin()
+        first, second = api.bounties, api.bounties
+        assert first.session is second.session
+        assert isinstance(first.session, requests.Session)
+        first.all()
+        second.all()
+        assert len(responses.calls) == 2
+
+    def test_session_adapters(self):
+        api = Gitcoin(pool_maxsize=3)
+        api.set_adapter('https://gitcoin.co/', pool_maxsize=7)
+        assert api.session.get_adapter('https://gitcoin.co/api/')._pool_maxsize == 7
+        assert api.session.get_adapter('https://example.com/')._pool_maxsize == 3
+        api.set_adapter('https://example.com/', pool_maxsize=5)
+        assert api.session.get_adapter('https://example.com/')._pool_maxsize == 5
+
+    @responses.activate
+    def test_compressed_responses(self):
+        body = gzip.compress(json.dumps([{'pk': 1}, {'pk': 2}]).encode('utf-8'))
+        responses.add(
+            responses.GET,
+            'https://gitcoin.co/api/v0.1/bounties/',
+            body=body,
+            status=200,
+            content_type='application/json',
+            headers={'Content-Encoding': 'gzip'}
+        )
+        api = Gitcoin()
+        assert list(api.bounties.stream(chunk_size=8)) == [{'pk': 1}, {'pk': 2}]
+        assert 'gzip' in responses.calls[0].request.headers['Accept-Encoding']
+
+    @responses.activate
+    def test_inject_session_class(self):
+
+        class CountingSession(requests.Session):
+            gets = 0
+
+            def get(self, url, **kwargs):
+                CountingSession.gets += 1
+                return super().get(url, **kwargs)
+
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', json=[], status=200)
+        api = Gitcoin()
+        api.set_class('session', CountingSession)
+        api.bounties.all()
+        assert CountingSession.gets == 1
+
+    def test_session_lifecycle(self):
+        with Gitcoin() as api:
+            session = api.session
+            assert api.session is session
+        assert api._session is None
+        assert api.session is not session
+        api.close()
+
+    @responses.activate
+    def test_iter(self):
+        bounties = add_paged_bounties(7)
+        api = Gitcoin()
+        endpoint = api.bounties.filter(is_open=True)
+        iterator = endpoint.iter(per_page=3)
+        assert next(iterator) == {'pk': 1}
+        assert len(responses.calls) == 1
+        assert list(iterator) == bounties[1:]
+        assert len(responses.calls) == 3
+        assert are_url_queries_equal(
+            responses.calls[2].request.url, 'https://gitcoin.co/api/v0.1/bounties/?is_open=True&offset=6&limit=3'
+        )
+        assert 'limit' not in endpoint.params
+
+    @responses.activate
+    def test_iter_prefetch(self):
+        bounties = add_paged_bounties(6)
+        api = Gitcoin()
+        assert list(api.bounties.iter(per_page=3, prefetch=True)) == bounties
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_fetch_pages(self):
+        bounties = add_paged_bounties(10)
+        api = Gitcoin()
+        assert api.bounties.fetch_pages(range(2, 4), per_page=3, workers=2) == bounties[3:9]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_all_parallel(self):
+        bounties = add_paged_bounties(10)
+        api = Gitcoin()
+        assert api.bounties.all(parallel=2, per_page=3) == bounties
+        # 4 pages hold all bounties, the 5th page was already in flight when the short 4th page arrived.
+        assert len(responses.calls) <= 5
+
+    @responses.activate
+    def test_get_many(self):
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/1', json={'pk': 1}, status=200)
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/2', json={'pk': 2}, status=200)
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/3', json={'detail': 'x'}, status=404)
+        api = Gitcoin()
+        result = api.bounties.get_many([1, 2, 1, 3], concurrency=2)
+        assert result == {1: {'pk': 1}, 2: {'pk': 2}}
+        assert list(result.errors) == [3]
+        assert isinstance(result.errors[3], requests.exceptions.HTTPError)
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_get_many_batched(self):
+        responses.add(
+            responses.GET,
+            'https://gitcoin.co/api/v0.1/bounties/',
+            json=[{'standard_bounties_id': 45}, {'standard_bounties_id': 145}, {'standard_bounties_id': 215}],
+            status=200
+        )
+        api = Gitcoin()
+        result = api.bounties.filter(network='mainnet').get_many([45, 215, 7], key_field='standard_bounties_id')
+        assert result == {45: {'standard_bounties_id': 45}, 215: {'standard_bounties_id': 215}}
+        assert list(result.errors) == [7]
+        assert len(responses.calls) == 1
+        assert are_url_queries_equal(
+            responses.calls[0].request.url,
+            'https://gitcoin.co/api/v0.1/bounties/?network=mainnet&standard_bounties_id=45%2C215%2C7'
+        )
+        with pytest.raises(ValueError):
+            api.bounties.get_many([1], key_field='pk__gt')
+
+    @responses.activate
+    def test_only_and_defer(self):
+        bounty = {'pk': 1, 'title': 'A', 'raw_data': {'id': 1}, 'issue_description': 'Long', 'idx_status': 'open'}
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', json=[bounty], status=200)
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/1', json=bounty, status=200)
+        api = Gitcoin()
+        assert api.bounties.only('title').all() == [{'pk': 1, 'title': 'A'}]
+        deferred = api.bounties.defer('raw_data', 'issue_description')
+        assert deferred.get(1) == {'pk': 1, 'title': 'A', 'idx_status': 'open'}
+        assert api.bounties.only('title', 'raw_data').defer('raw_data').all() == [{'pk': 1, 'title': 'A'}]
+        assert bounty['raw_data'] == {'id': 1}
+        assert are_url_queries_equal(responses.calls[0].request.url, 'https://gitcoin.co/api/v0.1/bounties/')
+        with pytest.raises(ValueError):
+            api.bounties.only('unknown_field')
+        with pytest.raises(ValueError):
+            api.bounties.defer('pk')
+        with pytest.raises(ValueError):
+            api.bounties.defer('standard_bounties_id').get_many([1], key_field='standard_bounties_id')
+
+    @responses.activate
+    def test_only_requested_from_server(self):
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', json=[{'pk': 1}], status=200)
+        api = Gitcoin()
+        bounties = api.bounties
+        bounties.config.fields_param = 'fields'
+        bounties.only('title', 'value_in_usdt').all()
+        assert are_url_queries_equal(
+            responses.calls[0].request.url, 'https://gitcoin.co/api/v0.1/bounties/?fields=pk%2Ctitle%2Cvalue_in_usdt'
+        )
+
+    @responses.activate
+    def test_get_page_leaves_endpoint_untouched(self):
+        add_paged_bounties(10)
+        bounties = Gitcoin().bounties.filter(is_open=True)
+        assert bounties.get_page(number=2, per_page=3) == [{'pk': 4}, {'pk': 5}, {'pk': 6}]
+        assert len(bounties.all()) == 10
+        assert bounties.params == {'is_open': ('True', )}
+
+    @responses.activate
+    def test_shared_base_query_pages_concurrently(self):
+        add_paged_bounties(100)
+        base = Gitcoin().bounties.filter(is_open=True).order_by('pk')
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            pages = list(executor.map(lambda number: base.get_page(number, per_page=10), range(1, 11)))
+        assert [bounty['pk'] for page in pages for bounty in page] == list(range(1, 101))
+        assert base.freeze() == {'is_open': 'True', 'order_by': 'pk'}
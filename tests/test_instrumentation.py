@@ -0,0 +1,85 @@
+import pytest
+import requests.exceptions
+import responses
+from gitcoin import Gitcoin
+from gitcoin.cache import MemoryCache
+from gitcoin.instrumentation import Histogram, HistogramAggregator
+
+URL = 'https://gitcoin.co/api/v0.1/bounties/'
+
+
+class TestInstrumentation():
+
+    @responses.activate
+    def test_events(self):
+        responses.add(responses.GET, URL, json=[{'pk': 1}], status=200)
+        events = []
+        api = Gitcoin()
+        api.add_hook(events.append)
+        api.bounties.filter(is_open=True).get_page()
+        assert len(events) == 1
+        event = events[0]
+        assert event.url == URL
+        assert event.params == {'is_open': 'True', 'limit': '25', 'offset': '0'}
+        assert event.status == 200
+        assert event.bytes == len(b'[{"pk": 1}]')
+        assert event.cache is None and event.retries == 0 and event.error is None
+        assert set(event.phases) == {'server', 'download', 'decode', 'total'}
+
+    @responses.activate
+    def test_streamed_events(self):
+        responses.add(responses.GET, URL, json=[{'pk': 1}, {'pk': 2}], status=200)
+        aggregator = HistogramAggregator()
+        api = Gitcoin()
+        api.add_hook(aggregator)
+        assert len(list(api.bounties.stream())) == 2
+        assert len(api.bounties.watch().poll()) == 2
+        assert len(api.bounties.to_columns()) == 2
+        responses.replace(responses.GET, URL, status=500)
+        with pytest.raises(requests.exceptions.HTTPError):
+            list(api.bounties.stream())
+        summary = aggregator.summary()
+        assert summary['requests'] == 4
+        assert summary['errors'] == 1
+        assert summary['statuses'] == {200: 3, 500: 1}
+        assert summary['bytes'] == 3 * len(b'[{"pk": 1}, {"pk": 2}]')
+        assert set(summary['phases']) == {'server', 'download', 'total'}
+
+    @responses.activate
+    def test_aggregator(self):
+        responses.add(responses.GET, URL, json=[], status=200)
+        responses.add(responses.GET, URL + '1', status=404)
+        aggregator = HistogramAggregator()
+        api = Gitcoin()
+        api.set_cache(MemoryCache())
+        api.add_hook(aggregator)
+        api.bounties.all()
+        api.bounties.all()
+        with pytest.raises(requests.exceptions.HTTPError):
+            api.bounties.get(1)
+        summary = aggregator.summary()
+        assert summary['requests'] == 3
+        assert summary['errors'] == 1
+        assert summary['statuses'] == {200: 1, 404: 1}
+        assert summary['cache'] == {'miss': 1, 'hit': 1}
+        assert summary['phases']['total']['count'] == 3
+        assert summary['phases']['decode']['count'] == 2
+
+    def test_histogram(self):
+        histogram = Histogram(start=1, factor=2, buckets=4)
+        assert histogram.quantile(0.5) is None
+        for value in (0.5, 1.5, 3, 3, 100):
+            histogram.observe(value)
+        assert histogram.quantile(0.5) == 4
+        assert histogram.quantile(1) == float('inf')
+        assert histogram.summary()['mean'] == pytest.approx(21.6)
+
+    def test_prometheus_hook(self):
+        prometheus_client = pytest.importorskip('prometheus_client')
+        from gitcoin.instrumentation import PrometheusHook, RequestEvent
+        registry = prometheus_client.CollectorRegistry()
+        hook = PrometheusHook(registry=registry)
+        event = RequestEvent(URL, {})
+        event.finish()
+        hook(event)
+        assert registry.get_sample_value('gitcoin_client_phase_seconds_count', {'phase': 'total'}) == 1
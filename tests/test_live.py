@@ -56,7 +56,7 @@ class TestGitcoinLiveBounties():
                 bounties = api.bounties
                 for example in examples:
                     filter_kwargs = {filter_name: example}
-                    bounties.filter(**filter_kwargs)
+                    bounties = bounties.filter(**filter_kwargs)
                 result = bounties.get_page(per_page=1)
                 assert_is_list_of_bounties(result)
 
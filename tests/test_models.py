@@ -0,0 +1,70 @@
+import datetime
+import decimal
+
+import pytest
+import responses
+from gitcoin import Gitcoin
+from gitcoin.models import INTERNED_FIELDS, Bounty, parse_datetime
+
+BOUNTY = {
+    'pk': 12,
+    'title': 'Fix it',
+    'web3_created': '2018-06-08T14:59:13.5Z',
+    'value_in_token': '1500000000000000000',
+    'raw_data': {'issuer': '0xabc'},
+    'network': 'mainnet',
+    'unknown_field': 'kept',
+}
+
+
+class TestBountyModel():
+
+    def test_parse_datetime(self):
+        utc = datetime.timezone.utc
+        assert parse_datetime('2018-06-08T14:59:13Z') == datetime.datetime(2018, 6, 8, 14, 59, 13, tzinfo=utc)
+        assert parse_datetime('2018-06-08T16:59:13.123456+02:00') == \
+            datetime.datetime(2018, 6, 8, 14, 59, 13, 123456, tzinfo=utc)
+        assert parse_datetime(None) is None
+
+    def test_lazy_fields(self):
+        bounty = Bounty.from_dict(BOUNTY)
+        assert isinstance(bounty._raw_raw_data, bytes)
+        assert bounty.raw_data == {'issuer': '0xabc'}
+        assert bounty.raw_data is bounty.raw_data
+        assert bounty.value_in_token == decimal.Decimal('1500000000000000000')
+        assert bounty.web3_created.microsecond == 500000
+        assert bounty.unknown_field == 'kept'
+        assert bounty.expires_date is None
+        with pytest.raises(AttributeError):
+            bounty.does_not_exist
+
+    def test_dict_access(self):
+        bounty = Bounty.from_dict(BOUNTY)
+        assert bounty['pk'] == 12
+        assert bounty['unknown_field'] == 'kept'
+        assert bounty.get('expires_date', 'missing') == 'missing'
+        with pytest.raises(KeyError):
+            bounty['expires_date']
+        assert set(bounty.to_dict()) == set(BOUNTY)
+        assert bounty == Bounty.from_dict(BOUNTY)
+
+    def test_null_blobs(self):
+        bounty = Bounty.from_dict({'pk': 1, 'raw_data': None, 'metadata': None})
+        assert bounty.raw_data is None
+        assert bounty.metadata is None
+        assert bounty.to_dict() == {'pk': 1, 'raw_data': None, 'metadata': None}
+
+    def test_interned_fields(self):
+        assert {'token_address', 'override_status', 'idx_status'} <= INTERNED_FIELDS
+        bounty = Bounty.from_dict({'pk': 1, 'token_address': ''.join(['0x', '0' * 40])})
+        assert bounty.token_address is Bounty.from_dict({'pk': 2, 'token_address': '0x' + '0' * 40}).token_address
+
+    @responses.activate
+    def test_endpoint_as_model(self):
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', json=[BOUNTY], status=200)
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/12', json=BOUNTY, status=200)
+        api = Gitcoin()
+        page = api.bounties.as_model().get_page()
+        assert [type(bounty) for bounty in page] == [Bounty]
+        assert api.bounties.as_model().get(12).title == 'Fix it'
+        assert api.bounties.get(12) == BOUNTY
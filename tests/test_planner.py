@@ -0,0 +1,107 @@
+import datetime
+
+import pytest
+from gitcoin import Gitcoin
+from gitcoin.planner import Predicate
+from tests.server import StubServer, make_bounties
+
+
+def make_valued_bounties(total):
+    bounties = make_bounties(total)
+    for bounty in bounties:
+        bounty['value_in_usdt'] = str(bounty['pk'] * 100) if bounty['pk'] % 5 else None
+        bounty['expires_date'] = '2018-01-{day:02}T00:00:00Z'.format(day=bounty['pk'])
+    return bounties
+
+
+def test_predicates():
+    bounty = {'pk': 3, 'title': 'Port to Python', 'value_in_usdt': '250.5', 'expires_date': '2018-01-02T00:00:00Z'}
+    assert Predicate.parse('value_in_usdt__gt', 250).compile()(bounty)
+    assert not Predicate.parse('value_in_usdt__lte', 250).compile()(bounty)
+    assert Predicate.parse('title__icontains', 'python').compile()(bounty)
+    assert not Predicate.parse('title__contains', 'python').compile()(bounty)
+    assert Predicate.parse('pk__in', [1, 3]).compile()(bounty)
+    assert Predicate.parse('pk__range', ['2', '4']).compile()(bounty)
+    assert Predicate.parse('expires_date__lt', datetime.datetime(2018, 1, 3)).compile()(bounty)
+    assert Predicate.parse('expires_date__lt', '2018-01-02T01:00:00+01:00').compile()(bounty) is False
+    assert Predicate.parse('canceled_on__isnull', True).compile()(bounty)
+    assert not Predicate.parse('canceled_on__gt', '2018-01-01T00:00:00Z').compile()(bounty)
+    assert not Predicate.parse('value_in_usdt__gt', 1).compile()({'value_in_usdt': 'n/a'})
+
+
+def test_invalid_predicates():
+    with pytest.raises(ValueError):
+        Predicate.parse('no_such_field__gt', 1)
+    with pytest.raises(ValueError):
+        Predicate.parse('pk__between', 1)
+    with pytest.raises(ValueError):
+        Predicate.parse('pk__range', [1])
+    with pytest.raises(KeyError):
+        Gitcoin().bounties.where(no_such_param='x')
+    with pytest.raises(ValueError):
+        Gitcoin().bounties.where(idx_status='nonsense')
+
+
+def test_pushdown():
+    plan = Gitcoin().bounties.filter(network='mainnet').where(
+        idx_status__in=['open', 'started'],
+        pk__gte=10,
+        value_in_usdt__gt=500,
+        network__icontains='main',
+        bounty_owner_address='0xab',
+        started='alice',
+    )
+    assert plan.endpoint.freeze() == {
+        'network': 'mainnet',
+        'idx_status': 'open,started',
+        'pk__gt': '9',
+        'bounty_owner_address': '0xab',
+        'started': 'alice',
+    }
+    assert [str(predicate) for predicate in plan.residual] == [
+        "value_in_usdt__gt=500", "network__icontains='main'", "bounty_owner_address='0xab'"
+    ]
+    assert plan.explain().splitlines() == [
+        'GET https://gitcoin.co/api/v0.1/bounties/'
+        '?bounty_owner_address=0xab&idx_status=open%2Cstarted&network=mainnet&pk__gt=9&started=alice',
+        'Pushed down:',
+        "  idx_status__in=('open', 'started')",
+        '  pk__gte=10',
+        "  bounty_owner_address='0xab' (rechecked locally)",
+        "  started='alice'",
+        'Filtered locally:',
+        '  value_in_usdt__gt=500',
+        "  network__icontains='main'",
+        "  bounty_owner_address='0xab'",
+        'Paging: 25 per page',
+    ]
+
+
+def test_residual_filter_stops_early():
+    with StubServer(make_valued_bounties(30)) as server:
+        api = Gitcoin()
+        api.set_url('bounties', server.url)
+        plan = api.bounties.only('title').where(value_in_usdt__gte=700, pk__gt=2).limit(3)
+        assert plan.all(per_page=4) == [
+            {'pk': 7, 'title': 'Bounty 7'},
+            {'pk': 8, 'title': 'Bounty 8'},
+            {'pk': 9, 'title': 'Bounty 9'},
+        ]
+        assert [query['offset'] for _, query in server.requests] == ['0', '4']
+        assert all(query['pk__gt'] == '2' for _, query in server.requests)
+
+
+def test_limit_without_residual_shrinks_pages():
+    with StubServer(make_valued_bounties(30)) as server:
+        api = Gitcoin()
+        api.set_url('bounties', server.url)
+        plan = api.bounties.where(pk__gt=20).limit(3)
+        assert 'Paging: 3 per page, stopping after 3 matches' in plan.explain()
+        assert [bounty['pk'] for bounty in plan] == [21, 22, 23]
+        assert len(server.requests) == 1
+
+
+def test_predicate_on_param_set_by_filter_runs_locally():
+    plan = Gitcoin().bounties.filter(pk__gt=5).where(pk__gt=10).limit(2)
+    assert plan.endpoint.freeze() == {'pk__gt': '5'}
+    assert [str(predicate) for predicate in plan.residual] == ['pk__gt=10']
@@ -0,0 +1,121 @@
+import pickle
+
+import pytest
+from gitcoin import Gitcoin
+from gitcoin.cache import Cache
+from gitcoin.query import Query
+from tests.server import StubServer, make_bounties
+
+URL = 'https://gitcoin.co/api/v0.1/bounties/'
+
+
+def test_query_is_immutable_mapping():
+    query = Query(URL, {'network': 'mainnet', 'idx_status': 'open,started'})
+    assert dict(query) == {'network': 'mainnet', 'idx_status': 'open,started'}
+    assert query == {'idx_status': 'open,started', 'network': 'mainnet'}
+    assert query == Query(URL, {'idx_status': 'open,started', 'network': 'mainnet'})
+    assert query != Query(URL + '1', dict(query))
+    assert len({query, Query(URL, dict(query))}) == 1
+    with pytest.raises(TypeError):
+        query['network'] = 'rinkeby'
+
+
+def test_query_encoding():
+    query = Query(URL, {'network': 'mainnet', 'idx_status': 'open,started'})
+    assert query.encoded == 'idx_status=open%2Cstarted&network=mainnet'
+    assert query.key == Cache.make_key(URL, dict(query)) == Cache.make_key(URL, query)
+    assert Query(URL).key == URL
+
+
+def test_query_page_reuses_encoding():
+    query = Query(URL, {'network': 'mainnet'})
+    page = query.page(3, 25)
+    assert page == {'network': 'mainnet', 'limit': '25', 'offset': '50'}
+    assert page.encoded == 'limit=25&network=mainnet&offset=50'
+    assert query.page(3, 25) == page
+    assert page.page(1, 10).encoded == 'limit=10&network=mainnet&offset=0'
+    assert Query(URL).page(1, 10).encoded == 'limit=10&offset=0'
+    query = Query(URL, {'is_open': 'True', 'network': 'main&test', 'order_by': '-pk'})
+    assert query.page(2, 10).encoded == Query(URL, dict(query.page(2, 10))).encoded
+    assert query.page(2, 10).key == Cache.make_key(URL, dict(query.page(2, 10)))
+    assert 'limit' not in query
+
+
+def test_query_replace():
+    query = Query(URL, {'network': 'mainnet', 'pk__gt': '7'})
+    assert query.replace(pk__gt=9, order_by='pk') == {'network': 'mainnet', 'pk__gt': '9', 'order_by': 'pk'}
+    assert query.replace(pk__gt=None) == {'network': 'mainnet'}
+    assert query == {'network': 'mainnet', 'pk__gt': '7'}
+
+
+def test_endpoint_freeze():
+    bounties = Gitcoin().bounties.filter(network='mainnet', idx_status='open')
+    query = bounties.freeze()
+    assert query == Query(URL, {'network': 'mainnet', 'idx_status': 'open'})
+    assert bounties.freeze() is query
+    assert bounties.filter(idx_status='started').freeze() == {'network': 'mainnet', 'idx_status': 'open,started'}
+    assert bounties.freeze() is query
+
+
+def test_query_pickles():
+    query = Query(URL, {'network': 'mainnet'}).page(2, 10)
+    copy = pickle.loads(pickle.dumps(query))
+    assert copy == query
+    assert hash(copy) == hash(query)
+    assert copy.encoded == query.encoded
+
+
+def test_endpoints_are_immutable():
+    base = Gitcoin().bounties.filter(network='mainnet')
+    refined = base.filter(idx_status='open').order_by('pk').only('title').defer('raw_data').as_model()
+    assert base.freeze() == {'network': 'mainnet'}
+    assert base.model is None and base.only_fields is None and not base.deferred_fields
+    assert refined.freeze() == {'network': 'mainnet', 'idx_status': 'open', 'order_by': 'pk'}
+    assert refined.session is base.session
+    assert refined.params['network'] is base.params['network']
+
+
+def test_cursor():
+    query = Query(URL, {'network': 'mainnet', 'order_by': '-pk', 'limit': '5'}).keyset()
+    assert query == {'network': 'mainnet', 'order_by': 'pk'}
+    cursor = query.encode_cursor(42)
+    assert '=' not in cursor and query.decode_cursor(cursor) == 42
+    with pytest.raises(ValueError):
+        Query(URL, {'network': 'rinkeby'}).keyset().decode_cursor(cursor)
+    for invalid in ('', 'not a cursor', query.encode_cursor('42')):
+        with pytest.raises(ValueError):
+            query.decode_cursor(invalid)
+
+
+def test_keyset_pagination():
+    bounties = make_bounties(10)
+    with StubServer(bounties) as server:
+        api = Gitcoin()
+        api.set_url('bounties', server.url)
+        endpoint = api.bounties.filter(network='mainnet').order_by('-web3_created')
+        page = endpoint.page_after(per_page=4)
+        assert page == bounties[:4] and not page.is_last
+        page = endpoint.page_after(page.cursor, per_page=4)
+        assert page == bounties[4:8]
+        server.bounties = make_bounties(12)[1:]  # One removed and two added during the crawl.
+        page = endpoint.page_after(page.cursor, per_page=4)
+        assert [bounty['pk'] for bounty in page] == [9, 10, 11, 12] and not page.is_last
+        last = endpoint.page_after(page.cursor, per_page=4)
+        assert last == [] and last.is_last and last.cursor == page.cursor
+        assert all('offset' not in query for _, query in server.requests)
+        assert server.requests[1][1] == {'network': 'mainnet', 'order_by': 'pk', 'limit': '4', 'pk__gt': '4'}
+
+
+def test_keyset_iterator_resumes():
+    bounties = make_bounties(10)
+    with StubServer(bounties) as server:
+        api = Gitcoin()
+        api.set_url('bounties', server.url)
+        endpoint = api.bounties.filter(pk__gt=2)
+        crawl = endpoint.iter_keyset(per_page=3)
+        assert crawl.cursor is None
+        assert [next(crawl)['pk'] for _ in range(4)] == [3, 4, 5, 6]
+        assert [bounty['pk'] for bounty in endpoint.iter_keyset(crawl.cursor, per_page=3)] == [7, 8, 9, 10]
+        assert [bounty['pk'] for bounty in endpoint.iter_keyset(per_page=5)] == list(range(3, 11))
+        with pytest.raises(ValueError):
+            api.bounties.iter_keyset(crawl.cursor)
@@ -0,0 +1,79 @@
+import pytest
+import requests.exceptions
+import responses
+from gitcoin import Gitcoin
+from gitcoin.scheduler import Scheduler
+
+URL = 'https://gitcoin.co/api/v0.1/bounties/'
+
+
+class FakeTime:
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_api(**kwargs):
+    fake_time = FakeTime()
+    scheduler = Scheduler(clock=fake_time.clock, sleep=fake_time.sleep, **kwargs)
+    api = Gitcoin()
+    api.set_scheduler(scheduler)
+    return api, scheduler, fake_time
+
+
+class TestScheduler():
+
+    @responses.activate
+    def test_retry_after(self):
+        responses.add(responses.GET, URL, status=429, headers={'Retry-After': '3'})
+        responses.add(responses.GET, URL, json=[{'pk': 1}], status=200)
+        api, scheduler, fake_time = make_api(rate=100, max_concurrency=8)
+        assert api.bounties.all() == [{'pk': 1}]
+        assert fake_time.sleeps == [3.0]
+        assert scheduler.retries == 1
+        assert scheduler.throttled == 1
+        assert 4 < scheduler.concurrency < 5
+
+    @responses.activate
+    def test_gives_up_after_max_retries(self):
+        responses.add(responses.GET, URL, status=503)
+        api, scheduler, fake_time = make_api(rate=100, max_retries=2, backoff=1)
+        with pytest.raises(requests.exceptions.HTTPError):
+            api.bounties.all()
+        assert len(responses.calls) == 3
+        assert 0 <= fake_time.sleeps[0] <= 1 and 0 <= fake_time.sleeps[1] <= 2
+        assert scheduler.concurrency == 2
+
+    @responses.activate
+    def test_retries_connection_errors(self):
+        responses.add(responses.GET, URL, body=requests.exceptions.ConnectionError('reset'))
+        responses.add(responses.GET, URL, json=[], status=200)
+        api, scheduler, _ = make_api(rate=100)
+        assert api.bounties.all() == []
+        assert scheduler.retries == 1
+
+    @responses.activate
+    def test_no_retry_on_client_errors(self):
+        responses.add(responses.GET, URL, status=404)
+        api, scheduler, _ = make_api(rate=100)
+        with pytest.raises(requests.exceptions.HTTPError):
+            api.bounties.all()
+        assert len(responses.calls) == 1
+
+    def test_token_bucket(self):
+        fake_time = FakeTime()
+        scheduler = Scheduler(rate=2, burst=1, clock=fake_time.clock, sleep=fake_time.sleep)
+        for _ in range(3):
+            scheduler._take_token()
+        assert fake_time.sleeps == [0.5, 0.5]
+        fake_time.now += 10
+        scheduler._take_token()
+        assert fake_time.sleeps == [0.5, 0.5]
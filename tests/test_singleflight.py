@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+
+import requests
+import responses
+from gitcoin import Gitcoin
+from gitcoin.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestSingleFlight():
+
+    @responses.activate
+    def test_endpoint_collapses_identical_requests(self):
+        responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', json=[{'pk': 1}], status=200)
+        release = threading.Event()
+
+        class SlowSession(requests.Session):
+
+            def get(self, url, **kwargs):
+                release.wait(5)
+                return super().get(url, **kwargs)
+
+        api = Gitcoin()
+        api.set_class('session', SlowSession)
+        api.set_single_flight(SingleFlight())
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(api.bounties.filter(is_open=True).get_page(1)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        while api.single_flight.shared < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert results == [[{'pk': 1}]] * 5
+        assert len(responses.calls) == 1
+        api.bounties.filter(is_open=True).get_page(1)
+        assert len(responses.calls) == 2
+
+    def test_errors_are_shared(self):
+        single_flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        errors = []
+
+        def fail():
+            started.set()
+            release.wait(5)
+            raise ValueError('boom')
+
+        def call():
+            try:
+                single_flight.do('key', fail)
+            except ValueError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=call)
+        follower.start()
+        while single_flight.shared < 1:
+            time.sleep(0.001)
+        release.set()
+        leader.join()
+        follower.join()
+        assert len(errors) == 2 and errors[0] is errors[1]
+
+    def test_async_single_flight(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return [{'pk': 1}]
+
+        async def scenario():
+            return await asyncio.gather(*[single_flight.do('key', fetch) for _ in range(5)])
+
+        results = run(scenario())
+        assert results == [[{'pk': 1}]] * 5
+        assert len(calls) == 1
+        assert single_flight.shared == 4
+
+    def test_async_errors_are_shared(self):
+        single_flight = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError('boom')
+
+        async def scenario():
+            return await asyncio.gather(*[single_flight.do('key', fail) for _ in range(2)], return_exceptions=True)
+
+        results = run(scenario())
+        assert [type(result) for result in results] == [ValueError, ValueError]
@@ -0,0 +1,122 @@
+import json
+import zlib
+
+import pytest
+import responses
+from gitcoin import Gitcoin
+from gitcoin.snapshot import Snapshot, SnapshotWriter, load
+from gitcoin.store import BountyStore
+from tests.server import make_bounties
+
+
+@responses.activate
+def test_dump_and_load(tmpdir):
+    bounties = make_bounties(25)
+    responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', json=bounties, status=200)
+    path = str(tmpdir.join('bounties.jsonl.gz'))
+    assert Gitcoin().bounties.dump(path, chunk_size=10) == 25
+    assert load(path) == bounties
+    with Snapshot(path) as snapshot:
+        assert len(snapshot) == 25
+        assert snapshot.get(17) == bounties[16]
+        with pytest.raises(KeyError):
+            snapshot.get(26)
+        store = BountyStore()
+        assert store.load(snapshot) == 25
+        assert store.bounties.filter(is_open=True).get_page(per_page=3) == [bounties[1], bounties[3], bounties[5]]
+
+
+@responses.activate
+def test_dump_typed_and_projected(tmpdir):
+    bounties = [
+        dict(bounty, created_on='2020-01-0{pk}T00:00:00Z'.format(pk=bounty['pk'])) for bounty in make_bounties(3)
+    ]
+    responses.add(responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', json=bounties, status=200)
+    path = str(tmpdir.join('bounties.jsonl'))
+    assert Gitcoin().bounties.as_model().only('created_on').dump(path, format='jsonl') == 3
+    assert load(path) == [{'pk': bounty['pk'], 'created_on': bounty['created_on']} for bounty in bounties]
+
+
+def test_failed_dump_keeps_snapshot(tmpdir):
+    path = str(tmpdir.join('bounties.jsonl.gz'))
+    with SnapshotWriter(path) as writer:
+        writer.write_many(make_bounties(3))
+
+    def failing():
+        yield from make_bounties(2)
+        raise ConnectionError('Connection reset.')
+
+    for append in (False, True):
+        with pytest.raises(ConnectionError):
+            with SnapshotWriter(path, chunk_size=1, append=append) as writer:
+                writer.write_many(failing())
+        assert load(path) == make_bounties(3)
+    assert tmpdir.listdir() == [tmpdir.join('bounties.jsonl.gz')]
+
+
+@pytest.mark.parametrize('format', ['jsonl', 'jsonl.gz'])
+def test_append_in_place(tmpdir, format):
+    path = str(tmpdir.join('bounties.' + format))
+    with SnapshotWriter(path, format=format) as writer:
+        writer.write_many(make_bounties(3))
+    with open(path, 'rb') as f:
+        original = f.read()
+    with SnapshotWriter(path, format=format, chunk_size=1, append=True) as writer:
+        writer.write_many(make_bounties(5)[3:])
+    with open(path, 'rb') as f:
+        assert f.read().startswith(original)  # Existing frames, index and trailer are left as they are.
+    assert load(path) == make_bounties(5)
+    assert tmpdir.listdir() == [tmpdir.join('bounties.' + format)]
+
+
+def test_interrupted_append(tmpdir):
+    path = str(tmpdir.join('bounties.jsonl.gz'))
+    with SnapshotWriter(path) as writer:
+        writer.write_many(make_bounties(3))
+    writer = SnapshotWriter(path, chunk_size=1, append=True)
+    writer.write_many(make_bounties(5)[3:])
+    writer._file.close()  # As if the process died before the new trailer was written.
+    assert load(path) == make_bounties(3)
+    with SnapshotWriter(path, append=True) as writer:
+        writer.write({'pk': 6, 'title': 'Bounty 6'})
+    assert load(path) == make_bounties(3) + [{'pk': 6, 'title': 'Bounty 6'}]
+
+
+def test_gzip_frames_are_json_lines(tmpdir):
+    path = str(tmpdir.join('bounties.jsonl.gz'))
+    with SnapshotWriter(path, chunk_size=2) as writer:
+        writer.write_many(make_bounties(3))
+    with open(path, 'rb') as f:
+        data = f.read()
+    lines = []
+    while data[:2] == b'\x1f\x8b':  # Decompress gzip members up to the trailer.
+        member = zlib.decompressobj(31)
+        lines.extend(member.decompress(data).splitlines())
+        data = member.unused_data
+    assert [json.loads(line) for line in lines[:3]] == make_bounties(3)
+    assert len(lines) == 4  # The last line holds the index.
+
+
+def test_append(tmpdir):
+    path = str(tmpdir.join('bounties.jsonl'))
+    with SnapshotWriter(path, format='jsonl') as writer:
+        writer.write_many(make_bounties(3))
+    with SnapshotWriter(path, format='jsonl', append=True) as writer:
+        writer.write({'pk': 2, 'title': 'Updated'})
+        writer.write({'pk': 4, 'title': 'Bounty 4'})
+    assert writer.count == 5
+    with Snapshot(path) as snapshot:
+        assert len(snapshot) == 5
+        assert snapshot.get(2) == {'pk': 2, 'title': 'Updated'}
+        assert snapshot.get(4) == {'pk': 4, 'title': 'Bounty 4'}
+    with pytest.raises(ValueError):
+        SnapshotWriter(path, format='jsonl.gz', append=True)
+
+
+def test_errors(tmpdir):
+    path = tmpdir.join('not-a-snapshot.json')
+    path.write('[]')
+    with pytest.raises(ValueError):
+        Snapshot(str(path))
+    with pytest.raises(ValueError):
+        SnapshotWriter(str(tmpdir.join('bounties')), format='csv')
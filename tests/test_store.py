@@ -0,0 +1,115 @@
+import pytest
+from gitcoin import Gitcoin
+from gitcoin.snapshot import load
+from gitcoin.store import BountyStore
+from gitcoin.sync import WatermarkStore
+from tests.server import StubServer, make_bounties
+
+BOUNTIES = [
+    {
+        'pk': 1,
+        'experience_level': 'Beginner',
+        'idx_status': 'open',
+        'is_open': True,
+        'network': 'mainnet',
+        'value_in_usdt': '50.00',
+        'interested': [{'profile': {'handle': 'Alice'}}],
+        'fulfillments': [],
+        'raw_data': {'issuer': '0xabc'},
+    },
+    {
+        'pk': 2,
+        'experience_level': 'Advanced',
+        'idx_status': 'started',
+        'is_open': True,
+        'network': 'rinkeby',
+        'value_in_usdt': '500.00',
+        'interested': [],
+        'fulfillments': [{'fulfiller_github_username': 'bob'}],
+    },
+    {
+        'pk': 3,
+        'experience_level': 'Intermediate',
+        'idx_status': 'done',
+        'is_open': False,
+        'network': 'mainnet',
+        'value_in_usdt': '150.00',
+    },
+]
+
+
+@pytest.fixture
+def store():
+    store = BountyStore()
+    store.load(BOUNTIES)
+    return store
+
+
+class TestBountyStore():
+
+    def pks(self, bounties):
+        return [bounty['pk'] for bounty in bounties]
+
+    def test_filter_and_order(self, store):
+        assert self.pks(store.bounties.filter(is_open=True).all()) == [1, 2]
+        assert self.pks(store.bounties.filter(experience_level='Beginner').filter(experience_level='Advanced').all()) \
+            == [1, 2]
+        assert self.pks(store.bounties.filter(network='main').order_by('-value_in_usdt').all()) == [3, 1]
+        assert self.pks(store.bounties.order_by('value_in_usdt').all()) == [1, 3, 2]  # Numeric, not textual.
+        assert self.pks(store.bounties.filter(pk__gt=1, idx_status='done').all()) == [3]
+        assert self.pks(store.bounties.filter(raw_data='0xABC').all()) == [1]
+        assert self.pks(store.bounties.filter(interested_github_username='alice').all()) == [1]
+        assert self.pks(store.bounties.filter(fulfiller_github_username='bob').all()) == [2]
+
+    def test_pagination_and_get(self, store):
+        assert self.pks(store.bounties.order_by('-pk').get_page(number=2, per_page=2)) == [1]
+        assert self.pks(store.bounties.iter(per_page=2)) == [1, 2, 3]
+        assert store.bounties.get(2) == BOUNTIES[1]
+        with pytest.raises(KeyError):
+            store.bounties.get(4)
+        result = store.bounties.get_many([1, 4])
+        assert list(result) == [1] and list(result.errors) == [4]
+
+    def test_stream(self, store, tmp_path):
+        assert list(store.bounties.filter(network='mainnet').stream()) == [BOUNTIES[0], BOUNTIES[2]]
+        assert [bounty.pk for bounty in store.bounties.as_model().stream()] == [1, 2, 3]
+        path = str(tmp_path / 'bounties.jsonl.gz')
+        assert store.bounties.only('network').dump(path) == 3
+        assert load(path) == [{'pk': bounty['pk'], 'network': bounty['network']} for bounty in BOUNTIES]
+        feed = store.bounties.filter(is_open=True).watch(initial=False)
+        assert feed.poll() == []
+        store.load([{'pk': 3, 'is_open': True}])
+        assert [(event.kind, event.pk) for event in feed.poll()] == [('created', 3)]
+
+    def test_validation(self, store):
+        with pytest.raises(ValueError):
+            store.bounties.order_by('random')
+        with pytest.raises(ValueError):
+            store.query({'order_by': 'random'})
+
+    def test_load_replaces(self, store):
+        store.load([{'pk': 3, 'is_open': True}])
+        assert len(store) == 3
+        assert self.pks(store.bounties.filter(is_open=True).all()) == [1, 2, 3]
+
+    def test_pull_and_sync(self, tmp_path):
+        store = BountyStore(str(tmp_path / 'bounties.sqlite'))
+        watermarks = WatermarkStore(str(tmp_path / 'watermarks.json'))
+        with StubServer(make_bounties(5)) as server:
+            api = Gitcoin()
+            api.set_url('bounties', server.url)
+            assert store.pull(api.bounties, per_page=2) == 5
+            server.bounties.extend(make_bounties(7)[5:])
+            assert store.sync(api.bounties, watermarks) == 7
+            assert store.sync(api.bounties, watermarks) == 0
+        assert len(store) == 7
+
+    def test_pull_and_sync_models(self, tmp_path):
+        store = BountyStore()
+        watermarks = WatermarkStore(str(tmp_path / 'watermarks.json'))
+        with StubServer(make_bounties(5)) as server:
+            api = Gitcoin()
+            api.set_url('bounties', server.url)
+            assert store.pull(api.bounties.as_model().filter(pk__gt=2), per_page=2) == 3
+            assert store.sync(api.bounties.as_model(), watermarks, per_page=2) == 5
+        assert store.bounties.all() == make_bounties(5)
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+import responses
+from gitcoin import Gitcoin
+from gitcoin.sync import ChangeEvent, WatermarkStore
+from tests.server import StubServer, make_bounties
+
+
+class TestIncrementalSync():
+
+    def test_watermark_store(self, tmp_path):
+        path = str(tmp_path / 'watermarks.json')
+        store = WatermarkStore(path)
+        assert store.get('a') == 0
+        store.set('a', 3)
+        assert WatermarkStore(path).get('a') == 3
+        assert [p.name for p in tmp_path.iterdir()] == ['watermarks.json']
+
+    def test_sync_resumes_after_last_committed_page(self, tmp_path):
+        store = WatermarkStore(str(tmp_path / 'watermarks.json'))
+        with StubServer(make_bounties(7)) as server:
+            api = Gitcoin()
+            api.set_url('bounties', server.url)
+            sync = api.bounties.filter(network='mainnet').sync(store, per_page=2)
+            synced = []
+            for page in sync.pages():
+                synced.extend(page)
+                if len(synced) == 4:
+                    break  # Crash while handling the second page.
+            assert sync.watermark == 2
+            assert sync.run(synced.extend) == 5
+            assert [bounty['pk'] for bounty in synced] == [1, 2, 3, 4, 3, 4, 5, 6, 7]
+            assert sync.watermark == 7
+            assert api.bounties.filter(network='mainnet').sync(store).run(synced.extend) == 0
+            assert server.requests[-1][1] == {
+                'network': 'mainnet', 'order_by': 'pk', 'pk__gt': '7', 'limit': '100'
+            }
+            assert api.bounties.filter(network='rinkeby').sync(store).watermark == 0
+
+
+class TestChangeFeed():
+
+    def serve(self, state):
+        """Serve state['bounties'] with an ETag derived from state['version']."""
+
+        def callback(request):
+            etag = '"{version}"'.format(version=state['version'])
+            if request.headers.get('If-None-Match') == etag:
+                return (304, {}, '')
+            body = json.dumps(state['bounties'])
+            if state.get('truncated'):
+                return (200, {}, body[:len(body) // 2])
+            return (200, {'ETag': etag}, body)
+
+        responses.add_callback(
+            responses.GET, 'https://gitcoin.co/api/v0.1/bounties/', callback=callback, content_type='application/json'
+        )
+
+    @responses.activate
+    def test_poll_emits_changes_only(self):
+        state = {'version': 1, 'bounties': make_bounties(3)}
+        self.serve(state)
+        feed = Gitcoin().bounties.filter(is_open=True).watch()
+        assert [event.kind for event in feed.poll()] == ['created'] * 3
+        assert feed.poll() == []
+        assert feed.not_modified == 1
+        assert responses.calls[1].request.headers['If-None-Match'] == '"1"'
+        state['version'] = 2
+        state['bounties'] = make_bounties(4)[1:]
+        state['bounties'][0] = dict(state['bounties'][0], title='Changed')
+        assert feed.poll() == [
+            ChangeEvent('updated', 2, {'pk': 2, 'title': 'Changed', 'is_open': True}),
+            ChangeEvent('created', 4, {'pk': 4, 'title': 'Bounty 4', 'is_open': True}),
+            ChangeEvent('removed', 1, None),
+        ]
+        assert sorted(feed.index) == [2, 3, 4]
+        assert 'is_open=True' in responses.calls[0].request.url
+
+    @responses.activate
+    def test_only_kept_fields_count(self):
+        state = {'version': 1, 'bounties': make_bounties(2)}
+        self.serve(state)
+        feed = Gitcoin().bounties.only('is_open').watch(initial=False)
+        assert feed.poll() == []
+        state['version'] = 2
+        state['bounties'] = [dict(bounty, title='Renamed') for bounty in state['bounties']]
+        state['bounties'][1]['is_open'] = False
+        assert feed.poll() == [ChangeEvent('updated', 2, {'pk': 2, 'is_open': False})]
+
+    @responses.activate
+    def test_failed_poll_keeps_index(self):
+        state = {'version': 1, 'bounties': make_bounties(4)}
+        self.serve(state)
+        feed = Gitcoin().bounties.watch()
+        assert len(feed.poll()) == 4
+        state['version'] = 2
+        state['bounties'][0] = dict(state['bounties'][0], title='Changed')
+        state['truncated'] = True
+        with pytest.raises(ValueError):
+            feed.poll()
+        assert sorted(feed.index) == [1, 2, 3, 4]
+        state['truncated'] = False
+        assert feed.poll() == [ChangeEvent('updated', 1, {'pk': 1, 'title': 'Changed', 'is_open': False})]
+
+    @responses.activate
+    def test_iterate_forever(self):
+        state = {'version': 1, 'bounties': make_bounties(1)}
+        self.serve(state)
+        sleeps = []
+        feed = Gitcoin().bounties.watch(interval=5)
+        feed.sleep = sleeps.append
+        events = iter(feed)
+        assert next(events).kind == 'created'
+        state['version'] = 2
+        state['bounties'] = []
+        assert next(events) == ChangeEvent('removed', 1, None)
+        assert sleeps == [5]
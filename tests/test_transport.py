@@ -0,0 +1,74 @@
+import socket
+
+import pytest
+import requests.exceptions
+from gitcoin import Gitcoin
+from gitcoin.cache import MemoryCache
+from gitcoin.transport import FakeTransport, HTTP2Transport
+from tests.server import StubServer, make_bounties
+
+URL = 'https://gitcoin.co/api/v0.1/bounties/'
+
+
+def fake_api(transport):
+    api = Gitcoin()
+    api.set_class('session', lambda: transport)
+    return api
+
+
+def test_fake_transport():
+    bounties = make_bounties(7)
+    fake = FakeTransport().add(URL, json=bounties).add(URL + '3', json=bounties[2])
+    api = fake_api(fake)
+    assert api.bounties.get_page(number=2, per_page=3) == bounties[3:6]
+    assert api.bounties.filter(network='mainnet').all() == bounties
+    assert list(api.bounties.stream(chunk_size=16)) == bounties
+    assert api.bounties.get(3) == bounties[2]
+    with pytest.raises(requests.exceptions.HTTPError):
+        api.bounties.get(8)
+    assert fake.requests[:2] == [(URL, {'limit': '3', 'offset': '3'}), (URL, {'network': 'mainnet'})]
+    assert fake.headers['Accept-Encoding']
+
+
+def test_fake_transport_with_cache():
+    fake = FakeTransport().add(URL, json=make_bounties(2), headers={'ETag': '"v1"'})
+    api = fake_api(fake)
+    api.set_cache(MemoryCache(ttl=60))
+    assert api.bounties.all() == api.bounties.all()
+    assert len(fake.requests) == 1
+
+
+def test_httpx_transport():
+    pytest.importorskip('httpx')
+    bounties = make_bounties(30)
+    with StubServer(bounties) as server:
+        api = Gitcoin()
+        api.set_class('session', lambda: HTTP2Transport(http2=False))
+        api.set_url('bounties', server.url)
+        with api:
+            assert api.bounties.get_page(number=2, per_page=10) == bounties[10:20]
+            assert api.bounties.fetch_pages(per_page=7, workers=4) == bounties
+            assert list(api.bounties.filter(pk__gt=25).stream(chunk_size=32)) == bounties[25:]
+            assert api.bounties.get_many([3, 31]).errors[31].response.status_code == 404
+
+
+def test_httpx_transport_connection_error():
+    pytest.importorskip('httpx')
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    transport = HTTP2Transport(http2=False)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        transport.get('http://127.0.0.1:{port}/'.format(port=port))
+    transport.close()
+
+
+def test_http2_transport():
+    pytest.importorskip('httpx')
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match=r'gitcoin\[http2\]'):
+            HTTP2Transport()
+    else:
+        HTTP2Transport().close()